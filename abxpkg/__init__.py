@@ -3,6 +3,7 @@ __package__ = "abxpkg"
 from .base_types import (
     BinName,
     InstallArgs,
+    PATHEntries,
     PATHStr,
     HostBinPath,
     HostExistsPath,
@@ -21,6 +22,12 @@ from .logging import (
     configure_logging,
     configure_rich_logging,
     RICH_INSTALLED,
+    ActionTiming,
+    add_timing_callback,
+    remove_timing_callback,
+    record_timings,
+    add_exec_output_callback,
+    remove_exec_output_callback,
 )
 from .exceptions import (
     ABXPkgError,
@@ -44,8 +51,9 @@ from .binprovider import (
     HandlerValue,
     HandlerDict,
     HandlerReturnValue,
+    exec_deadline,
 )
-from .binary import Binary
+from .binary import Binary, load_many, install_many, run_concurrently
 
 from .binprovider_apt import AptProvider
 from .binprovider_brew import BrewProvider
@@ -138,6 +146,10 @@ __all__ = [
     # Main types
     "BinProvider",
     "Binary",
+    "load_many",
+    "install_many",
+    "run_concurrently",
+    "exec_deadline",
     "SemVer",
     "ShallowBinary",
     "logger",
@@ -145,6 +157,12 @@ __all__ = [
     "configure_logging",
     "configure_rich_logging",
     "RICH_INSTALLED",
+    "ActionTiming",
+    "add_timing_callback",
+    "remove_timing_callback",
+    "record_timings",
+    "add_exec_output_callback",
+    "remove_exec_output_callback",
     # Exceptions
     "ABXPkgError",
     "BinaryOperationError",
@@ -156,6 +174,7 @@ __all__ = [
     "BinName",
     "InstallArgs",
     "PATHStr",
+    "PATHEntries",
     "BinDirPath",
     "HostBinPath",
     "HostExistsPath",
@@ -3,10 +3,12 @@ __package__ = "abxpkg"
 import inspect
 import os
 import shutil
+import threading
+import time
 
 from pathlib import Path
 from typing import Any, Annotated
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
 
 from platformdirs import user_config_path
 
@@ -73,10 +75,66 @@ def validate_bin_dir(path: Path) -> Path:
 BinDirPath = Annotated[Path, AfterValidator(validate_bin_dir)]
 
 
-def validate_PATH(PATH: str | list[str]) -> str:
-    paths = PATH.split(":") if isinstance(PATH, str) else list(PATH)
-    assert all(Path(bin_dir) for bin_dir in paths)
-    return ":".join(paths).strip(":")
+class PATHEntries:
+    """An ordered set of ``$PATH`` dirs.
+
+    Membership is an exact O(1) component match (``/usr/bin`` is not "in"
+    ``/usr/bin2``), ``append``/``prepend`` de-duplicate without re-splitting
+    the joined string, and ``str()`` gives back the ``:``-joined form.
+    Layers can be ``:``-joined strings, Paths, other PATHEntries or iterables
+    of those; empty components are dropped.
+    """
+
+    __slots__ = ("_entries",)
+
+    def __init__(self, *layers: "PATHLayer") -> None:
+        self._entries: dict[str, None] = {}
+        self.append(*layers)
+
+    @staticmethod
+    def _split(layers: "tuple[PATHLayer, ...]") -> Iterator[str]:
+        for layer in layers:
+            if layer is None:
+                continue
+            if isinstance(layer, str):
+                yield from (entry for entry in layer.split(":") if entry)
+            elif isinstance(layer, Path):
+                yield str(layer)
+            else:
+                yield from PATHEntries._split(tuple(layer))
+
+    def append(self, *layers: "PATHLayer") -> "PATHEntries":
+        """Add entries at the end, leaving ones already present in place."""
+        for entry in self._split(layers):
+            self._entries.setdefault(entry, None)
+        return self
+
+    def prepend(self, *layers: "PATHLayer") -> "PATHEntries":
+        """Move entries to the front, in the order given."""
+        self._entries = dict.fromkeys([*self._split(layers), *self._entries])
+        return self
+
+    def __contains__(self, entry: object) -> bool:
+        return isinstance(entry, (str, Path)) and str(entry) in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __str__(self) -> str:
+        return ":".join(self._entries)
+
+    def __repr__(self) -> str:
+        return f"PATHEntries({str(self)!r})"
+
+
+PATHLayer = str | Path | PATHEntries | Iterable[str | Path] | None
+
+
+def validate_PATH(PATH: PATHLayer) -> str:
+    return str(PATHEntries(PATH))
 
 
 PATHStr = Annotated[str, BeforeValidator(validate_PATH)]
@@ -196,6 +254,52 @@ HostBinPath = Annotated[
 # not all bins need to be executable to be bins, some are scripts
 
 
+# PATH dir -> (dir mtime_ns, names of its non-directory entries). Shared by
+# every bin_abspath()/bin_abspaths() lookup in the process, so each PATH dir is
+# listed once instead of probed once per (binary, dir) pair.
+_PATH_DIR_ENTRIES: dict[str, tuple[int, frozenset[str]]] = {}
+_PATH_DIR_ENTRIES_LOCK = threading.Lock()
+# Dirs modified this recently are rescanned on every lookup, since a file added
+# within the same mtime tick as our scan would not change the mtime we saw.
+_PATH_DIR_RACY_WINDOW_NS = 2_000_000_000
+
+
+def path_dir_entries(bin_dir: str) -> frozenset[str]:
+    """Names of the non-directory entries in ``bin_dir`` (empty if it is
+    missing or unreadable), rescanned only when the dir's mtime changes."""
+    try:
+        mtime_ns = os.stat(bin_dir).st_mtime_ns
+    except OSError:
+        return frozenset()
+    cached = _PATH_DIR_ENTRIES.get(bin_dir)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    try:
+        with os.scandir(bin_dir) as entries:
+            names = frozenset(
+                entry.name
+                for entry in entries
+                if not entry.is_dir(follow_symlinks=False)
+            )
+    except OSError:
+        return frozenset()
+    if time.time_ns() - mtime_ns > _PATH_DIR_RACY_WINDOW_NS:
+        with _PATH_DIR_ENTRIES_LOCK:
+            _PATH_DIR_ENTRIES[bin_dir] = (mtime_ns, names)
+    return names
+
+
+def _find_in_PATH(bin_name: str, PATH: str, mode: int) -> Iterator[str]:
+    """Yield ``<dir>/<bin_name>`` for every PATH dir holding a file by that
+    name that passes ``os.access(mode)``, in PATH order."""
+    for bin_dir in PATHEntries(PATH):
+        if bin_name not in path_dir_entries(bin_dir):
+            continue
+        candidate = os.path.join(bin_dir, bin_name)
+        if os.path.isfile(candidate) and os.access(candidate, mode):
+            yield candidate
+
+
 # @validate_call
 def bin_abspath(
     bin_path_or_name: str | BinName | Path,
@@ -212,30 +316,23 @@ def bin_abspath(
     if str(bin_path_or_name).startswith("/"):
         # already a path, get its absolute form
         abspath = Path(bin_path_or_name).expanduser().absolute()
-    else:
-        # not a path yet, get path using shutil.which
+    elif "/" in str(bin_path_or_name):
+        # relative path, shutil.which resolves it against the cwd
         binpath = shutil.which(bin_path_or_name, mode=os.X_OK, path=PATH)
-        # print(bin_path_or_name, PATH.split(':'), binpath, 'GOPINGNGN')
         if not binpath:
-            # some bins dont show up with shutil.which (e.g. django-admin.py)
-            for path in PATH.split(":"):
-                bin_dir = Path(path)
-                # print('BIN_DIR', bin_dir, bin_dir.is_dir())
-                if not (os.path.isdir(bin_dir) and os.access(bin_dir, os.R_OK)):
-                    # raise Exception(f'Found invalid dir in $PATH: {bin_dir}')
-                    continue
-                bin_file = bin_dir / bin_path_or_name
-                # print(bin_file, path, bin_file.exists(), bin_file.is_file(), bin_file.is_symlink())
-                if os.path.isfile(bin_file) and os.access(bin_file, os.R_OK):
-                    return bin_file
-
-            return None
-        # print(binpath, PATH)
-        if str(Path(binpath).parent) not in PATH:
-            # print('WARNING, found bin but not in PATH', binpath, PATH)
-            # found bin but it was outside our search $PATH
             return None
         abspath = Path(binpath).expanduser().absolute()
+    else:
+        # not a path yet, look it up in the PATH dir index
+        binpath = next(_find_in_PATH(str(bin_path_or_name), PATH, os.X_OK), None)
+        if not binpath:
+            # some bins are not executable but still runnable (e.g. django-admin.py)
+            bin_file = next(
+                _find_in_PATH(str(bin_path_or_name), PATH, os.R_OK),
+                None,
+            )
+            return Path(bin_file) if bin_file else None
+        abspath = Path(binpath).expanduser().absolute()
 
     try:
         return TypeAdapter(HostBinPath).validate_python(abspath)
@@ -257,11 +354,8 @@ def bin_abspaths(
         # already a path, get its absolute form
         abspaths.append(Path(bin_path_or_name).expanduser().absolute())
     else:
-        # not a path yet, get path using shutil.which
-        for path in PATH.split(":"):
-            binpath = shutil.which(bin_path_or_name, mode=os.X_OK, path=path)
-            if binpath and str(Path(binpath).parent) in PATH:
-                abspaths.append(binpath)
+        # not a path yet, collect every match from the PATH dir index
+        abspaths.extend(_find_in_PATH(str(bin_path_or_name), PATH, os.X_OK))
 
     try:
         return TypeAdapter(list[HostBinPath]).validate_python(abspaths)
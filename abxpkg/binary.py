@@ -1,6 +1,11 @@
 __package__ = "abxpkg"
 
-from typing import Any
+import contextvars
+import functools
+from contextlib import ExitStack, contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, Literal, TypeVar
 from typing import Self
 
 from pydantic import (
@@ -16,7 +21,15 @@ from pydantic import (
 
 from .semver import SemVer
 from .shallowbinary import ShallowBinary
-from .binprovider import BinProvider, EnvProvider, BinaryOverrides
+from .binprovider import (
+    BinProvider,
+    EnvProvider,
+    BinaryOverrides,
+    env_float,
+    env_int,
+    exec_deadline,
+    run_with_async_exec,
+)
 from .logging import (
     format_exception_with_output,
     format_raised_exception,
@@ -253,6 +266,9 @@ class Binary(ShallowBinary):
         self,
         binproviders: list[BinProviderName] | None = None,
     ) -> list[BinProvider]:
+        """Selected providers in declared order, except that ones with a cached
+        record for this binary (an index lookup + stat, no subprocess) go first,
+        so warm load/install/update/uninstall calls never probe earlier misses."""
         selected_providers: list[BinProvider] = []
         for binprovider in self.binproviders:
             if binproviders and binprovider.name not in binproviders:
@@ -275,12 +291,7 @@ class Binary(ShallowBinary):
     def _validated_loaded_copy(
         self,
         provider: BinProvider,
-        *,
-        abspath: HostBinPath | None,
-        version: SemVer | None,
-        sha256: str | None,
-        mtime: int | None,
-        euid: int | None,
+        loaded: ShallowBinary,
     ) -> Self:
         """Return a loaded copy and enforce the Binary-level min_version gate.
 
@@ -292,19 +303,31 @@ class Binary(ShallowBinary):
             deep=True,
             update={
                 "loaded_binprovider": provider,
-                "loaded_abspath": abspath,
-                "loaded_version": version,
-                "loaded_sha256": sha256,
-                "loaded_mtime": mtime,
-                "loaded_euid": euid,
+                "loaded_abspath": loaded.loaded_abspath,
+                "loaded_version": loaded.loaded_version,
+                "loaded_mtime": loaded.loaded_mtime,
+                "loaded_euid": loaded.loaded_euid,
             },
         )
+        if loaded.sha256_deferred:
+            result.defer_sha256()
+        else:
+            result.loaded_sha256 = loaded.loaded_sha256
+            result._sha256_deferred = False
         if not result.is_valid:
             raise ValueError(
                 f"{provider.name} resolved {self.name} with version {result.loaded_version} which does not satisfy min_version {self.min_version}",
             )
         return result
 
+    @contextmanager
+    def cache_batch(self) -> Iterator[None]:
+        """Batch derived.env cache writes for all of this binary's providers."""
+        with ExitStack() as cache_batches:
+            for binprovider in self.binproviders:
+                cache_batches.enter_context(binprovider.cache_batch())
+            yield
+
     @validate_call
     @log_method_call(include_result=True)
     def install(
@@ -343,49 +366,45 @@ class Binary(ShallowBinary):
         binary_min_release_age = (
             self.min_release_age if min_release_age is None else min_release_age
         )
-        for binprovider in self.binproviders:
-            if binproviders and (binprovider.name not in binproviders):
-                continue
-
-            provider = binprovider
-            try:
-                provider = self.get_binprovider(
-                    binprovider_name=binprovider.name,
-                    dry_run=dry_run,
-                    **extra_overrides,
-                )
-                resolved_postinstall_scripts = (
-                    provider.postinstall_scripts
-                    if binary_postinstall_scripts is None
-                    else binary_postinstall_scripts
-                )
-                resolved_min_release_age = (
-                    provider.min_release_age
-                    if binary_min_release_age is None
-                    else binary_min_release_age
-                )
-                installed_bin = provider.install(
-                    self.name,
-                    no_cache=no_cache,
-                    dry_run=dry_run,
-                    postinstall_scripts=resolved_postinstall_scripts,
-                    min_release_age=resolved_min_release_age,
-                    min_version=self.min_version,
-                )
-                if installed_bin is not None and installed_bin.loaded_abspath:
-                    # print('INSTALLED', self.name, installed_bin)
-                    return self._validated_loaded_copy(
-                        provider,
-                        abspath=installed_bin.loaded_abspath,
-                        version=installed_bin.loaded_version,
-                        sha256=installed_bin.loaded_sha256,
-                        mtime=installed_bin.loaded_mtime,
-                        euid=installed_bin.loaded_euid,
+        # buffer derived.env cache writes from every provider tried below and
+        # flush them once at the end instead of once per probe/install step
+        with self.cache_batch():
+            for binprovider in self._binprovider_order(binproviders):
+                provider = binprovider
+                try:
+                    provider = self.get_binprovider(
+                        binprovider_name=binprovider.name,
+                        dry_run=dry_run,
+                        **extra_overrides,
                     )
-            except Exception as err:
-                inner_exc = err
-                errors[binprovider.name] = format_exception_with_output(err)
-                self._debug_provider_failure("install", provider, err)
+                    resolved_postinstall_scripts = (
+                        provider.postinstall_scripts
+                        if binary_postinstall_scripts is None
+                        else binary_postinstall_scripts
+                    )
+                    resolved_min_release_age = (
+                        provider.min_release_age
+                        if binary_min_release_age is None
+                        else binary_min_release_age
+                    )
+                    installed_bin = provider.install(
+                        self.name,
+                        no_cache=no_cache,
+                        dry_run=dry_run,
+                        postinstall_scripts=resolved_postinstall_scripts,
+                        min_release_age=resolved_min_release_age,
+                        min_version=self.min_version,
+                    )
+                    if installed_bin is not None and installed_bin.loaded_abspath:
+                        # print('INSTALLED', self.name, installed_bin)
+                        return self._validated_loaded_copy(
+                            provider,
+                            installed_bin,
+                        )
+                except Exception as err:
+                    inner_exc = err
+                    errors[binprovider.name] = format_exception_with_output(err)
+                    self._debug_provider_failure("install", provider, err)
 
         provider_names = ", ".join(
             binproviders or [p.name for p in self.binproviders],
@@ -418,26 +437,21 @@ class Binary(ShallowBinary):
         # logger.info("Loading %s binary", self.name)
         inner_exc: Exception | None = None
         errors = {}
-        for binprovider in self.binproviders:
-            if binproviders and binprovider.name not in binproviders:
-                continue
-
+        for binprovider in self._binprovider_order(binproviders):
             provider = binprovider
             try:
                 provider = self.get_binprovider(
                     binprovider_name=binprovider.name,
                     **extra_overrides,
                 )
-                installed_bin = provider.load(self.name, no_cache=no_cache)
+                installed_bin = (
+                    None if no_cache else provider.load_cached(self.name)
+                ) or provider.load(self.name, no_cache=no_cache)
                 if installed_bin is not None and installed_bin.loaded_abspath:
                     # print('LOADED', binprovider, self.name, installed_bin)
                     return self._validated_loaded_copy(
                         provider,
-                        abspath=installed_bin.loaded_abspath,
-                        version=installed_bin.loaded_version,
-                        sha256=installed_bin.loaded_sha256,
-                        mtime=installed_bin.loaded_mtime,
-                        euid=installed_bin.loaded_euid,
+                        installed_bin,
                     )
                 else:
                     continue
@@ -511,11 +525,7 @@ class Binary(ShallowBinary):
                 if updated_bin is not None and updated_bin.loaded_abspath:
                     return self._validated_loaded_copy(
                         provider,
-                        abspath=updated_bin.loaded_abspath,
-                        version=updated_bin.loaded_version,
-                        sha256=updated_bin.loaded_sha256,
-                        mtime=updated_bin.loaded_mtime,
-                        euid=updated_bin.loaded_euid,
+                        updated_bin,
                     )
             except Exception as err:
                 inner_exc = err
@@ -620,3 +630,328 @@ class Binary(ShallowBinary):
             binproviders or [p.name for p in self.binproviders],
         )
         raise BinaryUninstallError(self.name, provider_names, errors) from inner_exc
+
+    # Async variants: same provider order and override resolution as the sync
+    # methods, but awaiting them doesn't block the event loop, and cancelling
+    # the awaiting task (or exceeding ``timeout`` seconds) kills the running
+    # installer subprocess. See run_with_async_exec().
+
+    async def aload(
+        self, *args: Any, timeout: float | None = None, **kwargs: Any
+    ) -> Self:
+        return await run_with_async_exec(self.load, *args, timeout=timeout, **kwargs)
+
+    async def ainstall(
+        self, *args: Any, timeout: float | None = None, **kwargs: Any
+    ) -> Self:
+        return await run_with_async_exec(self.install, *args, timeout=timeout, **kwargs)
+
+    async def aupdate(
+        self, *args: Any, timeout: float | None = None, **kwargs: Any
+    ) -> Self:
+        return await run_with_async_exec(self.update, *args, timeout=timeout, **kwargs)
+
+    async def auninstall(
+        self, *args: Any, timeout: float | None = None, **kwargs: Any
+    ) -> Self:
+        return await run_with_async_exec(
+            self.uninstall, *args, timeout=timeout, **kwargs
+        )
+
+
+BinaryT = TypeVar("BinaryT", bound=Binary)
+R = TypeVar("R")
+
+
+def probe_max_workers() -> int:
+    """Default worker limit for load_many() and other batches of version/abspath
+    probes, so a long list of names doesn't fork dozens of probes at once
+    (ABXPKG_PROBE_WORKERS, default 8)."""
+    return max(env_int("ABXPKG_PROBE_WORKERS", 8), 1)
+
+
+def probe_deadline() -> float | None:
+    """Default deadline in seconds for the CLI's whole probe batch
+    (ABXPKG_PROBE_DEADLINE, unset: none)."""
+    return env_float("ABXPKG_PROBE_DEADLINE")
+
+
+def run_concurrently(
+    calls: Iterable[Callable[[], R]],
+    max_workers: int | None = None,
+    timeout: float | None = None,
+    thread_name_prefix: str = "abxpkg",
+    on_done: Callable[[int, R | Exception], None] | None = None,
+) -> list[R | Exception]:
+    """Run independent calls on up to ``max_workers`` threads, returning each
+    call's result (or the Exception it raised) in input order.
+
+    ``timeout`` is a deadline in seconds for the whole batch: subprocesses
+    still running when it passes are killed and later ones fail immediately
+    (see exec_deadline()), so the batch returns in bounded time.
+    ``on_done(index, outcome)`` is called on the calling thread as each call
+    finishes, e.g. to print results in completion order.
+    """
+    calls = list(calls)
+    if not calls:
+        return []
+
+    results: list[R | Exception] = [None] * len(calls)  # type: ignore[list-item]
+    with (
+        exec_deadline(timeout),
+        ThreadPoolExecutor(
+            max_workers=min(max_workers or len(calls), len(calls)),
+            thread_name_prefix=thread_name_prefix,
+        ) as executor,
+    ):
+        # run each call in a copy of the caller's context so logging trace
+        # depth / exec log prefixes / the deadline behave the same as a
+        # sequential call
+        futures = {
+            executor.submit(contextvars.copy_context().run, call): idx
+            for idx, call in enumerate(calls)
+        }
+        for future in as_completed(futures):
+            idx = futures[future]
+            try:
+                results[idx] = future.result()
+            except Exception as err:
+                results[idx] = err
+            if on_done is not None:
+                on_done(idx, results[idx])
+    return results
+
+
+def _run_many(
+    action: Literal["load", "install"],
+    binaries: Iterable[BinaryT],
+    max_workers: int | None = None,
+    quiet: bool = False,
+    timeout: float | None = None,
+    on_done: Callable[[int, BinaryT | Exception], None] | None = None,
+    **kwargs: Any,
+) -> list[BinaryT]:
+    binaries = list(binaries)
+    outcomes = run_concurrently(
+        (functools.partial(getattr(binary, action), **kwargs) for binary in binaries),
+        max_workers=max_workers,
+        timeout=timeout,
+        thread_name_prefix=f"abxpkg-{action}",
+        on_done=on_done,
+    )
+    errors = [outcome for outcome in outcomes if isinstance(outcome, Exception)]
+    if errors and not quiet:
+        raise errors[0]
+    return [
+        binary if isinstance(outcome, Exception) else outcome
+        for binary, outcome in zip(binaries, outcomes)
+    ]
+
+
+def load_many(
+    binaries: Iterable[BinaryT],
+    max_workers: int | None = None,
+    quiet: bool = False,
+    timeout: float | None = None,
+    on_done: Callable[[int, BinaryT | Exception], None] | None = None,
+    **kwargs: Any,
+) -> list[BinaryT]:
+    """Load many independent binaries concurrently, returning them in input order.
+
+    Each binary still walks its own binproviders in order, but the per-binary
+    subprocess probes overlap. With ``quiet=True``, binaries that fail to load
+    are returned unchanged instead of raising the first error. ``timeout``
+    bounds the whole batch in seconds (probes still running are killed), so
+    e.g. a health check gets an answer even if some binaries hang.
+    ``max_workers`` defaults to probe_max_workers().
+    """
+    return _run_many(
+        "load",
+        binaries,
+        max_workers=probe_max_workers() if max_workers is None else max_workers,
+        quiet=quiet,
+        timeout=timeout,
+        on_done=on_done,
+        **kwargs,
+    )
+
+
+def _install_batched(
+    binaries: list[BinaryT],
+    on_done: Callable[[int, BinaryT | Exception], None] | None = None,
+    no_cache: bool = False,
+    dry_run: bool | None = None,
+    postinstall_scripts: bool | None = None,
+    min_release_age: float | None = None,
+    **extra_overrides: Any,
+) -> tuple[dict[int, BinaryT], dict[int, int], dict[int, dict[str, str]]]:
+    """Install the binaries that share provider instances together, one
+    BinProvider.install_many() call per batch-capable provider in declared
+    order, so they merge into a single installer invocation.
+
+    Returns ({index: installed binary}, {index: number of leading providers
+    the batch already tried}, {index: {provider name: error}}) so the
+    one-by-one install can carry on from the next provider.
+    """
+    installed: dict[int, BinaryT] = {}
+    tried: dict[int, int] = {}
+    errors: dict[int, dict[str, str]] = {}
+
+    def finish(idx: int, provider: BinProvider, loaded: ShallowBinary) -> None:
+        installed[idx] = binaries[idx]._validated_loaded_copy(provider, loaded)
+        if on_done is not None:
+            on_done(idx, installed[idx])
+
+    if extra_overrides or dry_run or len(binaries) < 2:
+        return installed, tried, errors
+
+    groups: dict[tuple[Any, ...], list[int]] = {}
+    for idx, binary in enumerate(binaries):
+        if binary.is_valid and not no_cache:
+            continue
+        if not no_cache:
+            # warm binaries go straight to the provider that cached them, same
+            # as Binary.install()'s cached-first provider order
+            for binprovider in binary.binproviders:
+                try:
+                    provider_view = binary.get_binprovider(binprovider.name)
+                    cached = provider_view.load_cached(binary.name)
+                    if cached is not None:
+                        finish(idx, provider_view, cached)
+                        break
+                except (KeyError, ValueError):
+                    continue
+            if idx in installed:
+                continue
+        group_key = (
+            tuple(id(binprovider) for binprovider in binary.binproviders),
+            binary.min_version,
+            binary.postinstall_scripts
+            if postinstall_scripts is None
+            else postinstall_scripts,
+            binary.min_release_age if min_release_age is None else min_release_age,
+        )
+        groups.setdefault(group_key, []).append(idx)
+
+    for group_key, indices in groups.items():
+        _, min_version, group_postinstall_scripts, group_min_release_age = group_key
+        for position, provider in enumerate(binaries[indices[0]].binproviders):
+            pending = [idx for idx in indices if idx not in installed]
+            # only batch-capable providers merge installs, and per-binary
+            # overrides need their own provider view: from here on the rest
+            # install one by one, starting at this provider
+            if (
+                len(pending) < 2
+                or not provider.supports_batch_install()
+                or any(binaries[idx].overrides.get(provider.name) for idx in pending)
+            ):
+                break
+            outcomes = provider.install_many(
+                [binaries[idx].name for idx in pending],
+                quiet=True,
+                no_cache=no_cache,
+                postinstall_scripts=group_postinstall_scripts,
+                min_release_age=group_min_release_age,
+                min_version=min_version,
+                return_exceptions=True,
+            )
+            for idx, outcome in zip(pending, outcomes):
+                tried[idx] = position + 1
+                err: Exception | None = None
+                if isinstance(outcome, Exception):
+                    err = outcome
+                elif outcome is not None and outcome.loaded_abspath:
+                    try:
+                        # same per-binary override view Binary.install() returns
+                        finish(
+                            idx,
+                            binaries[idx].get_binprovider(provider.name),
+                            outcome,
+                        )
+                    except ValueError as invalid:
+                        err = invalid
+                if err is not None:
+                    errors.setdefault(idx, {})[provider.name] = (
+                        format_exception_with_output(err)
+                    )
+                    binaries[idx]._debug_provider_failure("install", provider, err)
+    return installed, tried, errors
+
+
+def _install_remaining(
+    binary: BinaryT,
+    tried: int,
+    batch_errors: dict[str, str],
+    **kwargs: Any,
+) -> BinaryT:
+    """Binary.install() on the providers after the first ``tried`` ones,
+    reporting the batch's per-provider errors alongside its own."""
+    remaining = [binprovider.name for binprovider in binary.binproviders[tried:]]
+    provider_names = ", ".join(p.name for p in binary.binproviders)
+    if not remaining:
+        raise BinaryInstallError(binary.name, provider_names, batch_errors)
+    try:
+        return binary.install(binproviders=remaining, **kwargs)
+    except BinaryInstallError as err:
+        raise BinaryInstallError(
+            binary.name,
+            provider_names,
+            {**batch_errors, **err.errors},
+        ) from err.__cause__
+
+
+def install_many(
+    binaries: Iterable[BinaryT],
+    max_workers: int | None = None,
+    quiet: bool = False,
+    on_done: Callable[[int, BinaryT | Exception], None] | None = None,
+    **kwargs: Any,
+) -> list[BinaryT]:
+    """Install many independent binaries, returning them in input order.
+
+    Binaries built with the same provider instances (e.g. by the CLI) are
+    first installed together via BinProvider.install_many() on each
+    batch-capable provider in turn, so e.g. ``npm install a b c`` runs once
+    instead of three times. The rest install concurrently one binary at a
+    time, picking up after the providers their batch already tried, with
+    installer mutations serialized per provider install_root (see
+    ``BinProvider._install_lock``).
+    """
+    binaries = list(binaries)
+    results = list(binaries)
+    batch_installed, tried, batch_errors = _install_batched(
+        binaries,
+        on_done=on_done,
+        **kwargs,
+    )
+    for idx, installed in batch_installed.items():
+        results[idx] = installed
+    pending = [idx for idx in range(len(binaries)) if idx not in batch_installed]
+    outcomes = run_concurrently(
+        (
+            functools.partial(
+                _install_remaining,
+                binaries[idx],
+                tried[idx],
+                batch_errors.get(idx, {}),
+                **kwargs,
+            )
+            if idx in tried
+            else functools.partial(binaries[idx].install, **kwargs)
+            for idx in pending
+        ),
+        max_workers=max_workers,
+        thread_name_prefix="abxpkg-install",
+        on_done=(
+            None
+            if on_done is None
+            else lambda idx, outcome: on_done(pending[idx], outcome)
+        ),
+    )
+    errors = [outcome for outcome in outcomes if isinstance(outcome, Exception)]
+    if errors and not quiet:
+        raise errors[0]
+    for idx, outcome in zip(pending, outcomes):
+        if not isinstance(outcome, Exception):
+            results[idx] = outcome
+    return results
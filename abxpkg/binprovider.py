@@ -2,6 +2,11 @@ __package__ = "abxpkg"
 
 import logging as py_logging
 import os
+import asyncio
+import collections
+import contextvars
+import concurrent.futures
+import locale
 import sys
 import pwd
 import json
@@ -13,6 +18,9 @@ import platform
 import subprocess
 import functools
 import tempfile
+import threading
+import time
+from contextlib import ExitStack, contextmanager, suppress
 from contextvars import ContextVar
 
 from typing import (
@@ -25,12 +33,13 @@ from typing import (
     runtime_checkable,
     TypeVar,
 )
-from collections.abc import Callable, Iterable, Mapping
+from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping
 
 from typing_extensions import TypedDict
 from typing import Self
 from pathlib import Path
 
+from platformdirs import user_cache_path
 from pydantic_core import ValidationError
 from pydantic import (
     BaseModel,
@@ -39,7 +48,10 @@ from pydantic import (
     validate_call,
     ConfigDict,
     InstanceOf,
+    PrivateAttr,
+    SerializerFunctionWrapHandler,
     computed_field,
+    model_serializer,
     model_validator,
 )
 
@@ -50,6 +62,7 @@ from .base_types import (
     BinDirPath,
     HostBinPath,
     BinProviderName,
+    PATHEntries,
     PATHStr,
     InstallArgs,
     Sha256,
@@ -68,7 +81,11 @@ from .base_types import (
     func_takes_args_or_kwargs,
 )
 from .logging import (
+    TIMED_ACTIONS,
     TRACE_DEPTH,
+    count_subprocess,
+    emit_cache_hit,
+    emit_exec_output_line,
     format_command,
     format_loaded_binary,
     format_subprocess_output,
@@ -76,7 +93,10 @@ from .logging import (
     log_with_trace_depth,
     log_subprocess_output,
     log_method_call,
+    mark_cache_hit,
+    pending_cache_miss,
     summarize_value,
+    timed_method,
 )
 from .exceptions import (
     BinProviderInstallError,
@@ -87,8 +107,13 @@ from .exceptions import (
 from .config import (
     apply_exec_env,
     build_exec_env,
+    delete_derived_cache_records,
+    derived_cache_batch,
+    exclusive_file_lock,
     load_derived_cache,
-    save_derived_cache,
+    load_derived_cache_record,
+    load_derived_cache_records,
+    upsert_derived_cache_record,
 )
 
 logger = get_logger(__name__)
@@ -100,9 +125,19 @@ DEFAULT_PATH = "/home/linuxbrew/.linuxbrew/bin:/opt/homebrew/bin:/usr/local/sbin
 DEFAULT_ENV_PATH = os.environ.get("PATH", DEFAULT_PATH)
 PYTHON_BIN_DIR = str(Path(sys.executable).parent)
 
-if PYTHON_BIN_DIR not in DEFAULT_ENV_PATH:
+if PYTHON_BIN_DIR not in PATHEntries(DEFAULT_ENV_PATH):
     DEFAULT_ENV_PATH = PYTHON_BIN_DIR + ":" + DEFAULT_ENV_PATH
 
+# Opt-in (ABXPKG_PROBE_CACHE=1) user-level cache of version/sha256 probe results,
+# keyed by binary abspath and validated against its (inode, size, mtime_ns).
+PROBE_CACHE_PATH = (
+    user_cache_path(
+        appname="abxpkg",
+        appauthor="abxpkg",
+    )
+    / "probes.env"
+)
+
 UNKNOWN_ABSPATH = Path("/usr/bin/true")
 UNKNOWN_VERSION = cast(SemVer, SemVer.parse("999.999.999"))
 ACTIVE_EXEC_LOG_PREFIX: ContextVar[str | None] = ContextVar(
@@ -115,6 +150,67 @@ def env_flag_is_true(name: str) -> bool:
     return os.getenv(name, "").strip().lower() in {"1", "true", "yes", "on"}
 
 
+def env_int(name: str, default: int) -> int:
+    """Read an int setting from the environment, ``default`` if unset or malformed."""
+    try:
+        return int(os.environ.get(name, "").strip() or default)
+    except ValueError:
+        return default
+
+
+def env_float(name: str, default: float | None = None) -> float | None:
+    """Read a float setting from the environment, ``default`` if unset or malformed."""
+    try:
+        return float(os.environ.get(name, "").strip() or 0) or default
+    except ValueError:
+        return default
+
+
+class InstallLock:
+    """Re-entrant lock serializing installer mutations for one install_root.
+
+    Threads are serialized with an RLock; when a ``lock_path`` is given, the
+    outermost holder also takes an ``flock()`` on it so separate processes
+    sharing the same lib dir serialize too.
+    """
+
+    def __init__(self, lock_path: Path | None = None) -> None:
+        self.lock_path = lock_path
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._file_lock: ExitStack | None = None
+
+    def __enter__(self) -> Self:
+        self._lock.acquire()
+        try:
+            if self._depth == 0 and self.lock_path is not None:
+                file_lock = ExitStack()
+                file_lock.enter_context(exclusive_file_lock(self.lock_path))
+                self._file_lock = file_lock
+        except BaseException:
+            self._lock.release()
+            raise
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._depth -= 1
+        try:
+            if self._depth == 0 and self._file_lock is not None:
+                file_lock, self._file_lock = self._file_lock, None
+                file_lock.close()
+        finally:
+            self._lock.release()
+
+
+# One InstallLock per install_root lock file (or per provider name for providers
+# that install globally). Provider copies made by get_provider_with_overrides()
+# share the same lock, so concurrent Binary operations (e.g. install_many) and
+# other processes never run two installers into the same prefix.
+_INSTALL_LOCKS: dict[str, InstallLock] = {}
+_INSTALL_LOCKS_GUARD = threading.Lock()
+
+
 ################## SUPPLY-CHAIN SECURITY HELPERS ######################
 
 
@@ -128,6 +224,25 @@ NEVER_CACHE = (
 )
 
 
+def override_memo_key(value: Any) -> Hashable:
+    """Hashable stand-in for a (possibly nested, possibly unhashable) override
+    value, used to memoize get_provider_with_overrides() views. Unhashable
+    leaves are keyed by identity, which is stable because the memoized view
+    keeps them alive."""
+    if isinstance(value, Mapping):
+        return (
+            "map",
+            tuple((key, override_memo_key(item)) for key, item in value.items()),
+        )
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return (type(value).__name__, tuple(override_memo_key(item) for item in value))
+    try:
+        hash(value)
+    except TypeError:
+        return ("id", id(value))
+    return value
+
+
 def binprovider_cache(binprovider_method):
     """cache non-null return values for BinProvider methods on the BinProvider instance"""
 
@@ -135,18 +250,24 @@ def binprovider_cache(binprovider_method):
 
     @functools.wraps(binprovider_method)
     def cached_function(self, bin_name: BinName, **kwargs):
-        self._cache = self._cache or {}
-        self._cache[method_name] = self._cache.get(method_name, {})
-        method_cache = self._cache[method_name]
+        cache_owner = self._cache_owner(bin_name)
+        cache_owner._cache = cache_owner._cache or {}
+        method_cache = cache_owner._cache.setdefault(method_name, {})
 
         if bin_name in method_cache and not kwargs.get("no_cache"):
             # print('USING CACHED VALUE:', f'{self.__class__.__name__}.{method_name}({bin_name}, {kwargs}) -> {method_cache[bin_name]}')
+            if method_name in TIMED_ACTIONS:
+                emit_cache_hit(method_name, self.name, str(bin_name))
             return method_cache[bin_name]
 
-        return_value = binprovider_method(self, bin_name, **kwargs)
+        if method_name in TIMED_ACTIONS and not kwargs.get("no_cache"):
+            with pending_cache_miss():
+                return_value = binprovider_method(self, bin_name, **kwargs)
+        else:
+            return_value = binprovider_method(self, bin_name, **kwargs)
 
         if return_value and return_value not in NEVER_CACHE:
-            self._cache[method_name][bin_name] = return_value
+            method_cache[bin_name] = return_value
         return return_value
 
     cached_function.__name__ = f"{method_name}_cached"
@@ -175,6 +296,440 @@ def remap_kwargs(
     return decorator
 
 
+################## ASYNC EXEC #######################################
+
+# subprocess.run() kwargs that run_subprocess() can forward to
+# asyncio.create_subprocess_exec(); anything else falls back to subprocess.run()
+ASYNC_SUBPROCESS_KWARGS = frozenset(
+    {
+        "cwd",
+        "env",
+        "preexec_fn",
+        "capture_output",
+        "text",
+        "encoding",
+        "errors",
+        "timeout",
+        "input",
+    },
+)
+
+
+class AsyncExecScope:
+    """Routes the subprocesses of one aload()/ainstall()/... call onto the
+    awaiting event loop.
+
+    The lifecycle methods and provider handlers stay synchronous and run in a
+    worker thread, but every subprocess they start through BinProvider.exec()
+    is spawned with asyncio.create_subprocess_exec() on ``loop``, so cancelling
+    the awaiting task (or hitting its timeout) kills the running installer and
+    stops the worker at its next exec() instead of leaving it running.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self.cancelled = False
+        self._lock = threading.Lock()
+        self._pending: set[concurrent.futures.Future] = set()
+
+    def cancel(self) -> None:
+        with self._lock:
+            self.cancelled = True
+            pending, self._pending = self._pending, set()
+        for future in pending:
+            future.cancel()
+
+    def run(self, cmd: list[str], **kwargs: Any) -> subprocess.CompletedProcess:
+        with self._lock:
+            if self.cancelled:
+                raise asyncio.CancelledError()
+            future = asyncio.run_coroutine_threadsafe(
+                _run_subprocess_async(cmd, **kwargs),
+                self.loop,
+            )
+            self._pending.add(future)
+        try:
+            return future.result()
+        except concurrent.futures.CancelledError as err:
+            # re-raise as the BaseException flavor so handlers' `except Exception`
+            # blocks don't swallow it and fall through to the next provider
+            raise asyncio.CancelledError() from err
+        finally:
+            with self._lock:
+                self._pending.discard(future)
+
+
+ACTIVE_ASYNC_EXEC_SCOPE: ContextVar[AsyncExecScope | None] = ContextVar(
+    "abxpkg_active_async_exec_scope",
+    default=None,
+)
+
+
+# time.monotonic() deadline shared by every subprocess started in the current
+# context (e.g. one load_many() batch), see exec_deadline()
+ACTIVE_EXEC_DEADLINE: ContextVar[float | None] = ContextVar(
+    "abxpkg_active_exec_deadline",
+    default=None,
+)
+
+
+@contextmanager
+def exec_deadline(timeout: float | None) -> Iterator[None]:
+    """Give every subprocess started inside the block (and in worker threads
+    running a copy of its context) at most ``timeout`` seconds in total.
+
+    Each subprocess's own timeout is cut down to the time left, so one that
+    is still running at the deadline is killed, and ones started after it
+    fail immediately with subprocess.TimeoutExpired. Nested blocks can only
+    shorten the outer deadline.
+    """
+    if timeout is None:
+        yield
+        return
+    deadline = time.monotonic() + timeout
+    outer_deadline = ACTIVE_EXEC_DEADLINE.get()
+    if outer_deadline is not None:
+        deadline = min(deadline, outer_deadline)
+    token = ACTIVE_EXEC_DEADLINE.set(deadline)
+    try:
+        yield
+    finally:
+        ACTIVE_EXEC_DEADLINE.reset(token)
+
+
+def exec_deadline_expired() -> bool:
+    deadline = ACTIVE_EXEC_DEADLINE.get()
+    return deadline is not None and time.monotonic() >= deadline
+
+
+def _timeout_within_deadline(cmd: list[str], timeout: float | None) -> float | None:
+    """Clamp a subprocess ``timeout`` to the active exec_deadline(), raising
+    subprocess.TimeoutExpired without spawning anything once it has passed."""
+    deadline = ACTIVE_EXEC_DEADLINE.get()
+    if deadline is None:
+        return timeout
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise subprocess.TimeoutExpired(cmd, 0)
+    return remaining if timeout is None else min(timeout, remaining)
+
+
+async def _run_subprocess_async(
+    cmd: list[str],
+    *,
+    cwd: str | Path | None = None,
+    env: Mapping[str, str] | None = None,
+    preexec_fn: Callable[[], Any] | None = None,
+    capture_output: bool = False,
+    text: bool = False,
+    encoding: str | None = None,
+    errors: str | None = None,
+    timeout: float | None = None,
+    input: str | bytes | None = None,
+) -> subprocess.CompletedProcess:
+    """asyncio.create_subprocess_exec() equivalent of subprocess.run()."""
+    text_mode = bool(text or encoding or errors)
+    encoding = encoding or locale.getpreferredencoding(False)
+    errors = errors or "strict"
+    if isinstance(input, str):
+        input = input.encode(encoding, errors)
+    pipe = asyncio.subprocess.PIPE if capture_output else None
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        cwd=cwd,
+        env=env,
+        preexec_fn=preexec_fn,
+        stdin=asyncio.subprocess.PIPE if input is not None else None,
+        stdout=pipe,
+        stderr=pipe,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(input), timeout)
+    except BaseException as err:
+        if proc.returncode is None:
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass
+            await proc.wait()
+        if isinstance(err, TimeoutError):
+            raise subprocess.TimeoutExpired(cmd, cast(float, timeout)) from err
+        raise
+
+    def decode(output: bytes | None) -> str | bytes | None:
+        if output is None or not text_mode:
+            return output
+        # same universal-newlines translation subprocess.run(text=True) does
+        return output.decode(encoding, errors).replace("\r\n", "\n").replace("\r", "\n")
+
+    return subprocess.CompletedProcess(
+        cmd,
+        cast(int, proc.returncode),
+        decode(stdout),
+        decode(stderr),
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def getpwuid_cached(uid: int) -> pwd.struct_passwd:
+    """pwd.getpwuid() memoized for the process (misses raise KeyError uncached,
+    so a user created later is still picked up)."""
+    return pwd.getpwuid(uid)
+
+
+# (sudo abspath, current euid, target user) -> (whether ``sudo -n`` works,
+# the output of the failed probe), so exec() stops running every command twice
+# (once via sudo, once unprivileged) on hosts without passwordless sudo.
+# Per-process only: sudo's cached-credential state expires on its own clock.
+_SUDO_CAPABILITY: dict[tuple[str, int, str], tuple[bool, str | None]] = {}
+_SUDO_CAPABILITY_LOCK = threading.Lock()
+
+
+def sudo_capability(
+    sudo_abspath: str,
+    run_as_user: str | None,
+    env: Mapping[str, str],
+) -> tuple[bool, str | None]:
+    """Whether ``sudo -n [-u run_as_user]`` can run commands, probed once per
+    process with ``true``. Returns (works, failed probe output)."""
+    cache_key = (sudo_abspath, os.geteuid(), run_as_user or "root")
+    with _SUDO_CAPABILITY_LOCK:
+        cached = _SUDO_CAPABILITY.get(cache_key)
+    if cached is not None:
+        return cached
+    probe_cmd = [sudo_abspath, "-n"]
+    if run_as_user:
+        probe_cmd.extend(["-u", run_as_user])
+    probe_cmd.extend(["--", "true"])
+    try:
+        proc = run_subprocess(
+            probe_cmd,
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+        capability = (
+            proc.returncode == 0,
+            None
+            if proc.returncode == 0
+            else format_subprocess_output(proc.stdout, proc.stderr),
+        )
+    except (OSError, subprocess.TimeoutExpired) as err:
+        if exec_deadline_expired():
+            # cut short by the caller's deadline, says nothing about sudo
+            raise
+        capability = (False, str(err))
+    with _SUDO_CAPABILITY_LOCK:
+        _SUDO_CAPABILITY[cache_key] = capability
+    return capability
+
+
+# flags tried in order by _version_from_exec() to get a version out of a binary
+VERSION_FLAGS = ("--version", "-version", "-v")
+# resolved abspath -> {inode, size, mtime_ns, version_arg, stream}: the flag and
+# output stream that last yielded a SemVer for that exact file (also persisted
+# in the provider's probe cache / derived.env so new processes skip the misses)
+_VERSION_FLAGS: dict[str, dict[str, object]] = {}
+_VERSION_FLAGS_LOCK = threading.Lock()
+
+# (bin_index.env path, provider name) -> (watched dirs stamp, bin index entries),
+# so repeated lookups within a run only stat() the watched dirs, see bin_index()
+_BIN_INDEXES: dict[tuple[str, str], tuple[list[list[object]], dict[str, Any]]] = {}
+_BIN_INDEXES_LOCK = threading.Lock()
+
+
+def binary_fingerprint(
+    abspath: HostBinPath | Path,
+) -> tuple[Path, dict[str, object]] | None:
+    """Return (resolved path, {inode, size, mtime_ns}) for ``abspath``, or
+    None if it can't be stat'd. Any rebuild/replace of the file changes it."""
+    resolved_abspath = Path(abspath).expanduser().resolve(strict=False)
+    try:
+        stat_result = resolved_abspath.stat()
+    except OSError:
+        return None
+    return resolved_abspath, {
+        "inode": stat_result.st_ino,
+        "size": stat_result.st_size,
+        "mtime_ns": stat_result.st_mtime_ns,
+    }
+
+
+def exec_output_tail_lines() -> int:
+    """Lines of each stream kept by run_subprocess_streaming() for the returned
+    CompletedProcess (and so for install error messages), older lines are
+    dropped (ABXPKG_EXEC_OUTPUT_LINES, default 2000)."""
+    return max(env_int("ABXPKG_EXEC_OUTPUT_LINES", 2000), 1)
+
+
+# run_subprocess() kwargs that run_subprocess_streaming() can honor
+STREAMING_SUBPROCESS_KWARGS = frozenset(
+    {"cwd", "env", "preexec_fn", "capture_output", "text", "timeout"},
+)
+
+
+def run_subprocess_streaming(
+    cmd: list[str],
+    on_line: Callable[[str, str], None],
+    *,
+    max_lines: int | None = None,
+    stall_timeout: float | None = None,
+    timeout: float | None = None,
+    **kwargs: Any,
+) -> subprocess.CompletedProcess:
+    """run_subprocess() that reads stdout/stderr while the process runs.
+
+    Each line is passed to ``on_line(stream, line)`` as soon as it is written,
+    and only the last ``max_lines`` (default: exec_output_tail_lines()) of
+    each stream are kept for the returned CompletedProcess. The process is killed (raising subprocess.TimeoutExpired)
+    once ``timeout`` elapses or ``stall_timeout`` passes without new output,
+    and when the surrounding aload()/ainstall()/... call is cancelled.
+    ``cwd``/``env``/``preexec_fn`` are passed through to Popen, other
+    run_subprocess() kwargs (capture_output, text) are implied.
+    """
+    timeout = _timeout_within_deadline(cmd, timeout)
+    if max_lines is None:
+        max_lines = exec_output_tail_lines()
+    count_subprocess()
+    scope = ACTIVE_ASYNC_EXEC_SCOPE.get()
+    if scope is not None and scope.cancelled:
+        raise asyncio.CancelledError()
+
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+        **{
+            key: value
+            for key, value in kwargs.items()
+            if key in ("cwd", "env", "preexec_fn")
+        },
+    )
+    tails: dict[str, collections.deque[str]] = {
+        "stdout": collections.deque(maxlen=max_lines),
+        "stderr": collections.deque(maxlen=max_lines),
+    }
+    dropped = {"stdout": 0, "stderr": 0}
+    last_output_at = time.monotonic()
+    output_lock = threading.Lock()
+
+    def pump(stream: str, pipe: Any) -> None:
+        nonlocal last_output_at
+        with pipe:
+            for line in pipe:
+                line = line.rstrip("\n")
+                with output_lock:
+                    tail = tails[stream]
+                    if len(tail) == tail.maxlen:
+                        dropped[stream] += 1
+                    tail.append(line)
+                    last_output_at = time.monotonic()
+                    on_line(stream, line)
+
+    readers = [
+        threading.Thread(target=pump, args=("stdout", proc.stdout), daemon=True),
+        threading.Thread(target=pump, args=("stderr", proc.stderr), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+
+    def collected(stream: str) -> str:
+        lines = list(tails[stream])
+        if dropped[stream]:
+            lines.insert(0, f"[... {dropped[stream]} earlier lines omitted ...]")
+        return "".join(f"{line}\n" for line in lines)
+
+    started_at = time.monotonic()
+    expired_after: float | None = None
+    try:
+        while True:
+            try:
+                proc.wait(timeout=0.1)
+                break
+            except subprocess.TimeoutExpired:
+                pass
+            if scope is not None and scope.cancelled:
+                raise asyncio.CancelledError()
+            now = time.monotonic()
+            if timeout is not None and now - started_at > timeout:
+                expired_after = timeout
+            elif stall_timeout is not None and now - last_output_at > stall_timeout:
+                logger.warning(
+                    "Killing %s after %ss without output",
+                    format_command(cmd),
+                    stall_timeout,
+                )
+                expired_after = stall_timeout
+            if expired_after is not None:
+                proc.kill()
+                proc.wait()
+                break
+    except BaseException:
+        proc.kill()
+        proc.wait()
+        raise
+    finally:
+        # a killed installer's own children can hold the pipes open
+        for reader in readers:
+            reader.join(timeout=None if expired_after is None else 1)
+
+    with output_lock:
+        stdout, stderr = collected("stdout"), collected("stderr")
+    if expired_after is not None:
+        raise subprocess.TimeoutExpired(
+            cmd,
+            expired_after,
+            output=stdout,
+            stderr=stderr,
+        )
+    return subprocess.CompletedProcess(cmd, cast(int, proc.returncode), stdout, stderr)
+
+
+def run_subprocess(cmd: list[str], **kwargs: Any) -> subprocess.CompletedProcess:
+    """subprocess.run(), or its asyncio equivalent on the caller's event loop
+    when called from inside an aload()/ainstall()/aupdate()/auninstall()."""
+    if ACTIVE_EXEC_DEADLINE.get() is not None:
+        kwargs["timeout"] = _timeout_within_deadline(cmd, kwargs.get("timeout"))
+    count_subprocess()
+    scope = ACTIVE_ASYNC_EXEC_SCOPE.get()
+    if scope is None or not kwargs.keys() <= ASYNC_SUBPROCESS_KWARGS:
+        return subprocess.run(cmd, **kwargs)
+    return scope.run(cmd, **kwargs)
+
+
+async def run_with_async_exec(
+    func: Callable[..., R],
+    /,
+    *args: Any,
+    timeout: float | None = None,
+    **kwargs: Any,
+) -> R:
+    """Await a blocking lifecycle call (e.g. ``provider.install``) without
+    blocking the event loop, propagating cancellation and ``timeout`` (seconds
+    for the whole call) into the subprocesses it runs. See AsyncExecScope."""
+    loop = asyncio.get_running_loop()
+    scope = AsyncExecScope(loop)
+    context = contextvars.copy_context()
+    context.run(ACTIVE_ASYNC_EXEC_SCOPE.set, scope)
+    worker = loop.run_in_executor(
+        None,
+        functools.partial(context.run, func, *args, **kwargs),
+    )
+    try:
+        async with asyncio.timeout(timeout):
+            return await asyncio.shield(worker)
+    finally:
+        if not worker.done():
+            # cancelled or timed out: kill its subprocess and let the worker
+            # unwind (releasing install locks etc.) before propagating
+            scope.cancel()
+            with suppress(Exception, asyncio.CancelledError):
+                await worker
+
+
 class ShallowBinary(BaseModel):
     """
     Shallow version of Binary used as a return type for BinProvider methods (e.g. install()).
@@ -208,20 +763,95 @@ class ShallowBinary(BaseModel):
     loaded_mtime: MTimeNs | None = Field(default=None, alias="mtime")
     loaded_euid: EUID | None = Field(default=None, alias="euid")
 
+    # set by defer_sha256(): loaded_sha256 stays None until first read
+    _sha256_deferred: bool = PrivateAttr(default=False)
+
+    def __getattribute__(self, item: str) -> Any:
+        if item == "loaded_sha256":
+            return super().__getattribute__("sha256_digest")
+        return super().__getattribute__(item)
+
     def __getattr__(self, item: str) -> Any:
         """Allow accessing fields by both field name and alias."""
         for field, meta in type(self).model_fields.items():
             if meta.alias == item:
                 return getattr(self, field)
-        raise AttributeError(item)
+        return super().__getattr__(item)
+
+    def __eq__(self, other: object) -> bool:
+        # a deferred copy and a hashed copy of the same binary are equal
+        if isinstance(other, ShallowBinary) and (
+            self.sha256_digest != other.sha256_digest
+        ):
+            return False
+        return super().__eq__(other)
+
+    @property
+    def sha256_digest(self) -> Sha256 | None:
+        """loaded_sha256, hashing a deferred one from loaded_abspath on first read
+        (reading loaded_sha256 / sha256 goes through here too)."""
+        if self._sha256_deferred:
+            self._load_deferred_sha256()
+        return self.__dict__.get("loaded_sha256")
+
+    @property
+    def sha256_deferred(self) -> bool:
+        """True until a deferred loaded_sha256 has been hashed on first access."""
+        return self._sha256_deferred
+
+    @property
+    def known_sha256(self) -> Sha256 | None:
+        """loaded_sha256 without hashing a deferred one ('unknown' until then),
+        for persisting to caches that re-defer unknown hashes on the next load."""
+        return UNKNOWN_SHA256 if self._sha256_deferred else self.sha256_digest
+
+    def defer_sha256(self) -> Self:
+        """Clear loaded_sha256 so it is only hashed from loaded_abspath when
+        something actually reads it (most callers never do, and hashing large
+        binaries like browsers dominates load time)."""
+        self.__dict__["loaded_sha256"] = None
+        self._sha256_deferred = True
+        return self
+
+    def _load_deferred_sha256(self) -> None:
+        provider = self.loaded_binprovider
+        abspath = self.loaded_abspath
+        sha256 = None
+        if provider is not None and abspath:
+            try:
+                stat_result = Path(abspath).expanduser().resolve(strict=False).stat()
+            except OSError:
+                stat_result = None
+            # don't attribute a different file's hash to the version we loaded
+            if stat_result is not None and self.loaded_mtime in (
+                None,
+                stat_result.st_mtime_ns,
+            ):
+                sha256 = provider.get_sha256(self.name, abspath=abspath, no_cache=True)
+        self.__dict__["loaded_sha256"] = sha256 or UNKNOWN_SHA256
+        self._sha256_deferred = False
+
+    @model_serializer(mode="wrap")
+    def serialize_model(self, handler: SerializerFunctionWrapHandler) -> Any:
+        if self._sha256_deferred:
+            # hash a deferred sha256 before dumping
+            self._load_deferred_sha256()
+        return handler(self)
 
     def __repr__(self) -> str:
+        sha256 = (
+            "<deferred>"
+            if self.sha256_deferred
+            else f"...{str(self.loaded_sha256)[-6:]}"
+            if self.loaded_sha256
+            else None
+        )
         return (
             f"{self.__class__.__name__}("
             f"name={self.name!r}, "
             f"abspath={self.loaded_abspath!r}, "
             f"version={self.loaded_version!r}, "
-            f"sha256={f'...{str(self.loaded_sha256)[-6:]}' if self.loaded_sha256 else None!r}, "
+            f"sha256={sha256!r}, "
             f"mtime={self.loaded_mtime!r}, "
             f"euid={self.loaded_euid!r}"
             f")"
@@ -328,7 +958,7 @@ class ShallowBinary(BaseModel):
             )
         elif explicit_env is not None:
             kwargs["env"] = dict(explicit_env)
-        return subprocess.run(
+        return run_subprocess(
             cmd,
             cwd=str(cwd),
             **kwargs,
@@ -370,6 +1000,13 @@ class BinProvider(BaseModel):
             else env_flag_is_true("DRY_RUN")
         ),
     )
+    skip_sha256: bool = Field(
+        default_factory=lambda: env_flag_is_true("ABXPKG_SKIP_SHA256"),
+        description=(
+            "Never hash loaded binaries, report loaded_sha256 as 'unknown' "
+            "instead. Otherwise the hash is deferred until first accessed."
+        ),
+    )
     postinstall_scripts: bool | None = Field(default=None)
     min_release_age: float | None = Field(default=None)
 
@@ -396,6 +1033,18 @@ class BinProvider(BaseModel):
         default_factory=lambda: int(os.environ.get("ABXPKG_VERSION_TIMEOUT", "10")),
         repr=False,
     )
+    stall_timeout: int | None = Field(
+        default_factory=lambda: (
+            int(os.environ["ABXPKG_STALL_TIMEOUT"])
+            if os.environ.get("ABXPKG_STALL_TIMEOUT")
+            else None
+        ),
+        description=(
+            "Kill install/update/uninstall subprocesses that print nothing for "
+            "this many seconds. None disables the check."
+        ),
+        repr=False,
+    )
 
     @computed_field(repr=False)
     @property
@@ -417,6 +1066,17 @@ class BinProvider(BaseModel):
             return None
         return self.install_root / "derived.env"
 
+    @contextmanager
+    def cache_batch(self) -> Iterator[None]:
+        """Buffer derived.env cache writes made inside the block (by this or
+        any other provider sharing the same file) and flush them once at exit."""
+        derived_env_path = self.derived_env_path
+        if derived_env_path is None:
+            yield
+            return
+        with derived_cache_batch(derived_env_path):
+            yield
+
     @staticmethod
     def apply_exec_env(
         exec_env: dict[str, str],
@@ -479,6 +1139,11 @@ class BinProvider(BaseModel):
         mtime: int
         euid: int
 
+    class BinIndexEntry(TypedDict):
+        package: str | None
+        version: str | None
+        abspath: str
+
     def _cache_key(
         self,
         bin_name: BinName,
@@ -530,14 +1195,12 @@ class BinProvider(BaseModel):
         if fingerprints is None:
             return None
 
-        cache = load_derived_cache(derived_env_path)
         cache_key = self._cache_key(bin_name, abspath)
-        cached_record = cache.get(cache_key)
+        cached_record = load_derived_cache_record(derived_env_path, cache_key)
         if not isinstance(cached_record, dict):
             return None
         if cached_record.get("fingerprint") != fingerprints:
-            cache.pop(cache_key, None)
-            save_derived_cache(derived_env_path, cache)
+            delete_derived_cache_records(derived_env_path, [cache_key])
             return None
 
         loaded_version = cached_record.get("loaded_version")
@@ -548,8 +1211,7 @@ class BinProvider(BaseModel):
             or not isinstance(loaded_sha256, str)
             or not isinstance(loaded_euid, int)
         ):
-            cache.pop(cache_key, None)
-            save_derived_cache(derived_env_path, cache)
+            delete_derived_cache_records(derived_env_path, [cache_key])
             return None
 
         try:
@@ -561,8 +1223,7 @@ class BinProvider(BaseModel):
             mtime = TypeAdapter(MTimeNs).validate_python(fingerprints[0]["mtime_ns"])
             euid = TypeAdapter(EUID).validate_python(loaded_euid)
         except Exception:
-            cache.pop(cache_key, None)
-            save_derived_cache(derived_env_path, cache)
+            delete_derived_cache_records(derived_env_path, [cache_key])
             return None
 
         original_abspath = str(Path(abspath).expanduser().absolute())
@@ -578,8 +1239,7 @@ class BinProvider(BaseModel):
                 "dependency" if str(bin_name) == str(self.INSTALLER_BIN) else "binary"
             )
         if not isinstance(cached_abspath, str):
-            cache.pop(cache_key, None)
-            save_derived_cache(derived_env_path, cache)
+            delete_derived_cache_records(derived_env_path, [cache_key])
             return None
         primary_fingerprint = fingerprints[0]
         if cached_abspath == resolved_abspath and original_abspath != resolved_abspath:
@@ -596,24 +1256,27 @@ class BinProvider(BaseModel):
             or cached_record.get("mtime") != primary_fingerprint["mtime_ns"]
             or cached_record.get("euid") != primary_fingerprint["euid"]
         ):
-            cache[cache_key] = {
-                "fingerprint": fingerprints,
-                "loaded_version": str(version),
-                "loaded_sha256": str(sha256),
-                "loaded_euid": euid,
-                "cache_kind": cache_kind,
-                "provider_name": self.name,
-                "resolved_provider_name": resolved_provider_name,
-                "bin_name": str(bin_name),
-                "abspath": original_abspath,
-                "install_args": list(
-                    self.get_install_args(bin_name, quiet=True, no_cache=True),
-                ),
-                "inode": primary_fingerprint["inode"],
-                "mtime": primary_fingerprint["mtime_ns"],
-                "euid": primary_fingerprint["euid"],
-            }
-            save_derived_cache(derived_env_path, cache)
+            upsert_derived_cache_record(
+                derived_env_path,
+                cache_key,
+                {
+                    "fingerprint": fingerprints,
+                    "loaded_version": str(version),
+                    "loaded_sha256": str(sha256),
+                    "loaded_euid": euid,
+                    "cache_kind": cache_kind,
+                    "provider_name": self.name,
+                    "resolved_provider_name": resolved_provider_name,
+                    "bin_name": str(bin_name),
+                    "abspath": original_abspath,
+                    "install_args": list(
+                        self.get_install_args(bin_name, quiet=True, no_cache=True),
+                    ),
+                    "inode": primary_fingerprint["inode"],
+                    "mtime": primary_fingerprint["mtime_ns"],
+                    "euid": primary_fingerprint["euid"],
+                },
+            )
             cached_abspath = original_abspath
 
         resolved_provider = (
@@ -678,10 +1341,12 @@ class BinProvider(BaseModel):
             derived_env_path.parent.exists() or derived_env_path.parent.is_symlink()
         ):
             derived_env_path.parent.mkdir(parents=True, exist_ok=True)
-        cache = load_derived_cache(derived_env_path)
-        cache[self._cache_key(bin_name, abspath)] = record
         try:
-            save_derived_cache(derived_env_path, cache)
+            upsert_derived_cache_record(
+                derived_env_path,
+                self._cache_key(bin_name, abspath),
+                record,
+            )
         except Exception as err:
             logger.debug(
                 "Skipping cache write for %s via %s: %s",
@@ -695,12 +1360,169 @@ class BinProvider(BaseModel):
             TypeAdapter(EUID).validate_python(fingerprints[0]["euid"]),
         )
 
+    @property
+    def bin_index_path(self) -> Path | None:
+        """Where the bin_name -> (package, version, abspath) index of everything
+        installed under install_root is persisted, or None without install_root."""
+        if self.install_root is None:
+            return None
+        return self.install_root / "bin_index.env"
+
+    def _bin_index_watch_paths(self) -> list[Path]:
+        """Paths whose mtime changes whenever a package is added or removed
+        under install_root, used to tell when the bin index must be rescanned."""
+        return [self.bin_dir] if self.bin_dir else []
+
+    def scan_bin_index(self) -> dict[str, "BinProvider.BinIndexEntry"]:
+        """Scan install_root for the executables it provides.
+
+        The default only lists the executables in bin_dir, subclasses that can
+        read package metadata directly (dist-info, package.json, ...) override
+        this to also fill in the owning package and its version."""
+        entries: dict[str, BinProvider.BinIndexEntry] = {}
+        if self.bin_dir is None:
+            return entries
+        try:
+            dir_entries = list(os.scandir(self.bin_dir))
+        except OSError:
+            return entries
+        for dir_entry in sorted(dir_entries, key=lambda entry: entry.name):
+            if dir_entry.is_file() and os.access(dir_entry.path, os.X_OK):
+                entries[dir_entry.name] = {
+                    "package": None,
+                    "version": None,
+                    "abspath": dir_entry.path,
+                }
+        return entries
+
+    def _bin_index_stamp(self) -> list[list[object]]:
+        stamp: list[list[object]] = []
+        for path in self._bin_index_watch_paths():
+            try:
+                mtime_ns: int | None = path.stat().st_mtime_ns
+            except OSError:
+                mtime_ns = None
+            stamp.append([str(path), mtime_ns])
+        return stamp
+
+    def bin_index(
+        self, refresh: bool = False
+    ) -> dict[str, "BinProvider.BinIndexEntry"]:
+        """Return the bin index for install_root, memoized in-process for as
+        long as the watched dirs are unchanged.
+
+        Only ``refresh`` (used after install/update/uninstall) rescans and
+        persists it; a stale persisted index is rescanned in memory without
+        writing, so read-only lookups never touch the disk."""
+        bin_index_path = self.bin_index_path
+        if bin_index_path is None:
+            return {}
+        memo_key = (str(bin_index_path), self.name)
+        stamp = self._bin_index_stamp()
+        if not refresh:
+            with _BIN_INDEXES_LOCK:
+                memoized = _BIN_INDEXES.get(memo_key)
+            if memoized is not None and memoized[0] == stamp:
+                return dict(memoized[1])
+
+        stamp_key = json.dumps(["bin_index", self.name], separators=(",", ":"))
+        records = load_derived_cache(bin_index_path)
+        indexed: dict[str, str] = {}
+        for cache_key in records:
+            try:
+                provider_name, indexed_bin_name, _abspath = json.loads(cache_key)
+            except (TypeError, ValueError):
+                continue
+            if provider_name == self.name:
+                indexed[str(indexed_bin_name)] = cache_key
+
+        stamp_record = records.get(stamp_key)
+        if not refresh and stamp_record and stamp_record.get("stamp") == stamp:
+            entries = {
+                indexed_bin_name: cast(BinProvider.BinIndexEntry, records[cache_key])
+                for indexed_bin_name, cache_key in indexed.items()
+            }
+        else:
+            entries = self.scan_bin_index()
+            if refresh:
+                self._write_bin_index(bin_index_path, indexed, entries, stamp)
+        with _BIN_INDEXES_LOCK:
+            _BIN_INDEXES[memo_key] = (stamp, entries)
+        return dict(entries)
+
+    def _write_bin_index(
+        self,
+        bin_index_path: Path,
+        indexed: dict[str, str],
+        entries: dict[str, "BinProvider.BinIndexEntry"],
+        stamp: list[list[object]],
+    ) -> None:
+        """Persist the freshly scanned ``entries`` (replacing the previously
+        ``indexed`` cache keys of this provider) along with their stamp."""
+        if self.install_root is None or not self.install_root.is_dir():
+            return
+        changes: dict[str, Mapping[str, object] | None] = dict.fromkeys(
+            indexed.values(),
+        )
+        for indexed_bin_name, entry in entries.items():
+            changes[
+                json.dumps(
+                    [self.name, indexed_bin_name, entry["abspath"]],
+                    separators=(",", ":"),
+                )
+            ] = dict(entry)
+        changes[json.dumps(["bin_index", self.name], separators=(",", ":"))] = {
+            "stamp": stamp,
+        }
+        try:
+            with derived_cache_batch(bin_index_path):
+                for cache_key, record in changes.items():
+                    if record is None:
+                        delete_derived_cache_records(bin_index_path, [cache_key])
+                    else:
+                        upsert_derived_cache_record(bin_index_path, cache_key, record)
+        except OSError as err:
+            logger.debug("Skipping bin index write for %s: %s", self.name, err)
+
+    def lookup_bin_index(
+        self,
+        bin_name: BinName | str,
+    ) -> "BinProvider.BinIndexEntry | None":
+        """Return the bin index entry for ``bin_name`` if install_root provides it."""
+        return self.bin_index().get(str(bin_name))
+
     _cache: dict[str, dict[str, Any]] | None = (
         None  # Per-method in-memory cache populated by @binprovider_cache during the current process only.
     )
     _INSTALLER_BINARY: ShallowBinary | None = (
         None  # cached by INSTALLER_BINARY property after first resolution
     )
+    _exec_env_cache: dict[tuple, tuple[dict[str, str], dict[str, str]]] | None = (
+        None  # (sudo env, fallback env) per exec() env inputs, see _exec_envs()
+    )
+    _cache_parent: "BinProvider | None" = (
+        None  # provider whose _cache this override view shares, see _cache_owner()
+    )
+    _shadowed_bin_names: frozenset[str] = (
+        frozenset()  # binaries whose handlers this override view replaces
+    )
+    _override_views: dict[Hashable, tuple[Hashable, "BinProvider"]] | None = (
+        None  # memoized get_provider_with_overrides() views and their field snapshot
+    )
+
+    def _cache_owner(self, bin_name: BinName | str) -> "BinProvider":
+        """The provider whose in-memory @binprovider_cache holds ``bin_name``.
+
+        Override views share their parent's cache, except for the binaries
+        whose handlers they override (those resolve differently).
+        """
+        provider = self
+        while (
+            provider._cache_parent is not None
+            and str(bin_name) not in provider._shadowed_bin_names
+        ):
+            provider = provider._cache_parent
+        return provider
 
     def __eq__(self, other: Any) -> bool:
         try:
@@ -713,7 +1535,7 @@ class BinProvider(BaseModel):
     @staticmethod
     def uid_has_passwd_entry(uid: int) -> bool:
         try:
-            pwd.getpwuid(uid)
+            getpwuid_cached(uid)
         except KeyError:
             return False
         return True
@@ -770,7 +1592,7 @@ class BinProvider(BaseModel):
 
     def get_pw_record(self, uid: int) -> pwd.struct_passwd:
         try:
-            return pwd.getpwuid(uid)
+            return getpwuid_cached(uid)
         except KeyError:
             if uid != os.geteuid():
                 raise
@@ -786,6 +1608,25 @@ class BinProvider(BaseModel):
                 ),
             )
 
+    def _install_lock(self) -> InstallLock:
+        """Return the lock that serializes install/update/uninstall mutations
+        for this provider's install_root across threads and processes (or the
+        whole provider within this process when it installs globally)."""
+        derived_env_path = self.derived_env_path
+        lock_path = (
+            derived_env_path.with_name(
+                f"{derived_env_path.name.removesuffix('derived.env')}install.lock",
+            )
+            if derived_env_path is not None
+            else None
+        )
+        lock_key = str(lock_path) if lock_path is not None else self.name
+        with _INSTALL_LOCKS_GUARD:
+            lock = _INSTALL_LOCKS.get(lock_key)
+            if lock is None:
+                lock = _INSTALL_LOCKS[lock_key] = InstallLock(lock_path)
+        return lock
+
     @property
     def EUID(self) -> int:
         """
@@ -815,10 +1656,12 @@ class BinProvider(BaseModel):
 
         derived_env_path = self.derived_env_path
         if not no_cache and derived_env_path and derived_env_path.is_file():
-            cache = load_derived_cache(derived_env_path)
-            for cached_record in cache.values():
-                if not isinstance(cached_record, dict):
-                    continue
+            cached_records = load_derived_cache_records(
+                derived_env_path,
+                self.name,
+                str(self.INSTALLER_BIN),
+            )
+            for cached_record in cached_records.values():
                 if cached_record.get("provider_name") != self.name or cached_record.get(
                     "bin_name",
                 ) != str(self.INSTALLER_BIN):
@@ -880,12 +1723,12 @@ class BinProvider(BaseModel):
                     no_cache=no_cache,
                 )
                 if loaded and loaded.loaded_abspath:
-                    if loaded.loaded_version and loaded.loaded_sha256:
+                    if loaded.loaded_version and loaded.known_sha256:
                         self.write_cached_binary(
                             self.INSTALLER_BIN,
                             loaded.loaded_abspath,
                             loaded.loaded_version,
-                            loaded.loaded_sha256,
+                            loaded.known_sha256,
                             resolved_provider_name=(
                                 loaded.loaded_binprovider.name
                                 if loaded.loaded_binprovider is not None
@@ -904,12 +1747,12 @@ class BinProvider(BaseModel):
                 binproviders=installer_providers,
             ).load(no_cache=no_cache)
             if loaded and loaded.loaded_abspath:
-                if loaded.loaded_version and loaded.loaded_sha256:
+                if loaded.loaded_version and loaded.known_sha256:
                     self.write_cached_binary(
                         self.INSTALLER_BIN,
                         loaded.loaded_abspath,
                         loaded.loaded_version,
-                        loaded.loaded_sha256,
+                        loaded.known_sha256,
                         resolved_provider_name=(
                             loaded.loaded_binprovider.name
                             if loaded.loaded_binprovider is not None
@@ -984,10 +1827,70 @@ class BinProvider(BaseModel):
         # important to do this so that any subsequent calls to handler functions down the call chain
         # still have access to the overrides, we don't have to have to pass them down as args all the way down the stack
 
-        updated_binprovider: Self = self.model_copy(deep=True)
+        # views are memoized per (our current fields, requested overrides), so
+        # repeated Binary.load()/install() calls reuse one warm view
+        memo_key = override_memo_key(
+            (
+                self.__dict__,
+                overrides,
+                dry_run,
+                install_timeout,
+                version_timeout,
+                provider_patches,
+            ),
+        )
+        memoized = (self._override_views or {}).get(memo_key)
+        if memoized is not None:
+            view_snapshot, view = memoized
+            # a caller may have mutated the view we handed out (PATH is filled
+            # in lazily by setup_PATH() and is expected to change)
+            if self._view_snapshot(view) == view_snapshot:
+                if view._cache_parent is self:
+                    if view._INSTALLER_BINARY is None:
+                        view._INSTALLER_BINARY = self._INSTALLER_BINARY
+                    elif self._INSTALLER_BINARY is None:
+                        self._INSTALLER_BINARY = view._INSTALLER_BINARY
+                return cast(Self, view)
+
+        view = self._build_provider_with_overrides(
+            overrides=overrides,
+            dry_run=dry_run,
+            install_timeout=install_timeout,
+            version_timeout=version_timeout,
+            **provider_patches,
+        )
+        if self._override_views is None or len(self._override_views) >= 256:
+            self._override_views = {}
+        self._override_views[memo_key] = (self._view_snapshot(view), view)
+        return view
+
+    @staticmethod
+    def _view_snapshot(view: "BinProvider") -> Hashable:
+        return override_memo_key(
+            {key: value for key, value in view.__dict__.items() if key != "PATH"},
+        )
+
+    def _build_provider_with_overrides(
+        self,
+        overrides: Optional["BinProviderOverrides"] = None,
+        dry_run: bool | None = None,
+        install_timeout: int | None = None,
+        version_timeout: int | None = None,
+        **provider_patches: Any,
+    ) -> Self:
+        # a shallow copy is enough: the only field we mutate below is overrides,
+        # which gets its own per-binary dicts
+        updated_binprovider: Self = self.model_copy()
+        updated_binprovider.overrides = {
+            binname: dict(handlers) for binname, handlers in self.overrides.items()
+        }
+        updated_binprovider._cache = None
+        updated_binprovider._override_views = None
 
         # main binary-specific overrides for [abspath, version, install_args, install, update, uninstall]
         overrides = overrides or {}
+        shadowed_bin_names: set[str] = set()
+        has_field_overrides = bool(provider_patches)
 
         # extra overrides that are also configurable, can add more in the future as-needed for tunable options
         updated_binprovider.dry_run = self.dry_run if dry_run is None else dry_run
@@ -1016,6 +1919,7 @@ class BinProvider(BaseModel):
                     handler_overrides[key] = value
 
             if provider_field_overrides:
+                has_field_overrides = True
                 updated_binprovider = type(self).model_validate(
                     {
                         **updated_binprovider.model_dump(
@@ -1028,6 +1932,7 @@ class BinProvider(BaseModel):
                 )
 
             if handler_overrides:
+                shadowed_bin_names.add(str(binname))
                 updated_binprovider.overrides[binname] = cast(
                     HandlerDict,
                     {
@@ -1048,6 +1953,15 @@ class BinProvider(BaseModel):
                 },
             )
 
+        # with the same fields as us, the view resolves every binary it doesn't
+        # override exactly like we do, so it can share our in-memory caches
+        # (unless it overrides handlers for "*", which applies to every binary)
+        if not has_field_overrides and "*" not in shadowed_bin_names:
+            updated_binprovider._cache_parent = self
+            updated_binprovider._shadowed_bin_names = frozenset(shadowed_bin_names)
+        else:
+            updated_binprovider._cache_parent = None
+            updated_binprovider._shadowed_bin_names = frozenset()
         return updated_binprovider
 
     # @validate_call
@@ -1292,38 +2206,36 @@ class BinProvider(BaseModel):
 
     @log_method_call()
     def invalidate_cache(self, bin_name: BinName) -> None:
-        if self._cache:
-            for method_cache in self._cache.values():
-                method_cache.pop(bin_name, None)
+        for provider in (self, self._cache_owner(bin_name)):
+            if provider._cache:
+                for method_cache in provider._cache.values():
+                    method_cache.pop(bin_name, None)
         derived_env_path = self.derived_env_path
         if derived_env_path is None:
             return
-        cache = load_derived_cache(derived_env_path)
-        updated_cache: dict[str, object] = {}
-        for cache_key, cache_value in cache.items():
-            try:
-                provider_name, cached_bin_name, _cached_abspath = json.loads(cache_key)
-            except Exception:
-                continue
-            if provider_name == self.name and cached_bin_name == str(bin_name):
-                continue
-            updated_cache[cache_key] = cache_value
-        if updated_cache != cache:
-            save_derived_cache(derived_env_path, updated_cache)
+        delete_derived_cache_records(
+            derived_env_path,
+            load_derived_cache_records(derived_env_path, self.name, str(bin_name)),
+        )
         if str(bin_name) == self.INSTALLER_BIN:
-            self._INSTALLER_BINARY = None
+            provider: BinProvider | None = self
+            while provider is not None:
+                provider._INSTALLER_BINARY = None
+                provider = provider._cache_parent
 
     @log_method_call(include_result=True)
     def has_cached_binary(self, bin_name: BinName) -> bool:
         derived_env_path = self.derived_env_path
         if derived_env_path is None or not derived_env_path.is_file():
             return False
-        cache = load_derived_cache(derived_env_path)
-        cache_changed = False
+        cached_records = load_derived_cache_records(
+            derived_env_path,
+            self.name,
+            str(bin_name),
+        )
+        stale_cache_keys: list[str] = []
         has_valid_cache = False
-        for cache_key, cache_value in list(cache.items()):
-            if not isinstance(cache_value, dict):
-                continue
+        for cache_key, cache_value in cached_records.items():
             cached_provider_name = cache_value.get("provider_name")
             cached_bin_name = cache_value.get("bin_name")
             cached_abspath = cache_value.get("abspath")
@@ -1354,12 +2266,10 @@ class BinProvider(BaseModel):
                 continue
             cached_path = Path(cached_abspath)
             if not (cached_path.exists() or cached_path.is_symlink()):
-                cache.pop(cache_key, None)
-                cache_changed = True
+                stale_cache_keys.append(cache_key)
                 continue
             has_valid_cache = True
-        if cache_changed:
-            save_derived_cache(derived_env_path, cache)
+        delete_derived_cache_records(derived_env_path, stale_cache_keys)
         return has_valid_cache
 
     @log_method_call(include_result=True)
@@ -1370,62 +2280,59 @@ class BinProvider(BaseModel):
         cache = load_derived_cache(derived_env_path)
         dependencies: list[ShallowBinary] = []
         seen: set[tuple[str, str, str]] = set()
-        for cache_key, cache_value in sorted(cache.items()):
-            if not isinstance(cache_value, dict):
-                continue
-            cached_provider_name = cache_value.get("provider_name")
-            cached_bin_name = cache_value.get("bin_name")
-            cached_abspath = cache_value.get("abspath")
-            cache_kind = cache_value.get("cache_kind")
-            if (
-                not isinstance(cached_provider_name, str)
-                or not isinstance(cached_bin_name, str)
-                or not isinstance(cached_abspath, str)
-            ):
-                try:
-                    cached_provider_name, cached_bin_name, cached_abspath = json.loads(
-                        cache_key,
+        with self.cache_batch():
+            for cache_key, cache_value in sorted(cache.items()):
+                if not isinstance(cache_value, dict):
+                    continue
+                cached_provider_name = cache_value.get("provider_name")
+                cached_bin_name = cache_value.get("bin_name")
+                cached_abspath = cache_value.get("abspath")
+                cache_kind = cache_value.get("cache_kind")
+                if (
+                    not isinstance(cached_provider_name, str)
+                    or not isinstance(cached_bin_name, str)
+                    or not isinstance(cached_abspath, str)
+                ):
+                    try:
+                        cached_provider_name, cached_bin_name, cached_abspath = (
+                            json.loads(
+                                cache_key,
+                            )
+                        )
+                    except (TypeError, ValueError):
+                        continue
+                if cached_provider_name != self.name or not isinstance(
+                    cached_abspath, str
+                ):
+                    continue
+                if not isinstance(cache_kind, str):
+                    cache_kind = (
+                        "dependency"
+                        if str(cached_bin_name) == str(self.INSTALLER_BIN)
+                        else "binary"
                     )
-                except Exception:
+                if cache_kind != "dependency":
                     continue
-            if cached_provider_name != self.name or not isinstance(cached_abspath, str):
-                continue
-            if not isinstance(cache_kind, str):
-                cache_kind = (
-                    "dependency"
-                    if str(cached_bin_name) == str(self.INSTALLER_BIN)
-                    else "binary"
+                loaded = self.load_cached_binary(cached_bin_name, Path(cached_abspath))
+                if loaded is None or loaded.loaded_abspath is None:
+                    continue
+                resolved_provider = loaded.loaded_binprovider or self
+                dedupe_key = (
+                    loaded.name,
+                    str(loaded.loaded_abspath),
+                    resolved_provider.name,
+                )
+                if dedupe_key in seen:
+                    continue
+                seen.add(dedupe_key)
+                dependencies.append(
+                    loaded.model_copy(
+                        update={
+                            "loaded_binprovider": resolved_provider,
+                            "binproviders": [resolved_provider],
+                        },
+                    ),
                 )
-            if cache_kind != "dependency":
-                continue
-            loaded = self.load_cached_binary(cached_bin_name, Path(cached_abspath))
-            if loaded is None or loaded.loaded_abspath is None:
-                continue
-            resolved_provider = loaded.loaded_binprovider or self
-            dedupe_key = (
-                loaded.name,
-                str(loaded.loaded_abspath),
-                resolved_provider.name,
-            )
-            if dedupe_key in seen:
-                continue
-            seen.add(dedupe_key)
-            dependencies.append(
-                ShallowBinary.model_validate(
-                    {
-                        "name": loaded.name,
-                        "description": loaded.description,
-                        "binprovider": resolved_provider,
-                        "abspath": loaded.loaded_abspath,
-                        "version": loaded.loaded_version,
-                        "sha256": loaded.loaded_sha256,
-                        "mtime": loaded.loaded_mtime,
-                        "euid": loaded.loaded_euid,
-                        "binproviders": [resolved_provider],
-                        "overrides": loaded.overrides,
-                    },
-                ),
-            )
         return dependencies
 
     @log_method_call(include_result=True)
@@ -1436,62 +2343,59 @@ class BinProvider(BaseModel):
         cache = load_derived_cache(derived_env_path)
         binaries: list[ShallowBinary] = []
         seen: set[tuple[str, str, str]] = set()
-        for cache_key, cache_value in sorted(cache.items()):
-            if not isinstance(cache_value, dict):
-                continue
-            cached_provider_name = cache_value.get("provider_name")
-            cached_bin_name = cache_value.get("bin_name")
-            cached_abspath = cache_value.get("abspath")
-            cache_kind = cache_value.get("cache_kind")
-            if (
-                not isinstance(cached_provider_name, str)
-                or not isinstance(cached_bin_name, str)
-                or not isinstance(cached_abspath, str)
-            ):
-                try:
-                    cached_provider_name, cached_bin_name, cached_abspath = json.loads(
-                        cache_key,
+        with self.cache_batch():
+            for cache_key, cache_value in sorted(cache.items()):
+                if not isinstance(cache_value, dict):
+                    continue
+                cached_provider_name = cache_value.get("provider_name")
+                cached_bin_name = cache_value.get("bin_name")
+                cached_abspath = cache_value.get("abspath")
+                cache_kind = cache_value.get("cache_kind")
+                if (
+                    not isinstance(cached_provider_name, str)
+                    or not isinstance(cached_bin_name, str)
+                    or not isinstance(cached_abspath, str)
+                ):
+                    try:
+                        cached_provider_name, cached_bin_name, cached_abspath = (
+                            json.loads(
+                                cache_key,
+                            )
+                        )
+                    except (TypeError, ValueError):
+                        continue
+                if cached_provider_name != self.name or not isinstance(
+                    cached_abspath, str
+                ):
+                    continue
+                if not isinstance(cache_kind, str):
+                    cache_kind = (
+                        "dependency"
+                        if str(cached_bin_name) == str(self.INSTALLER_BIN)
+                        else "binary"
                     )
-                except Exception:
+                if cache_kind != "binary":
                     continue
-            if cached_provider_name != self.name or not isinstance(cached_abspath, str):
-                continue
-            if not isinstance(cache_kind, str):
-                cache_kind = (
-                    "dependency"
-                    if str(cached_bin_name) == str(self.INSTALLER_BIN)
-                    else "binary"
+                loaded = self.load_cached_binary(cached_bin_name, Path(cached_abspath))
+                if loaded is None or loaded.loaded_abspath is None:
+                    continue
+                resolved_provider = loaded.loaded_binprovider or self
+                dedupe_key = (
+                    loaded.name,
+                    str(loaded.loaded_abspath),
+                    resolved_provider.name,
+                )
+                if dedupe_key in seen:
+                    continue
+                seen.add(dedupe_key)
+                binaries.append(
+                    loaded.model_copy(
+                        update={
+                            "loaded_binprovider": resolved_provider,
+                            "binproviders": [resolved_provider],
+                        },
+                    ),
                 )
-            if cache_kind != "binary":
-                continue
-            loaded = self.load_cached_binary(cached_bin_name, Path(cached_abspath))
-            if loaded is None or loaded.loaded_abspath is None:
-                continue
-            resolved_provider = loaded.loaded_binprovider or self
-            dedupe_key = (
-                loaded.name,
-                str(loaded.loaded_abspath),
-                resolved_provider.name,
-            )
-            if dedupe_key in seen:
-                continue
-            seen.add(dedupe_key)
-            binaries.append(
-                ShallowBinary.model_validate(
-                    {
-                        "name": loaded.name,
-                        "description": loaded.description,
-                        "binprovider": resolved_provider,
-                        "abspath": loaded.loaded_abspath,
-                        "version": loaded.loaded_version,
-                        "sha256": loaded.loaded_sha256,
-                        "mtime": loaded.loaded_mtime,
-                        "euid": loaded.loaded_euid,
-                        "binproviders": [resolved_provider],
-                        "overrides": loaded.overrides,
-                    },
-                ),
-            )
         return binaries
 
     def setup_PATH(self, no_cache: bool = False) -> None:
@@ -1518,16 +2422,12 @@ class BinProvider(BaseModel):
         PATH: str | None = None,
         prepend: bool = False,
     ) -> PATHStr:
-        new_entries = [str(entry) for entry in entries if str(entry)]
-        existing_entries = [entry for entry in (PATH or "").split(":") if entry]
-        merged_entries = (
-            [*new_entries, *existing_entries]
-            if prepend
-            else [*existing_entries, *new_entries]
-        )
-        return TypeAdapter(PATHStr).validate_python(
-            ":".join(dict.fromkeys(merged_entries)),
-        )
+        path_entries = PATHEntries(PATH)
+        if prepend:
+            path_entries.prepend(*entries)
+        else:
+            path_entries.append(*entries)
+        return TypeAdapter(PATHStr).validate_python(path_entries)
 
     def _version_from_exec(
         self,
@@ -1543,14 +2443,31 @@ class BinProvider(BaseModel):
         validation_err = None
         version_outputs: list[str] = []
 
-        for version_arg in ("--version", "-version", "-v"):
+        # try the flag that worked last time for this exact file first, so
+        # tools that only answer -version/-v cost one process instead of three
+        learned = self._load_version_flag(abspath)
+        version_args = list(VERSION_FLAGS)
+        if learned is not None:
+            version_args.remove(learned[0])
+            version_args.insert(0, learned[0])
+
+        for version_arg in version_args:
             proc = self.exec(
                 bin_name=abspath,
                 cmd=[version_arg],
                 timeout=timeout,
                 quiet=True,
             )
-            version_output = proc.stdout.strip() or proc.stderr.strip()
+            stream_outputs = {
+                "stdout": proc.stdout.strip(),
+                "stderr": proc.stderr.strip(),
+            }
+            stream = "stdout" if stream_outputs["stdout"] else "stderr"
+            if learned is not None and learned[0] == version_arg:
+                if stream_outputs[learned[1]]:
+                    stream = learned[1]
+                learned = None
+            version_output = stream_outputs[stream]
             version_outputs.append(version_output)
             if proc.returncode != 0:
                 validation_err = validation_err or AssertionError(
@@ -1562,6 +2479,7 @@ class BinProvider(BaseModel):
                 assert version, (
                     f"❌ Could not parse version from $ {bin_name} {version_arg}: {version_output}".strip()
                 )
+                self._write_version_flag(abspath, version_arg, stream)
                 return version
             except (ValidationError, AssertionError) as err:
                 validation_err = validation_err or err
@@ -1570,6 +2488,76 @@ class BinProvider(BaseModel):
             f"❌ Unable to find {bin_name} version from {bin_name} --version, -version or -v output\n{next((output for output in version_outputs if output), '')}".strip(),
         ) from validation_err
 
+    def _version_flag_lookup(
+        self,
+        abspath: HostBinPath | Path,
+    ) -> tuple[str, dict[str, object], Path | None, str] | None:
+        """Return (memo key, fingerprint record, cache path, cache key) for the
+        learned version flag of ``abspath``, or None if it can't be stat'd.
+        The flag is persisted in the probe cache if enabled, else derived.env."""
+        fingerprinted = binary_fingerprint(abspath)
+        if fingerprinted is None:
+            return None
+        resolved_abspath, fingerprint = fingerprinted
+        cache_key = json.dumps(
+            ["version_flag", str(resolved_abspath)],
+            separators=(",", ":"),
+        )
+        cache_path = self.probe_cache_path or self.derived_env_path
+        return str(resolved_abspath), fingerprint, cache_path, cache_key
+
+    def _load_version_flag(
+        self,
+        abspath: HostBinPath | Path,
+    ) -> tuple[str, Literal["stdout", "stderr"]] | None:
+        lookup = self._version_flag_lookup(abspath)
+        if lookup is None:
+            return None
+        memo_key, fingerprint, cache_path, cache_key = lookup
+        with _VERSION_FLAGS_LOCK:
+            cached_record = _VERSION_FLAGS.get(memo_key)
+        if cached_record is None and cache_path is not None:
+            cached_record = load_derived_cache_record(cache_path, cache_key)
+        if not cached_record or any(
+            cached_record.get(key) != value for key, value in fingerprint.items()
+        ):
+            return None
+        version_arg = cached_record.get("version_arg")
+        stream = cached_record.get("stream")
+        if version_arg not in VERSION_FLAGS or stream not in ("stdout", "stderr"):
+            return None
+        return cast(str, version_arg), cast(Literal["stdout", "stderr"], stream)
+
+    def _write_version_flag(
+        self,
+        abspath: HostBinPath | Path,
+        version_arg: str,
+        stream: str,
+    ) -> None:
+        lookup = self._version_flag_lookup(abspath)
+        if lookup is None:
+            return
+        memo_key, fingerprint, cache_path, cache_key = lookup
+        record = {**fingerprint, "version_arg": version_arg, "stream": stream}
+        # binaries answering the first flag already cost one process, only
+        # remember them when replacing an outdated record for the same path
+        learned_default = version_arg == VERSION_FLAGS[0]
+        with _VERSION_FLAGS_LOCK:
+            memo_record = _VERSION_FLAGS.get(memo_key)
+            if memo_record == record:
+                return
+            if memo_record is not None or not learned_default:
+                _VERSION_FLAGS[memo_key] = record
+        if cache_path is None or not cache_path.parent.is_dir():
+            return
+        cached_record = load_derived_cache_record(cache_path, cache_key)
+        if cached_record == record or (learned_default and cached_record is None):
+            return
+        try:
+            upsert_derived_cache_record(cache_path, cache_key, record)
+        except OSError as err:
+            logger.debug("Skipping version flag cache write for %s: %s", abspath, err)
+
     def _ensure_writable_cache_dir(self, cache_dir: Path) -> bool:
         if cache_dir.exists() and not cache_dir.is_dir():
             return False
@@ -1616,16 +2604,65 @@ class BinProvider(BaseModel):
             output=format_subprocess_output(proc.stdout, proc.stderr),
         )
 
-    # @validate_call
-    def exec(
+    def _exec_envs(
+        self,
+        cwd_path: Path,
+        target_pw_record: pwd.struct_passwd,
+        current_pw_record: pwd.struct_passwd,
+        explicit_env: Mapping[str, str] | None = None,
+    ) -> tuple[dict[str, str], dict[str, str]]:
+        """Return the (sudo, fallback) subprocess envs for exec().
+
+        Memoized per provider until os.environ, PATH, ENV, the cwd or either
+        identity changes. Callers must not mutate the returned dicts. An
+        explicit ``env=`` is never cached.
+        """
+        cache_key = None
+        if explicit_env is None:
+            self.setup_PATH()
+            cache_key = (
+                tuple(os.environ.items()),
+                self.PATH,
+                tuple(self.ENV.items()),
+                str(cwd_path),
+                target_pw_record,
+                current_pw_record,
+            )
+            cached_envs = (self._exec_env_cache or {}).get(cache_key)
+            if cached_envs is not None:
+                return cached_envs
+
+        base_env = self.build_exec_env(
+            providers=[self],
+            base_env=explicit_env,
+        )
+        base_env["PWD"] = str(cwd_path)
+
+        def _env_for_identity(identity: pwd.struct_passwd) -> dict[str, str]:
+            env = base_env.copy()
+            env["HOME"] = identity.pw_dir
+            env["LOGNAME"] = identity.pw_name
+            env["USER"] = identity.pw_name
+            return env
+
+        envs = (
+            _env_for_identity(target_pw_record),
+            _env_for_identity(current_pw_record),
+        )
+        if cache_key is not None:
+            if self._exec_env_cache is None or len(self._exec_env_cache) >= 32:
+                self._exec_env_cache = {}
+            self._exec_env_cache[cache_key] = envs
+        return envs
+
+    def _exec_cmd(
         self,
         bin_name: BinName | HostBinPath,
-        cmd: Iterable[str | Path | int | float | bool] = (),
-        cwd: Path | str = ".",
-        quiet=False,
-        should_log_command: bool = True,
-        **kwargs,
-    ) -> subprocess.CompletedProcess:
+        cmd: Iterable[str | Path | int | float | bool],
+        cwd: Path | str,
+    ) -> tuple[list[str], Path]:
+        """Return the argv (starting with bin_name's abspath) and resolved cwd
+        that exec()/popen() run."""
         explicit_abspath = Path(str(bin_name)).expanduser()
         if (
             explicit_abspath.is_absolute()
@@ -1641,8 +2678,101 @@ class BinProvider(BaseModel):
         assert os.access(cwd, os.R_OK) and os.path.isdir(cwd), (
             f"cwd must be a valid, accessible directory: {cwd}"
         )
-        cwd_path = Path(cwd).resolve()
-        cmd = [str(bin_abspath), *(str(arg) for arg in cmd)]
+        return [str(bin_abspath), *(str(arg) for arg in cmd)], Path(cwd).resolve()
+
+    def _exec_identity(
+        self,
+        cwd_path: Path,
+        explicit_env: Mapping[str, str] | None = None,
+    ) -> tuple[
+        list[str] | None,
+        str | None,
+        dict[str, str],
+        dict[str, str],
+        Callable[[], None],
+    ]:
+        """Return how exec()/popen() run a command as this provider's EUID:
+        (``sudo -n [-u user] --`` prefix or None if sudo can't be used, why
+        sudo was unusable, env for the sudo command, env for the direct
+        fallback, preexec_fn dropping the fallback to the target uid/gid)."""
+        # https://stackoverflow.com/a/6037494/2156113
+        # copy env and modify it to run the subprocess as the the designated user
+        current_euid = os.geteuid()
+        target_pw_record = self.get_pw_record(self.EUID)
+        current_pw_record = self.get_pw_record(current_euid)
+        run_as_uid = target_pw_record.pw_uid
+        run_as_gid = target_pw_record.pw_gid
+        sudo_env, fallback_env = self._exec_envs(
+            cwd_path,
+            target_pw_record,
+            current_pw_record,
+            explicit_env=explicit_env,
+        )
+
+        def drop_privileges():
+            try:
+                os.setuid(run_as_uid)
+                os.setgid(run_as_gid)
+            except Exception:
+                pass
+
+        sudo_prefix = None
+        sudo_failure_output = None
+        if current_euid != 0 and run_as_uid != current_euid:
+            sudo_abspath = shutil.which("sudo", path=sudo_env["PATH"]) or shutil.which(
+                "sudo",
+            )
+            sudo_works, sudo_failure_output = (
+                sudo_capability(
+                    sudo_abspath,
+                    target_pw_record.pw_name if run_as_uid != 0 else None,
+                    sudo_env,
+                )
+                if sudo_abspath
+                else (False, None)
+            )
+            if sudo_abspath and sudo_works:
+                sudo_prefix = [sudo_abspath, "-n"]
+                if run_as_uid != 0:
+                    sudo_prefix.extend(["-u", target_pw_record.pw_name])
+                sudo_prefix.append("--")
+        return sudo_prefix, sudo_failure_output, sudo_env, fallback_env, drop_privileges
+
+    def popen(
+        self,
+        bin_name: BinName | HostBinPath,
+        cmd: Iterable[str | Path | int | float | bool] = (),
+        cwd: Path | str = ".",
+        **kwargs,
+    ) -> subprocess.Popen:
+        """Start ``bin_name`` as a long-lived subprocess (e.g. a helper that
+        answers requests over stdin/stdout) as the same user and with the same
+        HOME, PATH, ENV and cwd that exec() would run it with. Extra kwargs
+        are passed to subprocess.Popen."""
+        cmd, cwd_path = self._exec_cmd(bin_name, cmd, cwd)
+        sudo_prefix, _, sudo_env, fallback_env, drop_privileges = self._exec_identity(
+            cwd_path, explicit_env=kwargs.pop("env", None)
+        )
+        if sudo_prefix is not None:
+            cmd = [*sudo_prefix, *cmd]
+            kwargs.update(env=sudo_env)
+        else:
+            kwargs.update(env=fallback_env, preexec_fn=drop_privileges)
+        count_subprocess()
+        return subprocess.Popen(cmd, cwd=str(cwd_path), **kwargs)
+
+    # @validate_call
+    @timed_method
+    def exec(
+        self,
+        bin_name: BinName | HostBinPath,
+        cmd: Iterable[str | Path | int | float | bool] = (),
+        cwd: Path | str = ".",
+        quiet=False,
+        should_log_command: bool = True,
+        **kwargs,
+    ) -> subprocess.CompletedProcess:
+        cmd, cwd_path = self._exec_cmd(bin_name, cmd, cwd)
         is_version_probe = len(cmd) == 2 and cmd[1] in {"--version", "-version", "-v"}
         exec_log_prefix = ACTIVE_EXEC_LOG_PREFIX.get()
         if should_log_command:
@@ -1661,78 +2791,59 @@ class BinProvider(BaseModel):
                     format_command(cmd),
                 )
 
-        # https://stackoverflow.com/a/6037494/2156113
-        # copy env and modify it to run the subprocess as the the designated user
-        current_euid = os.geteuid()
         explicit_env = kwargs.pop("env", None)
-        base_env = self.build_exec_env(
-            providers=[self],
-            base_env=explicit_env,
-        )
-        base_env["PWD"] = str(cwd_path)
-        target_pw_record = self.get_pw_record(self.EUID)
-        current_pw_record = self.get_pw_record(current_euid)
-        run_as_uid = target_pw_record.pw_uid
-        run_as_gid = target_pw_record.pw_gid
-
-        def _env_for_identity(
-            identity: Any,
-            *,
-            source_env: dict[str, str],
-        ) -> dict[str, str]:
-            env = source_env.copy()
-            env["HOME"] = identity.pw_dir
-            env["LOGNAME"] = identity.pw_name
-            env["USER"] = identity.pw_name
-            return env
-
-        sudo_env = _env_for_identity(target_pw_record, source_env=base_env)
-        fallback_env = _env_for_identity(current_pw_record, source_env=base_env)
-
-        def drop_privileges():
-            try:
-                os.setuid(run_as_uid)
-                os.setgid(run_as_gid)
-            except Exception:
-                pass
-
         if self.dry_run and not is_version_probe:
             return subprocess.CompletedProcess(cmd, 0, "", "skipped (dry run)")
 
         kwargs.setdefault("capture_output", True)
         kwargs.setdefault("text", True)
 
-        sudo_failure_output = None
-        if current_euid != 0 and run_as_uid != current_euid:
-            sudo_abspath = shutil.which("sudo", path=sudo_env["PATH"]) or shutil.which(
-                "sudo",
+        # install/update/uninstall commands can run for minutes: stream their
+        # output to the log as it arrives and keep only its tail in memory
+        run = run_subprocess
+        if (
+            exec_log_prefix is not None
+            and not is_version_probe
+            and kwargs["capture_output"] is True
+            and kwargs["text"] is True
+            and kwargs.keys() <= STREAMING_SUBPROCESS_KWARGS
+        ):
+            trace_depth = TRACE_DEPTH.get()
+            run = functools.partial(
+                run_subprocess_streaming,
+                on_line=lambda stream, line: emit_exec_output_line(
+                    stream,
+                    line,
+                    trace_depth,
+                ),
+                stall_timeout=self.stall_timeout,
+            )
+
+        sudo_prefix, sudo_failure_output, sudo_env, fallback_env, drop_privileges = (
+            self._exec_identity(cwd_path, explicit_env=explicit_env)
+        )
+        if sudo_prefix is not None:
+            sudo_proc = run(
+                [*sudo_prefix, *cmd],
+                cwd=str(cwd_path),
+                env=sudo_env,
+                **kwargs,
+            )
+            if sudo_proc.returncode == 0:
+                return sudo_proc
+            log_subprocess_output(
+                logger,
+                f"{self.__class__.__name__} sudo exec",
+                sudo_proc.stdout,
+                sudo_proc.stderr,
+                level=py_logging.DEBUG,
+            )
+            sudo_failure_output = format_subprocess_output(
+                sudo_proc.stdout,
+                sudo_proc.stderr,
             )
-            if sudo_abspath:
-                sudo_cmd = [sudo_abspath, "-n"]
-                if run_as_uid != 0:
-                    sudo_cmd.extend(["-u", target_pw_record.pw_name])
-                sudo_cmd.extend(["--", *cmd])
-                sudo_proc = subprocess.run(
-                    sudo_cmd,
-                    cwd=str(cwd_path),
-                    env=sudo_env,
-                    **kwargs,
-                )
-                if sudo_proc.returncode == 0:
-                    return sudo_proc
-                log_subprocess_output(
-                    logger,
-                    f"{self.__class__.__name__} sudo exec",
-                    sudo_proc.stdout,
-                    sudo_proc.stderr,
-                    level=py_logging.DEBUG,
-                )
-                sudo_failure_output = format_subprocess_output(
-                    sudo_proc.stdout,
-                    sudo_proc.stderr,
-                )
 
-        proc = subprocess.run(
+        proc = run(
             cmd,
             cwd=str(cwd_path),
             env=fallback_env,
@@ -1778,6 +2889,72 @@ class BinProvider(BaseModel):
 
         return abspaths
 
+    @property
+    def probe_cache_path(self) -> Path | None:
+        """Where to persist version/sha256 probe results across processes, or
+        None to always re-probe. Only providers whose probes depend purely on
+        the binary's own file contents should enable this (see EnvProvider)."""
+        return None
+
+    def _probe_cache_lookup(
+        self,
+        abspath: HostBinPath | Path,
+    ) -> tuple[Path, str, dict[str, object]] | None:
+        """Return (cache path, cache key, fingerprint record) for ``abspath``,
+        or None if probe caching is disabled or the file can't be stat'd."""
+        probe_cache_path = self.probe_cache_path
+        if probe_cache_path is None:
+            return None
+        fingerprinted = binary_fingerprint(abspath)
+        if fingerprinted is None:
+            return None
+        resolved_abspath, fingerprint = fingerprinted
+        cache_key = json.dumps(
+            ["probe", str(resolved_abspath)],
+            separators=(",", ":"),
+        )
+        return probe_cache_path, cache_key, fingerprint
+
+    def _load_probe_cache(
+        self,
+        abspath: HostBinPath | Path,
+        field: Literal["version", "sha256"],
+    ) -> str | None:
+        lookup = self._probe_cache_lookup(abspath)
+        if lookup is None:
+            return None
+        probe_cache_path, cache_key, fingerprint = lookup
+        cached_record = load_derived_cache_record(probe_cache_path, cache_key)
+        if not cached_record or any(
+            cached_record.get(key) != value for key, value in fingerprint.items()
+        ):
+            return None
+        cached_value = cached_record.get(field)
+        return cached_value if isinstance(cached_value, str) else None
+
+    def _write_probe_cache(
+        self,
+        abspath: HostBinPath | Path,
+        field: Literal["version", "sha256"],
+        value: str,
+    ) -> None:
+        lookup = self._probe_cache_lookup(abspath)
+        if lookup is None:
+            return
+        probe_cache_path, cache_key, fingerprint = lookup
+        cached_record = load_derived_cache_record(probe_cache_path, cache_key) or {}
+        if any(cached_record.get(key) != value for key, value in fingerprint.items()):
+            # binary changed since the last probe, drop the stale values
+            cached_record = {}
+        try:
+            upsert_derived_cache_record(
+                probe_cache_path,
+                cache_key,
+                {**cached_record, **fingerprint, field: value},
+            )
+        except OSError as err:
+            logger.debug("Skipping probe cache write for %s: %s", abspath, err)
+
     @final
     @binprovider_cache
     # @validate_call
@@ -1794,11 +2971,17 @@ class BinProvider(BaseModel):
         if not abspath or not os.access(abspath, os.R_OK):
             return None
 
-        hash_sha256 = hashlib.sha256()
+        cached_sha256 = self._load_probe_cache(abspath, "sha256")
+        if cached_sha256 is not None:
+            return TypeAdapter(Sha256).validate_python(cached_sha256)
+
+        # file_digest() reads into one large reusable buffer, much faster than
+        # small read() chunks for 100MB+ browser binaries
         with open(abspath, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_sha256.update(chunk)
-        return TypeAdapter(Sha256).validate_python(hash_sha256.hexdigest())
+            hash_sha256 = hashlib.file_digest(f, "sha256")
+        sha256 = TypeAdapter(Sha256).validate_python(hash_sha256.hexdigest())
+        self._write_probe_cache(abspath, "sha256", str(sha256))
+        return sha256
 
     @final
     @binprovider_cache
@@ -1845,6 +3028,21 @@ class BinProvider(BaseModel):
         quiet: bool = False,
         no_cache: bool = False,
     ) -> SemVer | None:
+        # persisted probe results are only trusted for the provider's own
+        # default version handler, custom overrides may not depend on the file
+        use_probe_cache = (
+            abspath is not None
+            and self.probe_cache_path is not None
+            and self._get_handler_for_action(bin_name, "version")
+            == getattr(self, "default_version_handler", None)
+        )
+        if use_probe_cache:
+            cached_version = SemVer.parse(
+                self._load_probe_cache(cast(HostBinPath, abspath), "version") or "",
+            )
+            if cached_version:
+                return cached_version
+
         version = None
         try:
             version = cast(
@@ -1894,6 +3092,8 @@ class BinProvider(BaseModel):
         if not isinstance(version, SemVer):
             version = SemVer.parse(version)
 
+        if version and use_probe_cache:
+            self._write_probe_cache(cast(HostBinPath, abspath), "version", str(version))
         return version
 
     @final
@@ -1965,6 +3165,65 @@ class BinProvider(BaseModel):
     ) -> bool:
         return False
 
+    def supports_batch_install(self) -> bool:
+        """Whether default_install_handler can install several binaries' merged
+        install_args in a single installer invocation (see install_many())."""
+        return False
+
+    def _resolve_security_options(
+        self,
+        action: Literal["install", "update"],
+        *,
+        postinstall_scripts: bool | None,
+        min_release_age: float | None,
+        no_cache: bool = False,
+    ) -> tuple[bool, float]:
+        """Fill in provider/action defaults for the security kwargs, warning
+        about (and dropping) values this provider can't enforce."""
+        postinstall_scripts = (
+            self.postinstall_scripts
+            if postinstall_scripts is None
+            else postinstall_scripts
+        )
+        min_release_age = (
+            self.min_release_age if min_release_age is None else min_release_age
+        )
+        if postinstall_scripts is None:
+            postinstall_scripts = not self.supports_postinstall_disable(
+                action,
+                no_cache=no_cache,
+            )
+        if min_release_age is None:
+            min_release_age = (
+                7.0 if self.supports_min_release_age(action, no_cache=no_cache) else 0.0
+            )
+        if (
+            min_release_age is not None
+            and min_release_age > 0
+            and not self.supports_min_release_age(action, no_cache=no_cache)
+        ):
+            logger.warning(
+                "⚠️ %s.%s ignoring unsupported min_release_age=%s for provider %s",
+                self.__class__.__name__,
+                action,
+                min_release_age,
+                self.name,
+            )
+            min_release_age = 0.0
+        if postinstall_scripts is False and not self.supports_postinstall_disable(
+            action,
+            no_cache=no_cache,
+        ):
+            logger.warning(
+                "⚠️ %s.%s ignoring unsupported postinstall_scripts=%s for provider %s",
+                self.__class__.__name__,
+                action,
+                postinstall_scripts,
+                self.name,
+            )
+            postinstall_scripts = True
+        return postinstall_scripts, min_release_age
+
     def _assert_min_version_satisfied(
         self,
         *,
@@ -2000,53 +3259,21 @@ class BinProvider(BaseModel):
                 min_release_age=min_release_age,
                 min_version=min_version,
             )
-        postinstall_scripts = (
-            self.postinstall_scripts
-            if postinstall_scripts is None
-            else postinstall_scripts
-        )
-        min_release_age = (
-            self.min_release_age if min_release_age is None else min_release_age
-        )
-        if postinstall_scripts is None:
-            postinstall_scripts = not self.supports_postinstall_disable(
-                "install",
-                no_cache=no_cache,
-            )
-        if min_release_age is None:
-            min_release_age = (
-                7.0
-                if self.supports_min_release_age("install", no_cache=no_cache)
-                else 0.0
-            )
         # Warn about unsupported security flags early (before load/install)
         # so warnings fire even when the binary is already cached.
-        if (
-            min_release_age is not None
-            and min_release_age > 0
-            and not self.supports_min_release_age("install", no_cache=no_cache)
-        ):
-            logger.warning(
-                "⚠️ %s.install ignoring unsupported min_release_age=%s for provider %s",
-                self.__class__.__name__,
-                min_release_age,
-                self.name,
-            )
-            min_release_age = 0.0
-        if postinstall_scripts is False and not self.supports_postinstall_disable(
+        postinstall_scripts, min_release_age = self._resolve_security_options(
             "install",
+            postinstall_scripts=postinstall_scripts,
+            min_release_age=min_release_age,
             no_cache=no_cache,
-        ):
-            logger.warning(
-                "⚠️ %s.install ignoring unsupported postinstall_scripts=%s for provider %s",
-                self.__class__.__name__,
-                postinstall_scripts,
-                self.name,
-            )
-            postinstall_scripts = True
+        )
         if not no_cache:
             try:
-                installed = self.load(bin_name=bin_name, quiet=True, no_cache=False)
+                installed = self.load_cached(bin_name) or self.load(
+                    bin_name=bin_name,
+                    quiet=True,
+                    no_cache=False,
+                )
             except Exception:
                 installed = None
             if (
@@ -2089,68 +3316,29 @@ class BinProvider(BaseModel):
                 )
             return result
 
-        install_args = self.get_install_args(bin_name, quiet=quiet, no_cache=no_cache)
-        self.setup(
-            postinstall_scripts=postinstall_scripts,
-            min_release_age=min_release_age,
-            min_version=min_version,
-            no_cache=no_cache,
-        )
-
-        self.setup_PATH(no_cache=no_cache)
-        install_log = None
-        exec_log_prefix_token = ACTIVE_EXEC_LOG_PREFIX.set(
-            f"⛟  Installing {bin_name} via {self.name}...",
-        )
-        logger.info(ACTIVE_EXEC_LOG_PREFIX.get())
-        try:
-            install_log = cast(
-                InstallFuncReturnValue,
-                self._call_handler_for_action(
-                    bin_name=bin_name,
-                    handler_type="install",
-                    install_args=install_args,
-                    packages=install_args,
-                    no_cache=no_cache,
-                    postinstall_scripts=postinstall_scripts,
-                    min_release_age=min_release_age,
-                    min_version=min_version,
-                    timeout=self.install_timeout,
-                ),
+        with self._install_lock():
+            install_args = self.get_install_args(
+                bin_name, quiet=quiet, no_cache=no_cache
             )
-        except Exception as err:
-            install_log = f"❌ {self.__class__.__name__} Failed to install {bin_name}, got {err.__class__.__name__}: {err}"
-            if not quiet:
-                raise
-        finally:
-            ACTIVE_EXEC_LOG_PREFIX.reset(exec_log_prefix_token)
-
-        if self.dry_run:
-            # return fake ShallowBinary if we're just doing a dry run
-            # no point trying to get real abspath or version if nothing was actually installed
-            return ShallowBinary.model_construct(
-                name=bin_name,
-                description=bin_name,
-                loaded_binprovider=self,
-                loaded_abspath=UNKNOWN_ABSPATH,
-                loaded_version=UNKNOWN_VERSION,
-                loaded_sha256=UNKNOWN_SHA256,
-                loaded_mtime=UNKNOWN_MTIME,
-                loaded_euid=UNKNOWN_EUID,
-                binproviders=[self],
+            self.setup(
+                postinstall_scripts=postinstall_scripts,
+                min_release_age=min_release_age,
+                min_version=min_version,
+                no_cache=no_cache,
             )
 
-        self.invalidate_cache(bin_name)
-
-        result = self.load(bin_name, quiet=True, no_cache=no_cache)
-        if result is None:
-            rollback_output = ""
+            self.setup_PATH(no_cache=no_cache)
+            install_log = None
+            exec_log_prefix_token = ACTIVE_EXEC_LOG_PREFIX.set(
+                f"⛟  Installing {bin_name} via {self.name}...",
+            )
+            logger.info(ACTIVE_EXEC_LOG_PREFIX.get())
             try:
-                rollback_result = cast(
-                    ActionFuncReturnValue,
+                install_log = cast(
+                    InstallFuncReturnValue,
                     self._call_handler_for_action(
                         bin_name=bin_name,
-                        handler_type="uninstall",
+                        handler_type="install",
                         install_args=install_args,
                         packages=install_args,
                         no_cache=no_cache,
@@ -2160,36 +3348,214 @@ class BinProvider(BaseModel):
                         timeout=self.install_timeout,
                     ),
                 )
-                if isinstance(rollback_result, str):
-                    rollback_output = rollback_result
             except Exception as err:
-                rollback_output = (
-                    f"Rollback after failed install also failed with "
-                    f"{err.__class__.__name__}: {err}"
+                install_log = f"❌ {self.__class__.__name__} Failed to install {bin_name}, got {err.__class__.__name__}: {err}"
+                if not quiet:
+                    raise
+            finally:
+                ACTIVE_EXEC_LOG_PREFIX.reset(exec_log_prefix_token)
+
+            if self.dry_run:
+                # return fake ShallowBinary if we're just doing a dry run
+                # no point trying to get real abspath or version if nothing was actually installed
+                return ShallowBinary.model_construct(
+                    name=bin_name,
+                    description=bin_name,
+                    loaded_binprovider=self,
+                    loaded_abspath=UNKNOWN_ABSPATH,
+                    loaded_version=UNKNOWN_VERSION,
+                    loaded_sha256=UNKNOWN_SHA256,
+                    loaded_mtime=UNKNOWN_MTIME,
+                    loaded_euid=UNKNOWN_EUID,
+                    binproviders=[self],
                 )
+
             self.invalidate_cache(bin_name)
-            if not quiet:
-                install_output = (
-                    f"Installed package did not produce runnable binary {bin_name!r}."
-                )
-                if install_log:
-                    install_output += f"\n{install_log}"
-                if rollback_output:
-                    install_output += f"\n{rollback_output}"
-                raise BinProviderInstallError(
-                    self.__class__.__name__,
-                    install_args,
-                    output=install_output,
+            self.bin_index(refresh=True)
+
+            result = self.load(bin_name, quiet=True, no_cache=no_cache)
+            if result is None:
+                rollback_output = ""
+                try:
+                    rollback_result = cast(
+                        ActionFuncReturnValue,
+                        self._call_handler_for_action(
+                            bin_name=bin_name,
+                            handler_type="uninstall",
+                            install_args=install_args,
+                            packages=install_args,
+                            no_cache=no_cache,
+                            postinstall_scripts=postinstall_scripts,
+                            min_release_age=min_release_age,
+                            min_version=min_version,
+                            timeout=self.install_timeout,
+                        ),
+                    )
+                    if isinstance(rollback_result, str):
+                        rollback_output = rollback_result
+                except Exception as err:
+                    rollback_output = (
+                        f"Rollback after failed install also failed with "
+                        f"{err.__class__.__name__}: {err}"
+                    )
+                self.invalidate_cache(bin_name)
+                if not quiet:
+                    install_output = f"Installed package did not produce runnable binary {bin_name!r}."
+                    if install_log:
+                        install_output += f"\n{install_log}"
+                    if rollback_output:
+                        install_output += f"\n{rollback_output}"
+                    raise BinProviderInstallError(
+                        self.__class__.__name__,
+                        install_args,
+                        output=install_output,
+                    )
+                return None
+            if result is not None:
+                self._assert_min_version_satisfied(
+                    bin_name=bin_name,
+                    action="install",
+                    loaded_version=result.loaded_version,
+                    min_version=min_version,
                 )
-            return None
-        if result is not None:
-            self._assert_min_version_satisfied(
-                bin_name=bin_name,
-                action="install",
-                loaded_version=result.loaded_version,
+            return result
+
+    @final
+    @log_method_call(include_result=True)
+    @validate_call
+    def install_many(
+        self,
+        bin_names: list[BinName],
+        quiet: bool = False,
+        no_cache: bool = False,
+        dry_run: bool | None = None,
+        postinstall_scripts: bool | None = None,
+        min_release_age: float | None = None,
+        min_version: SemVer | None = None,
+        return_exceptions: bool = False,
+    ) -> list[ShallowBinary | Exception | None]:
+        """install() several binaries, returning the results in input order.
+
+        On providers where supports_batch_install(), the binaries that aren't
+        already installed and use the default install handler with plain
+        package install_args are installed with one merged installer call
+        (e.g. a single ``npm install a b c``) instead of one per binary, which
+        saves re-resolving the lockfile / registry metadata every time. Any
+        binary the batch didn't produce falls back to a normal install().
+        With ``return_exceptions``, a binary that fails to install gets the
+        exception in its slot instead of aborting the rest.
+        """
+        if dry_run is not None and dry_run != self.dry_run:
+            return self.get_provider_with_overrides(dry_run=dry_run).install_many(
+                bin_names=bin_names,
+                quiet=quiet,
+                no_cache=no_cache,
+                postinstall_scripts=postinstall_scripts,
+                min_release_age=min_release_age,
                 min_version=min_version,
+                return_exceptions=return_exceptions,
             )
-        return result
+
+        batched: dict[BinName, InstallArgs] = {}
+        if self.supports_batch_install() and not self.dry_run:
+            for bin_name in dict.fromkeys(bin_names):
+                if not no_cache and self.load(bin_name, quiet=True) is not None:
+                    continue
+                if self._get_handler_for_action(
+                    bin_name=bin_name,
+                    handler_type="install",
+                ) != getattr(self, "default_install_handler", None):
+                    continue
+                install_args = self.get_install_args(
+                    bin_name,
+                    quiet=True,
+                    no_cache=no_cache,
+                )
+                if install_args and not any(
+                    arg.startswith("-") for arg in install_args
+                ):
+                    batched[bin_name] = install_args
+
+        batch_installed: set[BinName] = set()
+        if len(batched) > 1:
+            merged_install_args = list(
+                dict.fromkeys(arg for args in batched.values() for arg in args),
+            )
+            with self._install_lock():
+                exec_log_prefix_token = ACTIVE_EXEC_LOG_PREFIX.set(
+                    f"⛟  Installing {', '.join(batched)} via {self.name}...",
+                )
+                logger.info(ACTIVE_EXEC_LOG_PREFIX.get())
+                try:
+                    resolved_postinstall_scripts, resolved_min_release_age = (
+                        self._resolve_security_options(
+                            "install",
+                            postinstall_scripts=postinstall_scripts,
+                            min_release_age=min_release_age,
+                            no_cache=no_cache,
+                        )
+                    )
+                    self.setup(
+                        postinstall_scripts=resolved_postinstall_scripts,
+                        min_release_age=resolved_min_release_age,
+                        min_version=min_version,
+                        no_cache=no_cache,
+                    )
+                    self.setup_PATH(no_cache=no_cache)
+                    self._call_handler_for_action(
+                        bin_name=next(iter(batched)),
+                        handler_type="install",
+                        install_args=merged_install_args,
+                        packages=merged_install_args,
+                        no_cache=no_cache,
+                        postinstall_scripts=resolved_postinstall_scripts,
+                        min_release_age=resolved_min_release_age,
+                        min_version=min_version,
+                        timeout=self.install_timeout,
+                    )
+                    batch_installed.update(batched)
+                except Exception as err:
+                    logger.debug(
+                        "Batch install of %s via %s failed, installing one at a time: %s",
+                        ", ".join(batched),
+                        self.name,
+                        err,
+                    )
+                finally:
+                    ACTIVE_EXEC_LOG_PREFIX.reset(exec_log_prefix_token)
+                for bin_name in batched:
+                    self.invalidate_cache(bin_name)
+                self.bin_index(refresh=True)
+
+        results: list[ShallowBinary | Exception | None] = []
+        for bin_name in bin_names:
+            result = None
+            try:
+                if bin_name in batch_installed:
+                    result = self.load(bin_name, quiet=True, no_cache=True)
+                    if result is not None:
+                        self._assert_min_version_satisfied(
+                            bin_name=bin_name,
+                            action="install",
+                            loaded_version=result.loaded_version,
+                            min_version=min_version,
+                        )
+                if result is None:
+                    result = self.install(
+                        bin_name,
+                        quiet=quiet,
+                        no_cache=no_cache,
+                        postinstall_scripts=postinstall_scripts,
+                        min_release_age=min_release_age,
+                        min_version=min_version,
+                    )
+            except Exception as err:
+                if not return_exceptions:
+                    raise
+                results.append(err)
+                continue
+            results.append(result)
+        return results
 
     @final
     @log_method_call(include_result=True)
@@ -2213,49 +3579,13 @@ class BinProvider(BaseModel):
                 min_release_age=min_release_age,
                 min_version=min_version,
             )
-        postinstall_scripts = (
-            self.postinstall_scripts
-            if postinstall_scripts is None
-            else postinstall_scripts
-        )
-        min_release_age = (
-            self.min_release_age if min_release_age is None else min_release_age
-        )
-        if postinstall_scripts is None:
-            postinstall_scripts = not self.supports_postinstall_disable(
-                "update",
-                no_cache=no_cache,
-            )
-        if min_release_age is None:
-            min_release_age = (
-                7.0
-                if self.supports_min_release_age("update", no_cache=no_cache)
-                else 0.0
-            )
-        install_args = self.get_install_args(bin_name, quiet=quiet, no_cache=no_cache)
-        if (
-            min_release_age is not None
-            and min_release_age > 0
-            and not self.supports_min_release_age("update", no_cache=no_cache)
-        ):
-            logger.warning(
-                "⚠️ %s.update ignoring unsupported min_release_age=%s for provider %s",
-                self.__class__.__name__,
-                min_release_age,
-                self.name,
-            )
-            min_release_age = 0.0
-        if postinstall_scripts is False and not self.supports_postinstall_disable(
+        postinstall_scripts, min_release_age = self._resolve_security_options(
             "update",
+            postinstall_scripts=postinstall_scripts,
+            min_release_age=min_release_age,
             no_cache=no_cache,
-        ):
-            logger.warning(
-                "⚠️ %s.update ignoring unsupported postinstall_scripts=%s for provider %s",
-                self.__class__.__name__,
-                postinstall_scripts,
-                self.name,
-            )
-            postinstall_scripts = True
+        )
+        install_args = self.get_install_args(bin_name, quiet=quiet, no_cache=no_cache)
 
         update_handler = self._get_handler_for_action(
             bin_name=bin_name,
@@ -2267,69 +3597,71 @@ class BinProvider(BaseModel):
         ):
             return None
 
-        self.setup(
-            postinstall_scripts=postinstall_scripts,
-            min_release_age=min_release_age,
-            min_version=min_version,
-            no_cache=no_cache,
-        )
-
-        self.setup_PATH(no_cache=no_cache)
-        update_log = None
-        exec_log_prefix_token = ACTIVE_EXEC_LOG_PREFIX.set(
-            f"⬆ Updating {bin_name} via {self.name}...",
-        )
-        logger.info(ACTIVE_EXEC_LOG_PREFIX.get())
-        try:
-            update_log = cast(
-                ActionFuncReturnValue,
-                self._call_handler_for_action(
-                    bin_name=bin_name,
-                    handler_type="update",
-                    install_args=install_args,
-                    packages=install_args,
-                    no_cache=no_cache,
-                    postinstall_scripts=postinstall_scripts,
-                    min_release_age=min_release_age,
-                    min_version=min_version,
-                    timeout=self.install_timeout,
-                ),
+        with self._install_lock():
+            self.setup(
+                postinstall_scripts=postinstall_scripts,
+                min_release_age=min_release_age,
+                min_version=min_version,
+                no_cache=no_cache,
             )
-        except Exception as err:
-            update_log = f"❌ {self.__class__.__name__} Failed to update {bin_name}, got {err.__class__.__name__}: {err}"
-            if not quiet:
-                raise
-        finally:
-            ACTIVE_EXEC_LOG_PREFIX.reset(exec_log_prefix_token)
-
-        if self.dry_run:
-            return ShallowBinary.model_construct(
-                name=bin_name,
-                description=bin_name,
-                loaded_binprovider=self,
-                loaded_abspath=UNKNOWN_ABSPATH,
-                loaded_version=UNKNOWN_VERSION,
-                loaded_sha256=UNKNOWN_SHA256,
-                loaded_mtime=UNKNOWN_MTIME,
-                loaded_euid=UNKNOWN_EUID,
-                binproviders=[self],
+
+            self.setup_PATH(no_cache=no_cache)
+            update_log = None
+            exec_log_prefix_token = ACTIVE_EXEC_LOG_PREFIX.set(
+                f"⬆ Updating {bin_name} via {self.name}...",
             )
+            logger.info(ACTIVE_EXEC_LOG_PREFIX.get())
+            try:
+                update_log = cast(
+                    ActionFuncReturnValue,
+                    self._call_handler_for_action(
+                        bin_name=bin_name,
+                        handler_type="update",
+                        install_args=install_args,
+                        packages=install_args,
+                        no_cache=no_cache,
+                        postinstall_scripts=postinstall_scripts,
+                        min_release_age=min_release_age,
+                        min_version=min_version,
+                        timeout=self.install_timeout,
+                    ),
+                )
+            except Exception as err:
+                update_log = f"❌ {self.__class__.__name__} Failed to update {bin_name}, got {err.__class__.__name__}: {err}"
+                if not quiet:
+                    raise
+            finally:
+                ACTIVE_EXEC_LOG_PREFIX.reset(exec_log_prefix_token)
+
+            if self.dry_run:
+                return ShallowBinary.model_construct(
+                    name=bin_name,
+                    description=bin_name,
+                    loaded_binprovider=self,
+                    loaded_abspath=UNKNOWN_ABSPATH,
+                    loaded_version=UNKNOWN_VERSION,
+                    loaded_sha256=UNKNOWN_SHA256,
+                    loaded_mtime=UNKNOWN_MTIME,
+                    loaded_euid=UNKNOWN_EUID,
+                    binproviders=[self],
+                )
 
-        self.invalidate_cache(bin_name)
+            self.invalidate_cache(bin_name)
+            self.bin_index(refresh=True)
 
-        result = self.load(bin_name, quiet=True, no_cache=no_cache)
-        if not quiet:
-            assert result is not None, (
-                f"❌ {self.__class__.__name__} Unable to find version for {bin_name} after updating. PATH={self.PATH} LOG={update_log}"
-            )
-        if result is not None:
-            self._assert_min_version_satisfied(
-                bin_name=bin_name,
-                action="update",
-                loaded_version=result.loaded_version,
-                min_version=min_version,
-            )
-        return result
+            result = self.load(bin_name, quiet=True, no_cache=no_cache)
+            if not quiet:
+                assert result is not None, (
+                    f"❌ {self.__class__.__name__} Unable to find version for {bin_name} after updating. PATH={self.PATH} LOG={update_log}"
+                )
+            if result is not None:
+                self._assert_min_version_satisfied(
+                    bin_name=bin_name,
+                    action="update",
+                    loaded_version=result.loaded_version,
+                    min_version=min_version,
+                )
+            return result
 
     @final
     @log_method_call(include_result=True)
@@ -2378,43 +3710,47 @@ class BinProvider(BaseModel):
             if had_cached_binary:
                 self.invalidate_cache(bin_name)
             return False
-        install_args = self.get_install_args(bin_name, quiet=quiet, no_cache=no_cache)
-        self.setup_PATH(no_cache=no_cache)
-        uninstall_result = None
-        exec_log_prefix_token = ACTIVE_EXEC_LOG_PREFIX.set(
-            f"🗑️ Uninstalling {bin_name} via {self.name}...",
-        )
-        logger.info(ACTIVE_EXEC_LOG_PREFIX.get())
-        try:
-            uninstall_result = cast(
-                ActionFuncReturnValue,
-                self._call_handler_for_action(
-                    bin_name=bin_name,
-                    handler_type="uninstall",
-                    install_args=install_args,
-                    packages=install_args,
-                    no_cache=no_cache,
-                    postinstall_scripts=postinstall_scripts,
-                    min_release_age=min_release_age,
-                    min_version=min_version,
-                    timeout=self.install_timeout,
-                ),
+        with self._install_lock():
+            install_args = self.get_install_args(
+                bin_name, quiet=quiet, no_cache=no_cache
             )
-        except Exception:
-            if not quiet:
-                raise
-            return False
-        finally:
-            ACTIVE_EXEC_LOG_PREFIX.reset(exec_log_prefix_token)
+            self.setup_PATH(no_cache=no_cache)
+            uninstall_result = None
+            exec_log_prefix_token = ACTIVE_EXEC_LOG_PREFIX.set(
+                f"🗑️ Uninstalling {bin_name} via {self.name}...",
+            )
+            logger.info(ACTIVE_EXEC_LOG_PREFIX.get())
+            try:
+                uninstall_result = cast(
+                    ActionFuncReturnValue,
+                    self._call_handler_for_action(
+                        bin_name=bin_name,
+                        handler_type="uninstall",
+                        install_args=install_args,
+                        packages=install_args,
+                        no_cache=no_cache,
+                        postinstall_scripts=postinstall_scripts,
+                        min_release_age=min_release_age,
+                        min_version=min_version,
+                        timeout=self.install_timeout,
+                    ),
+                )
+            except Exception:
+                if not quiet:
+                    raise
+                return False
+            finally:
+                ACTIVE_EXEC_LOG_PREFIX.reset(exec_log_prefix_token)
 
-        self.invalidate_cache(bin_name)
+            self.invalidate_cache(bin_name)
 
-        if self.dry_run:
-            return True
+            if self.dry_run:
+                return True
+            self.bin_index(refresh=True)
 
-        if uninstall_result is not False:
-            logger.info("🗑️ Uninstalled %s via %s", bin_name, self.name)
-        return uninstall_result is not False
+            if uninstall_result is not False:
+                logger.info("🗑️ Uninstalled %s via %s", bin_name, self.name)
+            return uninstall_result is not False
 
     @final
     @log_method_call(include_result=True)
@@ -2432,6 +3768,8 @@ class BinProvider(BaseModel):
         result = (
             None if no_cache else self.load_cached_binary(bin_name, installed_abspath)
         )
+        if not no_cache:
+            mark_cache_hit(result is not None)
         if result is None:
             loaded_version = self.get_version(
                 bin_name,
@@ -2441,19 +3779,12 @@ class BinProvider(BaseModel):
             )
             if not loaded_version:
                 return None
-            loaded_sha256 = (
-                self.get_sha256(
-                    bin_name,
-                    abspath=installed_abspath,
-                    no_cache=True,
-                )
-                or UNKNOWN_SHA256
-            )
+            # the real hash is only computed if loaded_sha256 is read later
             cache_write_result = self.write_cached_binary(
                 bin_name,
                 installed_abspath,
                 loaded_version,
-                loaded_sha256,
+                UNKNOWN_SHA256,
             )
             if cache_write_result is None:
                 resolved_path = (
@@ -2472,17 +3803,27 @@ class BinProvider(BaseModel):
                     "binprovider": self,
                     "abspath": installed_abspath,
                     "version": loaded_version,
-                    "sha256": loaded_sha256,
+                    "sha256": UNKNOWN_SHA256,
                     "mtime": loaded_mtime,
                     "euid": loaded_euid,
                     "binproviders": [self],
                 },
             )
+        return self._finish_load(bin_name, installed_abspath, result)
+
+    def _finish_load(
+        self,
+        bin_name: BinName,
+        abspath: HostBinPath,
+        result: ShallowBinary,
+    ) -> ShallowBinary:
+        if result.loaded_sha256 == UNKNOWN_SHA256 and not self.skip_sha256:
+            result.defer_sha256()
 
         logger.info(
             format_loaded_binary(
                 "☑️ Loaded",
-                installed_abspath,
+                abspath,
                 result.loaded_version,
                 self,
                 str(bin_name),
@@ -2491,6 +3832,96 @@ class BinProvider(BaseModel):
         )
         return result
 
+    @log_method_call(include_result=True)
+    def load_cached(self, bin_name: BinName) -> ShallowBinary | None:
+        """Load ``bin_name`` straight from its derived.env record, without the
+        abspath/version probes load() runs first, or return None if there is
+        no record whose fingerprint still matches the file on disk.
+
+        Skipped when the abspath handler is overridden, as the record may not
+        be where that handler would resolve the binary to now.
+        """
+        derived_env_path = self.derived_env_path
+        if derived_env_path is None or not derived_env_path.is_file():
+            return None
+        if self._get_handler_for_action(bin_name, "abspath") != getattr(
+            self,
+            "default_abspath_handler",
+            None,
+        ):
+            return None
+        cached_records = load_derived_cache_records(
+            derived_env_path,
+            self.name,
+            str(bin_name),
+        )
+        for cache_value in cached_records.values():
+            cached_abspath = cache_value.get("abspath")
+            if (
+                cache_value.get("cache_kind") != "binary"
+                or cache_value.get("bin_name") != str(bin_name)
+                or not isinstance(cached_abspath, str)
+            ):
+                continue
+            try:
+                abspath = TypeAdapter(HostBinPath).validate_python(
+                    Path(cached_abspath),
+                )
+            except ValidationError:
+                continue
+            result = self.load_cached_binary(bin_name, abspath)
+            if result is not None and result.loaded_abspath is not None:
+                mark_cache_hit(True)
+                return self._finish_load(bin_name, result.loaded_abspath, result)
+        return None
+
+    # Async variants of the lifecycle methods above, see run_with_async_exec()
+    # for how cancellation and ``timeout`` (seconds) reach the subprocesses.
+
+    async def aload(
+        self,
+        bin_name: BinName,
+        *args: Any,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> ShallowBinary | None:
+        return await run_with_async_exec(
+            self.load, bin_name, *args, timeout=timeout, **kwargs
+        )
+
+    async def ainstall(
+        self,
+        bin_name: BinName,
+        *args: Any,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> ShallowBinary | None:
+        return await run_with_async_exec(
+            self.install, bin_name, *args, timeout=timeout, **kwargs
+        )
+
+    async def aupdate(
+        self,
+        bin_name: BinName,
+        *args: Any,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> ShallowBinary | None:
+        return await run_with_async_exec(
+            self.update, bin_name, *args, timeout=timeout, **kwargs
+        )
+
+    async def auninstall(
+        self,
+        bin_name: BinName,
+        *args: Any,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> bool:
+        return await run_with_async_exec(
+            self.uninstall, bin_name, *args, timeout=timeout, **kwargs
+        )
+
 
 class EnvProvider(BinProvider):
     name: BinProviderName = "env"
@@ -2504,6 +3935,14 @@ class EnvProvider(BinProvider):
             abxpkg_install_root_default("env") or (DEFAULT_LIB_DIR / "env")
         ),
     )
+    probe_cache: bool = Field(
+        default_factory=lambda: env_flag_is_true("ABXPKG_PROBE_CACHE"),
+        description=(
+            "Persist --version/sha256 probe results in the user cache dir, keyed "
+            "by each binary's (inode, size, mtime_ns), so unchanged system "
+            "binaries are not re-probed by every new process."
+        ),
+    )
 
     overrides: "BinProviderOverrides" = {
         "*": {
@@ -2533,16 +3972,22 @@ class EnvProvider(BinProvider):
             )
         super().setup_PATH(no_cache=no_cache)
 
+    @property
+    def probe_cache_path(self) -> Path | None:
+        return PROBE_CACHE_PATH if self.probe_cache else None
+
     def INSTALLER_BINARY(self, no_cache: bool = False) -> ShallowBinary:
         if not no_cache and self._INSTALLER_BINARY and self._INSTALLER_BINARY.is_valid:
             return self._INSTALLER_BINARY
 
         derived_env_path = self.derived_env_path
         if not no_cache and derived_env_path and derived_env_path.is_file():
-            cache = load_derived_cache(derived_env_path)
-            for cached_record in cache.values():
-                if not isinstance(cached_record, dict):
-                    continue
+            cached_records = load_derived_cache_records(
+                derived_env_path,
+                self.name,
+                str(self.INSTALLER_BIN),
+            )
+            for cached_record in cached_records.values():
                 if cached_record.get("provider_name") != self.name or cached_record.get(
                     "bin_name",
                 ) != str(self.INSTALLER_BIN):
@@ -2580,12 +4025,12 @@ class EnvProvider(BinProvider):
 
         loaded = env_provider.load(bin_name=self.INSTALLER_BIN, no_cache=no_cache)
         if loaded and loaded.loaded_abspath:
-            if loaded.loaded_version and loaded.loaded_sha256:
+            if loaded.loaded_version and loaded.known_sha256:
                 self.write_cached_binary(
                     self.INSTALLER_BIN,
                     loaded.loaded_abspath,
                     loaded.loaded_version,
-                    loaded.loaded_sha256,
+                    loaded.known_sha256,
                     resolved_provider_name=(
                         loaded.loaded_binprovider.name
                         if loaded.loaded_binprovider is not None
@@ -2731,14 +4176,15 @@ class EnvProvider(BinProvider):
         if derived_env_path is None or not derived_env_path.is_file():
             return False
 
-        cache = load_derived_cache(derived_env_path)
-        cache_changed = False
+        cached_records = load_derived_cache_records(
+            derived_env_path,
+            self.name,
+            str(bin_name),
+        )
+        stale_cache_keys: list[str] = []
         has_valid_cache = False
 
-        for cache_key, cache_value in list(cache.items()):
-            if not isinstance(cache_value, dict):
-                continue
-
+        for cache_key, cache_value in cached_records.items():
             cached_provider_name = cache_value.get("provider_name")
             cached_bin_name = cache_value.get("bin_name")
             cached_abspath = cache_value.get("abspath")
@@ -2767,14 +4213,12 @@ class EnvProvider(BinProvider):
                 continue
 
             if self._is_managed_by_other_provider(Path(cached_abspath)):
-                cache.pop(cache_key, None)
-                cache_changed = True
+                stale_cache_keys.append(cache_key)
                 continue
 
             has_valid_cache = True
 
-        if cache_changed:
-            save_derived_cache(derived_env_path, cache)
+        delete_derived_cache_records(derived_env_path, stale_cache_keys)
 
         return has_valid_cache
 
@@ -6,7 +6,7 @@ import time
 
 from pydantic import TypeAdapter
 
-from .base_types import BinProviderName, PATHStr, BinName, InstallArgs
+from .base_types import BinProviderName, PATHEntries, PATHStr, BinName, InstallArgs
 from .semver import SemVer
 from .binprovider import BinProvider, EnvProvider, remap_kwargs
 from .logging import format_subprocess_output
@@ -65,12 +65,20 @@ class AptProvider(BinProvider):
                 dpkg_bin_dirs = [
                     path for path in dpkg_install_dirs if path.endswith("/bin")
                 ]
-                for bin_dir in dpkg_bin_dirs:
-                    if str(bin_dir) not in PATH:
-                        PATH = ":".join([str(bin_dir), *PATH.split(":")])
-                self.PATH = TypeAdapter(PATHStr).validate_python(PATH)
+                path_entries = PATHEntries(PATH)
+                path_entries.prepend(
+                    *(
+                        bin_dir
+                        for bin_dir in reversed(dpkg_bin_dirs)
+                        if bin_dir not in path_entries
+                    ),
+                )
+                self.PATH = TypeAdapter(PATHStr).validate_python(path_entries)
         super().setup_PATH(no_cache=no_cache)
 
+    def supports_batch_install(self) -> bool:
+        return True
+
     @remap_kwargs({"packages": "install_args"})
     def default_install_handler(
         self,
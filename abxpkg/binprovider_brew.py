@@ -11,6 +11,7 @@ from pydantic import Field, TypeAdapter, computed_field
 
 from .base_types import (
     BinProviderName,
+    PATHEntries,
     PATHStr,
     BinName,
     InstallArgs,
@@ -73,6 +74,9 @@ class BrewProvider(BinProvider):
     def supports_postinstall_disable(self, action, no_cache: bool = False) -> bool:
         return action == "install"
 
+    def supports_batch_install(self) -> bool:
+        return True
+
     def _brew_prefixes(self, no_cache: bool = False) -> list[Path]:
         """Collect candidate Homebrew prefixes from the installer binary and current PATH."""
         prefixes: list[Path] = []
@@ -123,16 +127,8 @@ class BrewProvider(BinProvider):
             if isinstance(package, str) and package and not package.startswith("-")
         ] or [str(bin_name)]
 
-        search_paths: list[str] = []
-        seen: set[str] = set()
-
-        def add_path(path: Path) -> None:
-            path_str = str(path)
-            if path_str in seen:
-                return
-            seen.add(path_str)
-            search_paths.append(path_str)
-
+        search_paths = PATHEntries()
+        add_path = search_paths.append
         for prefix in self._brew_prefixes(no_cache=no_cache):
             for package in package_names:
                 add_path(prefix / "opt" / package / "bin")
@@ -142,9 +138,7 @@ class BrewProvider(BinProvider):
                 for cellar_bin in (prefix / "Cellar" / package).glob("*/libexec/bin"):
                     add_path(cellar_bin)
 
-        for bin_dir in self.PATH.split(":"):
-            if bin_dir:
-                add_path(Path(bin_dir))
+        search_paths.append(self.PATH)
 
         return TypeAdapter(PATHStr).validate_python(search_paths)
 
@@ -2,7 +2,6 @@
 
 __package__ = "abxpkg"
 
-import json
 import os
 import sys
 from pathlib import Path
@@ -20,6 +19,11 @@ from .base_types import (
     abxpkg_install_root_default,
 )
 from .binprovider import BinProvider, env_flag_is_true, log_method_call, remap_kwargs
+from .binprovider_npm import (
+    node_modules_bin_entries,
+    node_package_name,
+    node_package_version,
+)
 from .logging import format_subprocess_output
 from .semver import SemVer
 
@@ -78,6 +82,25 @@ class BunProvider(BinProvider):
             "BUN_INSTALL": str(self.install_root),
         }
 
+    def _bin_index_watch_paths(self) -> list[Path]:
+        if self.install_root is None:
+            return super()._bin_index_watch_paths()
+        return [
+            *super()._bin_index_watch_paths(),
+            self.install_root / "install" / "global" / "node_modules",
+        ]
+
+    def scan_bin_index(self) -> dict[str, BinProvider.BinIndexEntry]:
+        entries = super().scan_bin_index()
+        if self.install_root is not None and self.bin_dir is not None:
+            entries.update(
+                node_modules_bin_entries(
+                    self.install_root / "install" / "global" / "node_modules",
+                    self.bin_dir,
+                ),
+            )
+        return entries
+
     def get_cache_info(
         self,
         bin_name: BinName,
@@ -90,12 +113,7 @@ class BunProvider(BinProvider):
         install_args = self.get_install_args(str(bin_name), quiet=True) or [
             str(bin_name),
         ]
-        main_package = install_args[0]
-        package = (
-            "@" + main_package[1:].split("@", 1)[0]
-            if main_package.startswith("@")
-            else main_package.split("@", 1)[0]
-        )
+        package = node_package_name(install_args[0])
         package_json = (
             self.install_root
             / "install"
@@ -424,12 +442,7 @@ class BunProvider(BinProvider):
         install_args = self.get_install_args(str(bin_name), **context) or [
             str(bin_name),
         ]
-        main_package = install_args[0]
-        package = (
-            "@" + main_package[1:].split("@", 1)[0]
-            if main_package.startswith("@")
-            else main_package.split("@", 1)[0]
-        )
+        package = node_package_name(install_args[0])
         global_root = (
             (self.install_root / "install" / "global")
             if self.install_root
@@ -439,13 +452,7 @@ class BunProvider(BinProvider):
             / "install"
             / "global"
         )
-        package_json = global_root / "node_modules" / package / "package.json"
-        if package_json.exists():
-            try:
-                return json.loads(package_json.read_text())["version"]
-            except Exception:
-                return None
-        return None
+        return node_package_version(global_root / "node_modules", package)
 
 
 if __name__ == "__main__":
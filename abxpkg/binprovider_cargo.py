@@ -2,6 +2,7 @@
 __package__ = "abxpkg"
 
 import os
+import json
 
 from pathlib import Path
 
@@ -100,6 +101,35 @@ class CargoProvider(BinProvider):
             assert bin_dir is not None
             bin_dir.mkdir(parents=True, exist_ok=True)
 
+    def _bin_index_watch_paths(self) -> list[Path]:
+        if self.install_root is None:
+            return super()._bin_index_watch_paths()
+        return [*super()._bin_index_watch_paths(), self.install_root / ".crates2.json"]
+
+    def scan_bin_index(self) -> dict[str, BinProvider.BinIndexEntry]:
+        entries = super().scan_bin_index()
+        if self.install_root is None or self.bin_dir is None:
+            return entries
+        # cargo records every installed crate and the bins it provides, e.g.
+        # {"installs": {"ripgrep 14.1.0 (registry+https://...)": {"bins": ["rg"], ...}}}
+        try:
+            installs = json.loads(
+                (self.install_root / ".crates2.json").read_text(encoding="utf-8"),
+            ).get("installs", {})
+        except (OSError, ValueError, AttributeError):
+            return entries
+        for crate_id, install_info in installs.items():
+            package, _, version = str(crate_id).partition(" ")
+            for crate_bin_name in (install_info or {}).get("bins", []):
+                abspath = self.bin_dir / crate_bin_name
+                if abspath.exists():
+                    entries[crate_bin_name] = {
+                        "package": package,
+                        "version": version.split(" ", 1)[0] or None,
+                        "abspath": str(abspath),
+                    }
+        return entries
+
     def _cargo_package_specs(
         self,
         bin_name: str,
@@ -139,6 +169,11 @@ class CargoProvider(BinProvider):
             if arg.startswith("-"):
                 continue
             package_specs.append(arg)
+        if package_specs in ([], [bin_name]):
+            # the crate providing a bin is often named differently (rg -> ripgrep)
+            indexed = self.lookup_bin_index(bin_name)
+            if indexed and indexed["package"]:
+                return [indexed["package"]]
         return package_specs or [bin_name]
 
     @remap_kwargs({"packages": "install_args"})
@@ -116,13 +116,13 @@ class GemProvider(BinProvider):
             ruby_loaded
             and ruby_loaded.loaded_abspath
             and ruby_loaded.loaded_version
-            and ruby_loaded.loaded_sha256
+            and ruby_loaded.known_sha256
         ):
             self.write_cached_binary(
                 "ruby",
                 ruby_loaded.loaded_abspath,
                 ruby_loaded.loaded_version,
-                ruby_loaded.loaded_sha256,
+                ruby_loaded.known_sha256,
                 resolved_provider_name=(
                     ruby_loaded.loaded_binprovider.name
                     if ruby_loaded.loaded_binprovider is not None
@@ -153,6 +153,9 @@ class GemProvider(BinProvider):
         install_root.mkdir(parents=True, exist_ok=True)
         bin_dir.mkdir(parents=True, exist_ok=True)
 
+    def supports_batch_install(self) -> bool:
+        return True
+
     def _patch_generated_wrappers(self) -> None:
         """Patch generated Ruby wrappers so they stay bound to this provider's GEM_HOME."""
         install_root = self.install_root
@@ -101,12 +101,14 @@ class GoGetProvider(BinProvider):
 
         derived_env_path = self.derived_env_path
         if not no_cache and derived_env_path and derived_env_path.is_file():
-            from .config import load_derived_cache
+            from .config import load_derived_cache_records
 
-            cache = load_derived_cache(derived_env_path)
-            for cached_record in cache.values():
-                if not isinstance(cached_record, dict):
-                    continue
+            cached_records = load_derived_cache_records(
+                derived_env_path,
+                self.name,
+                str(self.INSTALLER_BIN),
+            )
+            for cached_record in cached_records.values():
                 if cached_record.get("provider_name") != self.name or cached_record.get(
                     "bin_name",
                 ) != str(self.INSTALLER_BIN):
@@ -144,12 +146,12 @@ class GoGetProvider(BinProvider):
 
         loaded = env_provider.load(bin_name=self.INSTALLER_BIN, no_cache=no_cache)
         if loaded and loaded.loaded_abspath:
-            if loaded.loaded_version and loaded.loaded_sha256:
+            if loaded.loaded_version and loaded.known_sha256:
                 self.write_cached_binary(
                     self.INSTALLER_BIN,
                     loaded.loaded_abspath,
                     loaded.loaded_version,
-                    loaded.loaded_sha256,
+                    loaded.known_sha256,
                     resolved_provider_name=(
                         loaded.loaded_binprovider.name
                         if loaded.loaded_binprovider is not None
@@ -5,6 +5,7 @@ __package__ = "abxpkg"
 import os
 import sys
 import json
+import threading
 
 from pathlib import Path
 from typing import Self
@@ -38,6 +39,96 @@ USER_CACHE_PATH = user_cache_path(
     appauthor="abxpkg",
 )
 
+# Parsed package.json files keyed by path, validated against their (mtime, size)
+# so repeated version/bin lookups within a run cost a single stat().
+_PACKAGE_JSONS: dict[Path, tuple[tuple[int, int], dict]] = {}
+_PACKAGE_JSON_LOCK = threading.Lock()
+
+
+def node_package_name(install_arg: str) -> str:
+    """Strip the version spec from an npm-style install arg,
+    e.g. ``@postlight/parser@^2.2.3`` -> ``@postlight/parser``."""
+    if install_arg.startswith("@"):
+        return "@" + install_arg[1:].split("@", 1)[0]
+    return install_arg.split("@", 1)[0]
+
+
+def read_node_package_json(node_modules_dir: Path, package: str) -> dict | None:
+    """Return the (memoized) parsed ``<node_modules_dir>/<package>/package.json``,
+    or None if the package is not installed there."""
+    package_json = node_modules_dir / package / "package.json"
+    try:
+        stat = package_json.stat()
+    except OSError:
+        return None
+    stat_key = (stat.st_mtime_ns, stat.st_size)
+    with _PACKAGE_JSON_LOCK:
+        cached = _PACKAGE_JSONS.get(package_json)
+        if cached is not None and cached[0] == stat_key:
+            return cached[1]
+    try:
+        package_info = json.loads(package_json.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(package_info, dict):
+        return None
+    with _PACKAGE_JSON_LOCK:
+        _PACKAGE_JSONS[package_json] = (stat_key, package_info)
+    return package_info
+
+
+def node_package_version(node_modules_dir: Path, package: str) -> str | None:
+    """Installed version of ``package`` read from its package.json, or None."""
+    package_info = read_node_package_json(node_modules_dir, package)
+    version = package_info.get("version") if package_info else None
+    return version if isinstance(version, str) and version else None
+
+
+def node_package_bin_names(node_modules_dir: Path, package: str) -> list[str] | None:
+    """Executable names declared in the installed package's ``bin`` field
+    (a bare string bin is named after the unscoped package), or None if the
+    package is not installed there."""
+    package_info = read_node_package_json(node_modules_dir, package)
+    if package_info is None:
+        return None
+    bins = package_info.get("bin") or {}
+    if isinstance(bins, str):
+        return [package.rsplit("/", 1)[-1]]
+    return [str(name) for name in bins] if isinstance(bins, dict) else []
+
+
+def node_modules_bin_entries(
+    node_modules_dir: Path,
+    bin_dir: Path,
+) -> dict[str, BinProvider.BinIndexEntry]:
+    """Bin index entries for every top-level package in ``node_modules_dir``
+    whose declared bins are linked into ``bin_dir``."""
+    packages: list[str] = []
+    try:
+        for entry in os.scandir(node_modules_dir):
+            if entry.name.startswith("@") and entry.is_dir():
+                packages.extend(
+                    f"{entry.name}/{scoped.name}" for scoped in os.scandir(entry.path)
+                )
+            elif not entry.name.startswith("."):
+                packages.append(entry.name)
+    except OSError:
+        return {}
+
+    entries: dict[str, BinProvider.BinIndexEntry] = {}
+    for package in sorted(packages):
+        for alt_bin_name in node_package_bin_names(node_modules_dir, package) or []:
+            abspath = bin_dir / alt_bin_name
+            if alt_bin_name not in entries and (
+                abspath.exists() or abspath.is_symlink()
+            ):
+                entries[alt_bin_name] = {
+                    "package": package,
+                    "version": node_package_version(node_modules_dir, package),
+                    "abspath": str(abspath),
+                }
+    return entries
+
 
 class NpmProvider(BinProvider):
     name: BinProviderName = "npm"
@@ -98,11 +189,7 @@ class NpmProvider(BinProvider):
             (arg for arg in install_args if arg and not arg.startswith("-")),
             str(bin_name),
         )
-        package = (
-            "@" + main_package[1:].split("@", 1)[0]
-            if main_package.startswith("@")
-            else main_package.split("@", 1)[0]
-        )
+        package = node_package_name(main_package)
         package_json = self.install_root / "node_modules" / package / "package.json"
         if package_json.exists():
             cache_info["fingerprint_paths"].append(package_json)
@@ -135,6 +222,9 @@ class NpmProvider(BinProvider):
     def supports_postinstall_disable(self, action, no_cache: bool = False) -> bool:
         return action in ("install", "update")
 
+    def supports_batch_install(self) -> bool:
+        return True
+
     @staticmethod
     def _install_args_have_option(args: InstallArgs, *options: str) -> bool:
         """Return True when install_args already contains any of the requested options."""
@@ -274,13 +364,13 @@ class NpmProvider(BinProvider):
             node_loaded
             and node_loaded.loaded_abspath
             and node_loaded.loaded_version
-            and node_loaded.loaded_sha256
+            and node_loaded.known_sha256
         ):
             self.write_cached_binary(
                 "node",
                 node_loaded.loaded_abspath,
                 node_loaded.loaded_version,
-                node_loaded.loaded_sha256,
+                node_loaded.known_sha256,
                 resolved_provider_name=(
                     node_loaded.loaded_binprovider.name
                     if node_loaded.loaded_binprovider is not None
@@ -362,6 +452,40 @@ class NpmProvider(BinProvider):
             mutation_args.append("--global")
         return mutation_args
 
+    def _node_modules_dir(self, npm_abspath: Path | None = None) -> Path | None:
+        """Return the node_modules dir npm installs packages into, without running npm.
+
+        Global mode uses ``$npm_config_prefix/lib/node_modules`` or the
+        ``lib/node_modules`` next to npm's own ``bin/`` dir."""
+        if self.install_root:
+            return self.install_root / "node_modules"
+        prefix = os.environ.get("npm_config_prefix") or os.environ.get(
+            "NPM_CONFIG_PREFIX",
+        )
+        if prefix:
+            return Path(prefix) / "lib" / "node_modules"
+        if npm_abspath:
+            global_dir = Path(npm_abspath).parent.parent / "lib" / "node_modules"
+            if global_dir.is_dir():
+                return global_dir
+        return None
+
+    def _bin_index_watch_paths(self) -> list[Path]:
+        if self.install_root is None:
+            return super()._bin_index_watch_paths()
+        return [*super()._bin_index_watch_paths(), self.install_root / "node_modules"]
+
+    def scan_bin_index(self) -> dict[str, BinProvider.BinIndexEntry]:
+        entries = super().scan_bin_index()
+        if self.install_root is not None and self.bin_dir is not None:
+            entries.update(
+                node_modules_bin_entries(
+                    self.install_root / "node_modules",
+                    self.bin_dir,
+                ),
+            )
+        return entries
+
     def _linked_bin_path(self, bin_name: BinName | HostBinPath) -> Path | None:
         """Return the managed shim path for an npm-installed executable, if any."""
         if self.bin_dir is None:
@@ -601,33 +725,46 @@ class NpmProvider(BinProvider):
         except Exception:
             return None
 
-        # fallback to using npm show to get alternate binary names based on the package, then try to find those in BinProvider.PATH
+        # read the alternate binary names from the installed package.json first,
+        # then fall back to asking the registry via npm show (slow, hits the network)
         try:
             install_args = self.get_install_args(str(bin_name)) or [str(bin_name)]
             main_package = install_args[
                 0
             ]  # assume first package in list is the main one
-            package_info = json.loads(
-                self.exec(
-                    bin_name=npm_abspath,
-                    cmd=["show", "--json", main_package, "bin"],
-                    timeout=self.version_timeout,
-                    quiet=True,
-                ).stdout.strip(),
-            )
-            # { ...
-            #   "version": "2.2.3",
-            #   "bin": {
-            #     "mercury-parser": "cli.js",
-            #     "postlight-parser": "cli.js"
-            #   },
-            #   ...
-            # }
+            node_modules_dir = self._node_modules_dir(npm_abspath)
             alt_bin_names = (
-                package_info.get("bin", package_info)
-                if isinstance(package_info, dict)
-                else {}
-            ).keys()
+                node_package_bin_names(
+                    node_modules_dir,
+                    node_package_name(main_package),
+                )
+                if node_modules_dir
+                else None
+            )
+            if alt_bin_names is None:
+                package_info = json.loads(
+                    self.exec(
+                        bin_name=npm_abspath,
+                        cmd=["show", "--json", main_package, "bin"],
+                        timeout=self.version_timeout,
+                        quiet=True,
+                    ).stdout.strip(),
+                )
+                # { ...
+                #   "version": "2.2.3",
+                #   "bin": {
+                #     "mercury-parser": "cli.js",
+                #     "postlight-parser": "cli.js"
+                #   },
+                #   ...
+                # }
+                alt_bin_names = list(
+                    (
+                        package_info.get("bin", package_info)
+                        if isinstance(package_info, dict)
+                        else {}
+                    ).keys(),
+                )
             for alt_bin_name in alt_bin_names:
                 abspath = bin_abspath(
                     alt_bin_name,
@@ -667,23 +804,25 @@ class NpmProvider(BinProvider):
         except Exception:
             return None
 
-        package = None
+        install_args = self.get_install_args(str(bin_name), **context) or [
+            str(bin_name),
+        ]
+        # assume first package in list is the main one, and remove the package
+        # version if it exists "@postslight/parser@^1.2.3" -> "@postlight/parser"
+        package = node_package_name(install_args[0])
+
+        # read the installed package.json directly (no npm process needed)
+        node_modules_dir = self._node_modules_dir(npm_abspath)
+        version = (
+            node_package_version(node_modules_dir, package)
+            if node_modules_dir
+            else None
+        )
+        if version:
+            return version
 
         # fallback to using npm list to get the installed package version
         try:
-            install_args = self.get_install_args(str(bin_name), **context) or [
-                str(bin_name),
-            ]
-            main_package = install_args[
-                0
-            ]  # assume first package in list is the main one
-
-            # remove the package version if it exists "@postslight/parser@^1.2.3" -> "@postlight/parser"
-            if main_package[0] == "@":
-                package = "@" + main_package[1:].split("@", 1)[0]
-            else:
-                package = main_package.split("@", 1)[0]
-
             # npm list --depth=0 --json --prefix=<prefix> "@postlight/parser"
             # (dont use 'npm info @postlight/parser version', it shows *any* available version, not installed version)
             json_output = self.exec(
@@ -717,7 +856,6 @@ class NpmProvider(BinProvider):
             pass
 
         try:
-            assert package
             root_args = (
                 ["root", f"--prefix={self.install_root}"]
                 if self.install_root
@@ -731,13 +869,9 @@ class NpmProvider(BinProvider):
                     quiet=True,
                 ).stdout.strip(),
             )
-            version_str = json.loads(
-                (modules_dir / package / "package.json").read_text(),
-            )["version"]
-            return version_str
+            return node_package_version(modules_dir, package)
         except Exception:
-            raise
-        return None
+            return None
 
 
 if __name__ == "__main__":
@@ -7,6 +7,7 @@ import sys
 import site
 import re
 import sysconfig
+import threading
 from platformdirs import user_cache_path
 
 from pathlib import Path
@@ -45,6 +46,144 @@ USER_CACHE_PATH = user_cache_path(
 # pip >= 26.0 is required for ``--uploaded-prior-to`` (see pypa/pip#13625).
 _PIP_MIN_RELEASE_AGE_VERSION = SemVer((26, 0, 0))
 
+# Parsed VenvIndexes keyed by venv path, validated against the mtimes of its
+# site-packages dirs (installing/removing a distribution adds/removes a
+# *.dist-info entry there) so repeated lookups within a run cost a few stat()s.
+_VENV_INDEXES: dict[Path, tuple[tuple[int, ...], "VenvIndex"]] = {}
+_VENV_INDEX_LOCK = threading.Lock()
+
+
+def canonicalize_package_name(name: str) -> str:
+    """PEP 503 normalized distribution name, e.g. ``Yt_DLP`` -> ``yt-dlp``."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+class VenvIndex:
+    """Distributions installed in one virtualenv, read straight from the
+    ``*.dist-info`` dirs in its site-packages (``METADATA`` headers,
+    ``entry_points.txt`` console/gui scripts, and ``bin/`` files in ``RECORD``)
+    instead of spawning ``pip show`` / ``uv pip show``."""
+
+    def __init__(self, venv: Path, site_packages_dirs: list[Path]) -> None:
+        self.venv = venv
+        self.versions: dict[str, str] = {}  # canonical name -> version
+        self.metadata_paths: dict[str, Path] = {}  # canonical name -> METADATA
+        self.script_packages: dict[str, str] = {}  # script name -> canonical name
+        for site_packages in site_packages_dirs:
+            for dist_info in sorted(site_packages.glob("*.dist-info")):
+                self._add_dist_info(dist_info)
+
+    @property
+    def bin_dir(self) -> Path:
+        return self.venv / "bin"
+
+    @staticmethod
+    def _read_metadata_headers(metadata_path: Path) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        with open(metadata_path, encoding="utf-8", errors="replace") as metadata:
+            for line in metadata:
+                if not line.strip():
+                    break  # the long description body follows the header block
+                key, sep, value = line.partition(":")
+                if sep and key in ("Name", "Version"):
+                    headers.setdefault(key, value.strip())
+        return headers
+
+    def _add_dist_info(self, dist_info: Path) -> None:
+        metadata_path = dist_info / "METADATA"
+        try:
+            headers = self._read_metadata_headers(metadata_path)
+        except OSError:
+            return
+        if not headers.get("Name") or not headers.get("Version"):
+            return
+        package_name = canonicalize_package_name(headers["Name"])
+        self.versions[package_name] = headers["Version"]
+        self.metadata_paths[package_name] = metadata_path
+
+        try:
+            entry_points = (dist_info / "entry_points.txt").read_text(
+                encoding="utf-8",
+                errors="replace",
+            )
+        except OSError:
+            entry_points = ""
+        section = None
+        for line in entry_points.splitlines():
+            line = line.strip()
+            if line.startswith("[") and line.endswith("]"):
+                section = line[1:-1].strip()
+            elif section in ("console_scripts", "gui_scripts") and "=" in line:
+                self.script_packages.setdefault(
+                    line.split("=", 1)[0].strip(),
+                    package_name,
+                )
+
+        # plain ``scripts=[...]`` files are only listed in RECORD, relative to
+        # site-packages, e.g. ``../../../bin/youtube-dl,sha256=...,1234``
+        try:
+            record = (dist_info / "RECORD").read_text(
+                encoding="utf-8",
+                errors="replace",
+            )
+        except OSError:
+            return
+        for line in record.splitlines():
+            record_path = line.split(",", 1)[0]
+            if record_path.startswith("../../../bin/"):
+                script_name = record_path.removeprefix("../../../bin/")
+                if script_name and "/" not in script_name:
+                    self.script_packages.setdefault(script_name, package_name)
+
+    def bin_entries(self) -> dict[str, BinProvider.BinIndexEntry]:
+        """Bin index entries for the scripts present in bin/."""
+        entries: dict[str, BinProvider.BinIndexEntry] = {}
+        for script_name, package_name in sorted(self.script_packages.items()):
+            abspath = self.bin_dir / script_name
+            if abspath.is_file():
+                entries[script_name] = {
+                    "package": package_name,
+                    "version": self.versions[package_name],
+                    "abspath": str(abspath),
+                }
+        return entries
+
+    def package_for(self, bin_name: str, package_name: str | None = None) -> str | None:
+        """Canonical name of the installed distribution providing ``bin_name``
+        (preferring ``package_name`` when it is installed), or None."""
+        for candidate in (package_name, bin_name):
+            if candidate and canonicalize_package_name(candidate) in self.versions:
+                return canonicalize_package_name(candidate)
+        return self.script_packages.get(bin_name)
+
+    def version_for(
+        self, bin_name: str, package_name: str | None = None
+    ) -> SemVer | None:
+        installed_package = self.package_for(bin_name, package_name)
+        if installed_package is None:
+            return None
+        return SemVer.parse(self.versions[installed_package])
+
+
+def load_venv_index(venv: Path) -> VenvIndex | None:
+    """Return the (memoized) VenvIndex for ``venv``, rebuilding it whenever
+    one of its site-packages dirs changed; None if it has no site-packages."""
+    site_packages_dirs = sorted(venv.glob("lib/python*/site-packages"))
+    try:
+        stat_key = tuple(path.stat().st_mtime_ns for path in site_packages_dirs)
+    except OSError:
+        return None
+    if not site_packages_dirs:
+        return None
+    with _VENV_INDEX_LOCK:
+        cached = _VENV_INDEXES.get(venv)
+        if cached is not None and cached[0] == stat_key:
+            return cached[1]
+    index = VenvIndex(venv, site_packages_dirs)
+    with _VENV_INDEX_LOCK:
+        _VENV_INDEXES[venv] = (stat_key, index)
+    return index
+
 
 class PipProvider(BinProvider):
     name: BinProviderName = "pip"
@@ -105,6 +244,9 @@ class PipProvider(BinProvider):
     def supports_postinstall_disable(self, action, no_cache: bool = False) -> bool:
         return action in ("install", "update")
 
+    def supports_batch_install(self) -> bool:
+        return True
+
     @staticmethod
     def _install_args_have_option(args: InstallArgs, *options: str) -> bool:
         """Return True when install_args already contains any requested pip option."""
@@ -194,12 +336,12 @@ class PipProvider(BinProvider):
                     no_cache=no_cache,
                 )
                 if loaded and loaded.loaded_abspath:
-                    if loaded.loaded_version and loaded.loaded_sha256:
+                    if loaded.loaded_version and loaded.known_sha256:
                         self.write_cached_binary(
                             self.INSTALLER_BIN,
                             loaded.loaded_abspath,
                             loaded.loaded_version,
-                            loaded.loaded_sha256,
+                            loaded.known_sha256,
                             resolved_provider_name=(
                                 loaded.loaded_binprovider.name
                                 if loaded.loaded_binprovider is not None
@@ -219,13 +361,13 @@ class PipProvider(BinProvider):
                         python_loaded
                         and python_loaded.loaded_abspath
                         and python_loaded.loaded_version
-                        and python_loaded.loaded_sha256
+                        and python_loaded.known_sha256
                     ):
                         self.write_cached_binary(
                             "python",
                             python_loaded.loaded_abspath,
                             python_loaded.loaded_version,
-                            python_loaded.loaded_sha256,
+                            python_loaded.known_sha256,
                             resolved_provider_name=(
                                 python_loaded.loaded_binprovider.name
                                 if python_loaded.loaded_binprovider is not None
@@ -265,13 +407,13 @@ class PipProvider(BinProvider):
             python_loaded
             and python_loaded.loaded_abspath
             and python_loaded.loaded_version
-            and python_loaded.loaded_sha256
+            and python_loaded.known_sha256
         ):
             self.write_cached_binary(
                 "python",
                 python_loaded.loaded_abspath,
                 python_loaded.loaded_version,
-                python_loaded.loaded_sha256,
+                python_loaded.known_sha256,
                 resolved_provider_name=(
                     python_loaded.loaded_binprovider.name
                     if python_loaded.loaded_binprovider is not None
@@ -576,6 +718,18 @@ class PipProvider(BinProvider):
             if pip_abspath != managed_pip:
                 return None
 
+            # read the managed venv's dist-info directly instead of running pip show
+            venv_index = load_venv_index(self.install_root / "venv")
+            if venv_index is None or not venv_index.package_for(
+                str(bin_name),
+                self._package_name_for_bin(bin_name),
+            ):
+                return None
+            abspath = bin_abspath(str(bin_name), PATH=str(venv_index.bin_dir))
+            if abspath:
+                return TypeAdapter(HostBinPath).validate_python(abspath)
+            return None
+
         # fallback to using pip show to get the site-packages bin path
         output_lines = (
             self.exec(
@@ -617,8 +771,26 @@ class PipProvider(BinProvider):
         package_name = package_name.split("[", 1)[0].strip()
         return package_name or None
 
+    def _bin_index_watch_paths(self) -> list[Path]:
+        if self.install_root is None:
+            return super()._bin_index_watch_paths()
+        venv = self.install_root / "venv"
+        return [venv / "bin", *sorted(venv.glob("lib/python*/site-packages"))]
+
+    def scan_bin_index(self) -> dict[str, BinProvider.BinIndexEntry]:
+        entries = super().scan_bin_index()
+        venv_index = (
+            load_venv_index(self.install_root / "venv") if self.install_root else None
+        )
+        if venv_index is not None:
+            entries.update(venv_index.bin_entries())
+        return entries
+
     def _package_name_for_bin(self, bin_name: BinName) -> str | None:
         """Pick the owning Python package name used to resolve version/metadata lookups."""
+        indexed = self.lookup_bin_index(bin_name)
+        if indexed and indexed["package"]:
+            return indexed["package"]
         install_args = self.get_install_args(bin_name, quiet=True)
         for install_arg in install_args:
             package_name = self._package_name_from_install_arg(install_arg)
@@ -639,18 +811,14 @@ class PipProvider(BinProvider):
         if not package_name:
             return cache_info
 
-        normalized_name = package_name.lower().replace("-", "_")
-        metadata_files = sorted(
-            ((self.install_root / "venv") / "lib").glob(
-                f"python*/site-packages/{normalized_name}*.dist-info/METADATA",
-            ),
-        ) or sorted(
-            ((self.install_root / "venv") / "lib").glob(
-                f"python*/site-packages/{normalized_name}*.dist-info/PKG-INFO",
-            ),
+        venv_index = load_venv_index(self.install_root / "venv")
+        installed_package = (
+            venv_index.package_for(str(bin_name), package_name) if venv_index else None
         )
-        if metadata_files:
-            cache_info["fingerprint_paths"].append(metadata_files[0])
+        if venv_index is not None and installed_package:
+            cache_info["fingerprint_paths"].append(
+                venv_index.metadata_paths[installed_package],
+            )
         return cache_info
 
     def default_version_handler(
@@ -672,6 +840,15 @@ class PipProvider(BinProvider):
         except ValueError:
             pass
 
+        package_name = self._package_name_for_bin(bin_name) or str(bin_name)
+        if self.install_root:
+            # read the managed venv's dist-info directly instead of running pip show
+            venv_index = load_venv_index(self.install_root / "venv")
+            if venv_index is not None:
+                version = venv_index.version_for(str(bin_name), package_name)
+                if version:
+                    return version
+
         try:
             pip_abspath = self.INSTALLER_BINARY(no_cache=no_cache).loaded_abspath
             assert pip_abspath
@@ -679,7 +856,6 @@ class PipProvider(BinProvider):
             return None
 
         # fallback to using pip show to get the version (slower)
-        package_name = self._package_name_for_bin(bin_name) or str(bin_name)
         output_lines = (
             self.exec(
                 bin_name=pip_abspath,
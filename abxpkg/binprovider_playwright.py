@@ -7,6 +7,7 @@ import shlex
 import shutil
 import sys
 import platform
+import threading
 from pathlib import Path
 
 from pydantic import Field, TypeAdapter, computed_field
@@ -24,10 +25,29 @@ from .binary import Binary
 from .binprovider import BinProvider, EnvProvider, log_method_call, remap_kwargs
 from .binprovider_npm import NpmProvider
 from .logging import format_command, format_subprocess_output, get_logger
+from .node_helper import NodeHelper, load_node_abspath
 from .semver import SemVer
 
 logger = get_logger(__name__)
 
+# The browser types exported by the ``playwright`` npm module.
+PLAYWRIGHT_BROWSER_TYPES = ("chromium", "firefox", "webkit")
+
+# executablePath() answers keyed by (playwright module, browsers dir), validated
+# against the mtimes of the browsers dir and the module's package.json.
+_PLAYWRIGHT_BROWSER_PATHS: dict[
+    tuple[str, str],
+    tuple[tuple[int | None, ...], dict[str, str | None]],
+] = {}
+_PLAYWRIGHT_BROWSER_PATHS_LOCK = threading.Lock()
+
+
+def _mtime_ns(path: Path | None) -> int | None:
+    try:
+        return path.stat().st_mtime_ns if path is not None else None
+    except OSError:
+        return None
+
 
 class PlaywrightProvider(BinProvider):
     """Playwright browser installer provider.
@@ -149,12 +169,12 @@ class PlaywrightProvider(BinProvider):
                     for provider_name in selected_provider_names
                     if provider_name and provider_name in PROVIDER_CLASS_BY_NAME
                 ]
-                if loaded.loaded_version and loaded.loaded_sha256:
+                if loaded.loaded_version and loaded.known_sha256:
                     self.write_cached_binary(
                         self.INSTALLER_BIN,
                         loaded.loaded_abspath,
                         loaded.loaded_version,
-                        loaded.loaded_sha256,
+                        loaded.known_sha256,
                         resolved_provider_name=(
                             loaded.loaded_binprovider.name
                             if loaded.loaded_binprovider is not None
@@ -179,13 +199,13 @@ class PlaywrightProvider(BinProvider):
                     node_loaded
                     and node_loaded.loaded_abspath
                     and node_loaded.loaded_version
-                    and node_loaded.loaded_sha256
+                    and node_loaded.known_sha256
                 ):
                     self.write_cached_binary(
                         "node",
                         node_loaded.loaded_abspath,
                         node_loaded.loaded_version,
-                        node_loaded.loaded_sha256,
+                        node_loaded.known_sha256,
                         resolved_provider_name=(
                             node_loaded.loaded_binprovider.name
                             if node_loaded.loaded_binprovider is not None
@@ -224,13 +244,13 @@ class PlaywrightProvider(BinProvider):
             node_loaded
             and node_loaded.loaded_abspath
             and node_loaded.loaded_version
-            and node_loaded.loaded_sha256
+            and node_loaded.known_sha256
         ):
             self.write_cached_binary(
                 "node",
                 node_loaded.loaded_abspath,
                 node_loaded.loaded_version,
-                node_loaded.loaded_sha256,
+                node_loaded.known_sha256,
                 resolved_provider_name=(
                     node_loaded.loaded_binprovider.name
                     if node_loaded.loaded_binprovider is not None
@@ -484,6 +504,92 @@ class PlaywrightProvider(BinProvider):
             require_arg = str(pw_require_target)
         else:
             require_arg = "playwright"
+
+        # Ask for every browser at once and memoize the answers until the
+        # browsers dir or the playwright package changes, so loading
+        # chromium+firefox+webkit costs at most one helper round-trip.
+        browsers_dir = self._playwright_browsers_dir()
+        memo_key = (require_arg, str(browsers_dir))
+        stamp = tuple(
+            _mtime_ns(path)
+            for path in (
+                browsers_dir,
+                pw_require_target / "package.json" if pw_require_target else None,
+            )
+        )
+        with _PLAYWRIGHT_BROWSER_PATHS_LOCK:
+            memoized = _PLAYWRIGHT_BROWSER_PATHS.get(memo_key)
+        if (
+            not no_cache
+            and memoized is not None
+            and memoized[0] == stamp
+            and bin_name in memoized[1]
+        ):
+            browser_paths = memoized[1]
+        else:
+            browser_paths = self._query_playwright_browser_paths(
+                require_arg,
+                bin_name,
+                restart=memoized is not None and memoized[0][1:] != stamp[1:],
+                no_cache=no_cache,
+            )
+            if browser_paths is None:
+                return None
+            if memoized is not None and memoized[0] == stamp:
+                browser_paths = {**memoized[1], **browser_paths}
+            with _PLAYWRIGHT_BROWSER_PATHS_LOCK:
+                _PLAYWRIGHT_BROWSER_PATHS[memo_key] = (stamp, browser_paths)
+
+        path_str = browser_paths.get(bin_name)
+        if not path_str:
+            return None
+        path = Path(path_str)
+        return path if path.exists() else None
+
+    def _playwright_browsers_dir(self) -> Path:
+        """Return the dir playwright downloads browsers into (see
+        ``registryDirectory`` in playwright-core)."""
+        if self.install_root is not None:
+            return self.install_root
+        if os.environ.get("PLAYWRIGHT_BROWSERS_PATH"):
+            return Path(os.environ["PLAYWRIGHT_BROWSERS_PATH"]).expanduser()
+        if sys.platform == "darwin":
+            return Path("~/Library/Caches/ms-playwright").expanduser()
+        return (
+            Path(os.environ.get("XDG_CACHE_HOME") or Path("~/.cache").expanduser())
+            / "ms-playwright"
+        )
+
+    def _query_playwright_browser_paths(
+        self,
+        require_arg: str,
+        bin_name: str,
+        *,
+        restart: bool = False,
+        no_cache: bool = False,
+    ) -> dict[str, str | None] | None:
+        """Return ``{name: playwright[name].executablePath()}`` for every
+        browser type (plus ``bin_name``) via the shared node helper process,
+        or for just ``bin_name`` via one ``node -e`` call if the helper is
+        unavailable."""
+        node_abspath = load_node_abspath(no_cache=no_cache)
+        if node_abspath is None:
+            return None
+
+        helper = NodeHelper.get(self, node_abspath)
+        if restart:
+            # the playwright package may have been upgraded in place, don't
+            # trust the module already loaded by the running helper
+            helper.close()
+        browser_paths = helper.request(
+            "executablePaths",
+            timeout=self.version_timeout,
+            module=require_arg,
+            names=sorted({*PLAYWRIGHT_BROWSER_TYPES, bin_name}),
+        )
+        if isinstance(browser_paths, dict):
+            return browser_paths
+
         script = (
             "const pw=require(process.argv[1]);"
             "const bt=pw[process.argv[2]];"
@@ -491,31 +597,15 @@ class PlaywrightProvider(BinProvider):
             "try{process.stdout.write(bt.executablePath());}"
             "catch(e){process.exit(3);}"
         )
-        # Resolve node via the normal provider API every time instead of
-        # caching hidden provider-local state.
-        node_binary = Binary(
-            name="node",
-            binproviders=[
-                EnvProvider(
-                    postinstall_scripts=True,
-                    min_release_age=0,
-                ),
-            ],
-            postinstall_scripts=True,
-            min_release_age=0,
-        ).load(no_cache=no_cache)
-        if node_binary is None or node_binary.loaded_abspath is None:
-            return None
         proc = self.exec(
-            bin_name=node_binary.loaded_abspath,
+            bin_name=node_abspath,
             cmd=["-e", script, require_arg, bin_name],
             quiet=True,
             timeout=self.version_timeout,
         )
-        if proc.returncode != 0 or not proc.stdout.strip():
-            return None
-        path = Path(proc.stdout.strip())
-        return path if path.exists() else None
+        return {
+            bin_name: (proc.stdout.strip() if proc.returncode == 0 else None) or None,
+        }
 
     def _refresh_symlink(self, bin_name: str, target: Path) -> Path:
         """Refresh the managed browser shim, using a tiny launcher for macOS .app bundles."""
@@ -29,6 +29,12 @@ from .binprovider import (
     log_method_call,
     remap_kwargs,
 )
+from .binprovider_npm import (
+    node_modules_bin_entries,
+    node_package_bin_names,
+    node_package_name,
+    node_package_version,
+)
 from .logging import format_subprocess_output
 from .semver import SemVer
 
@@ -88,6 +94,25 @@ class PnpmProvider(BinProvider):
             env["NODE_PATH"] = ":" + node_modules_dir
         return env
 
+    def _bin_index_watch_paths(self) -> list[Path]:
+        if self.install_root is None:
+            return super()._bin_index_watch_paths()
+        return [
+            *super()._bin_index_watch_paths(),
+            self.install_root / "node_modules",
+        ]
+
+    def scan_bin_index(self) -> dict[str, BinProvider.BinIndexEntry]:
+        entries = super().scan_bin_index()
+        if self.install_root is not None and self.bin_dir is not None:
+            entries.update(
+                node_modules_bin_entries(
+                    self.install_root / "node_modules",
+                    self.bin_dir,
+                ),
+            )
+        return entries
+
     def get_cache_info(
         self,
         bin_name: BinName,
@@ -100,12 +125,7 @@ class PnpmProvider(BinProvider):
         install_args = self.get_install_args(str(bin_name), quiet=True) or [
             str(bin_name),
         ]
-        main_package = install_args[0]
-        package = (
-            "@" + main_package[1:].split("@", 1)[0]
-            if main_package.startswith("@")
-            else main_package.split("@", 1)[0]
-        )
+        package = node_package_name(install_args[0])
         package_json = self.install_root / "node_modules" / package / "package.json"
         if package_json.exists():
             cache_info["fingerprint_paths"].append(package_json)
@@ -125,6 +145,9 @@ class PnpmProvider(BinProvider):
     def supports_postinstall_disable(self, action, no_cache: bool = False) -> bool:
         return action in ("install", "update")
 
+    def supports_batch_install(self) -> bool:
+        return True
+
     def default_install_args_handler(
         self,
         bin_name: BinName,
@@ -203,13 +226,13 @@ class PnpmProvider(BinProvider):
             node_loaded
             and node_loaded.loaded_abspath
             and node_loaded.loaded_version
-            and node_loaded.loaded_sha256
+            and node_loaded.known_sha256
         ):
             self.write_cached_binary(
                 "node",
                 node_loaded.loaded_abspath,
                 node_loaded.loaded_version,
-                node_loaded.loaded_sha256,
+                node_loaded.known_sha256,
                 resolved_provider_name=(
                     node_loaded.loaded_binprovider.name
                     if node_loaded.loaded_binprovider is not None
@@ -458,23 +481,35 @@ class PnpmProvider(BinProvider):
         except Exception:
             return None
 
-        # Fallback: ask `pnpm view` for the package's bin entries and look
-        # them up by name in our PATH.
+        # Fallback: read the package's bin entries from its installed
+        # package.json (or ask `pnpm view` when it isn't installed locally)
+        # and look them up by name in our PATH.
         try:
             install_args = self.get_install_args(str(bin_name)) or [str(bin_name)]
-            package_info = json.loads(
-                self.exec(
-                    bin_name=pnpm_abspath,
-                    cmd=["view", "--json", install_args[0], "bin"],
-                    timeout=self.version_timeout,
-                    quiet=True,
-                ).stdout.strip(),
-            )
             alt_bin_names = (
-                package_info.get("bin", package_info)
-                if isinstance(package_info, dict)
-                else {}
-            ).keys()
+                node_package_bin_names(
+                    self.install_root / "node_modules",
+                    node_package_name(install_args[0]),
+                )
+                if self.install_root
+                else None
+            )
+            if alt_bin_names is None:
+                package_info = json.loads(
+                    self.exec(
+                        bin_name=pnpm_abspath,
+                        cmd=["view", "--json", install_args[0], "bin"],
+                        timeout=self.version_timeout,
+                        quiet=True,
+                    ).stdout.strip(),
+                )
+                alt_bin_names = list(
+                    (
+                        package_info.get("bin", package_info)
+                        if isinstance(package_info, dict)
+                        else {}
+                    ).keys(),
+                )
             for alt_bin_name in alt_bin_names:
                 abspath = bin_abspath(
                     alt_bin_name,
@@ -514,17 +549,16 @@ class PnpmProvider(BinProvider):
         except Exception:
             return None
 
-        # Fallback: ask `pnpm ls --json` for the installed version of the
-        # main package, and finally fall back to reading its package.json.
+        # Fallback: read the main package's installed package.json, then ask
+        # `pnpm ls --json`, and finally read package.json from `pnpm root`.
         install_args = self.get_install_args(str(bin_name), **context) or [
             str(bin_name),
         ]
-        main_package = install_args[0]
-        package = (
-            "@" + main_package[1:].split("@", 1)[0]
-            if main_package.startswith("@")
-            else main_package.split("@", 1)[0]
-        )
+        package = node_package_name(install_args[0])
+        if self.install_root:
+            version = node_package_version(self.install_root / "node_modules", package)
+            if version:
+                return version
         try:
             json_output = self.exec(
                 bin_name=pnpm_abspath,
@@ -558,9 +592,7 @@ class PnpmProvider(BinProvider):
                     quiet=True,
                 ).stdout.strip(),
             )
-            return json.loads((modules_dir / package / "package.json").read_text())[
-                "version"
-            ]
+            return node_package_version(modules_dir, package)
         except Exception:
             return None
 
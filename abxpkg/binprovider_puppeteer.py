@@ -7,6 +7,7 @@ import re
 import shlex
 import shutil
 import subprocess
+import threading
 from pathlib import Path
 from typing import Self
 from collections.abc import Iterable
@@ -36,10 +37,52 @@ from .logging import (
     get_logger,
     log_subprocess_output,
 )
+from .node_helper import NodeHelper, load_node_abspath
 from .semver import SemVer
 
 logger = get_logger(__name__)
 
+# Installed-browser index per browser cache dir: browser name -> installs as
+# (pre-parsed version, version, executable path), newest first. Validated
+# against the mtimes of the cache dir and its per-browser subdirs (a new build
+# lands in ``<cache_dir>/<browser>/<platform>-<build>/``).
+InstalledBrowserIndex = dict[str, list[tuple[SemVer | None, str, Path]]]
+_INSTALLED_BROWSERS: dict[
+    str,
+    tuple[tuple[tuple[str, int], ...], InstalledBrowserIndex],
+] = {}
+_INSTALLED_BROWSERS_LOCK = threading.Lock()
+
+# Executable locations inside ``<cache_dir>/<browser>/<platform>-<build>/``,
+# mirroring @puppeteer/browsers' relativeExecutablePath() for each platform.
+PUPPETEER_BROWSER_EXECUTABLES: dict[str, tuple[str, ...]] = {
+    "chrome": (
+        "chrome-linux64/chrome",
+        "chrome-mac-*/Google Chrome for Testing.app/Contents/MacOS/Google Chrome for Testing",
+        "chrome-win*/chrome.exe",
+    ),
+    "chrome-headless-shell": (
+        "chrome-headless-shell-linux64/chrome-headless-shell",
+        "chrome-headless-shell-mac-*/chrome-headless-shell",
+        "chrome-headless-shell-win*/chrome-headless-shell.exe",
+    ),
+    "chromedriver": (
+        "chromedriver-linux64/chromedriver",
+        "chromedriver-mac-*/chromedriver",
+        "chromedriver-win*/chromedriver.exe",
+    ),
+    "chromium": (
+        "chrome-linux/chrome",
+        "chrome-mac/Chromium.app/Contents/MacOS/Chromium",
+        "chrome-win/chrome.exe",
+    ),
+    "firefox": (
+        "firefox/firefox",
+        "Firefox*.app/Contents/MacOS/firefox",
+        "firefox/firefox.exe",
+    ),
+}
+
 CLAUDE_SANDBOX_NO_PROXY = (
     "localhost,127.0.0.1,169.254.169.254,metadata.google.internal,"
     ".svc.cluster.local,.local"
@@ -143,13 +186,13 @@ class PuppeteerProvider(BinProvider):
             node_loaded
             and node_loaded.loaded_abspath
             and node_loaded.loaded_version
-            and node_loaded.loaded_sha256
+            and node_loaded.known_sha256
         ):
             self.write_cached_binary(
                 "node",
                 node_loaded.loaded_abspath,
                 node_loaded.loaded_version,
-                node_loaded.loaded_sha256,
+                node_loaded.known_sha256,
                 resolved_provider_name=(
                     node_loaded.loaded_binprovider.name
                     if node_loaded.loaded_binprovider is not None
@@ -298,16 +341,154 @@ class PuppeteerProvider(BinProvider):
             normalized.append(f"--path={self.cache_dir}")
         return normalized
 
-    def _list_installed_browsers(
+    def _installed_browser_index(
         self,
         no_cache: bool = False,
-    ) -> list[tuple[str, str, Path]]:
+    ) -> InstalledBrowserIndex:
+        """Installed browsers in the cache dir, grouped by browser name with
+        pre-parsed versions and memoized until the cache dir changes."""
+        # the CLI's default --path is its cwd, which we set to install_root
+        browsers_dir = self.cache_dir or (self.install_root or Path(".")).absolute()
+        stamp = self._browser_cache_stamp(browsers_dir)
+        with _INSTALLED_BROWSERS_LOCK:
+            memoized = _INSTALLED_BROWSERS.get(str(browsers_dir))
+        if not no_cache and memoized is not None and memoized[0] == stamp:
+            return memoized[1]
+
+        matches = self._scan_installed_browsers(browsers_dir)
+        if matches is None:
+            try:
+                installer_bin = self.INSTALLER_BINARY(no_cache=no_cache).loaded_abspath
+            except Exception:
+                return {}
+            if not installer_bin:
+                return {}
+            matches = self._query_installed_browsers(
+                installer_bin,
+                browsers_dir,
+                no_cache,
+            )
+            if matches is None:
+                matches = self._list_installed_browsers_via_cli(installer_bin)
+                if matches is None:
+                    return {}
+
+        index: InstalledBrowserIndex = {}
+        for browser, version, path in matches:
+            index.setdefault(browser, []).append((SemVer.parse(version), version, path))
+        for installs in index.values():
+            installs.sort(
+                key=lambda item: (item[0] is not None, item[0] or ()), reverse=True
+            )
+        with _INSTALLED_BROWSERS_LOCK:
+            _INSTALLED_BROWSERS[str(browsers_dir)] = (stamp, index)
+        return index
+
+    @staticmethod
+    def _scan_installed_browsers(
+        browsers_dir: Path,
+    ) -> list[tuple[str, str, Path]] | None:
+        """List installed browsers by walking the
+        ``<cache_dir>/<browser>/<platform>-<build>/`` layout directly.
+
+        Returns None when a build dir has a layout we don't recognize, so the
+        caller can ask @puppeteer/browsers instead.
+        """
+        matches: list[tuple[str, str, Path]] = []
         try:
-            installer_bin = self.INSTALLER_BINARY(no_cache=no_cache).loaded_abspath
-        except Exception:
-            return []
-        if not installer_bin:
-            return []
+            browser_dirs = [
+                entry
+                for entry in os.scandir(browsers_dir)
+                if entry.is_dir() and not entry.name.startswith(".")
+            ]
+        except OSError:
+            return matches
+        for browser_dir in browser_dirs:
+            patterns = PUPPETEER_BROWSER_EXECUTABLES.get(browser_dir.name)
+            try:
+                build_dirs = [
+                    entry
+                    for entry in os.scandir(browser_dir.path)
+                    if entry.is_dir() and "-" in entry.name
+                ]
+            except OSError:
+                continue
+            if build_dirs and patterns is None:
+                return None
+            for build_dir in build_dirs:
+                build_id = build_dir.name.split("-", 1)[1]
+                executable = next(
+                    (
+                        path
+                        for pattern in patterns or ()
+                        for path in sorted(Path(build_dir.path).glob(pattern))
+                        if path.is_file()
+                    ),
+                    None,
+                )
+                if executable is None:
+                    return None
+                matches.append((browser_dir.name, build_id, executable))
+        return matches
+
+    @staticmethod
+    def _browser_cache_stamp(browsers_dir: Path) -> tuple[tuple[str, int], ...]:
+        """mtimes of the browser cache dir and its per-browser subdirs."""
+        try:
+            stamp = [("", browsers_dir.stat().st_mtime_ns)]
+            stamp.extend(
+                (entry.name, entry.stat().st_mtime_ns)
+                for entry in os.scandir(browsers_dir)
+                if entry.is_dir()
+            )
+        except OSError:
+            return ()
+        return tuple(sorted(stamp))
+
+    def _query_installed_browsers(
+        self,
+        installer_bin: Path,
+        browsers_dir: Path,
+        no_cache: bool = False,
+    ) -> list[tuple[str, str, Path]] | None:
+        """List installed browsers via ``getInstalledBrowsers()`` from the
+        ``@puppeteer/browsers`` package behind the CLI, using the shared node
+        helper process instead of a CLI cold start."""
+        package_dir = next(
+            (
+                parent
+                for parent in Path(installer_bin).resolve().parents
+                if parent.name == "browsers" and parent.parent.name == "@puppeteer"
+            ),
+            None,
+        )
+        if package_dir is None:
+            return None
+        node_abspath = load_node_abspath(no_cache=no_cache)
+        if node_abspath is None:
+            return None
+        browsers = NodeHelper.get(self, node_abspath).request(
+            "installedBrowsers",
+            timeout=self.version_timeout,
+            module=str(package_dir),
+            cacheDir=str(browsers_dir),
+        )
+        if not isinstance(browsers, list):
+            return None
+        return [
+            (
+                str(browser["browser"]),
+                str(browser["buildId"]),
+                Path(browser["executablePath"]),
+            )
+            for browser in browsers
+            if isinstance(browser, dict) and browser.get("executablePath")
+        ]
+
+    def _list_installed_browsers_via_cli(
+        self,
+        installer_bin: Path,
+    ) -> list[tuple[str, str, Path]] | None:
         cmd = ["list"]
         if self.cache_dir is not None:
             cmd.append(f"--path={self.cache_dir}")
@@ -319,7 +500,7 @@ class PuppeteerProvider(BinProvider):
             timeout=self.version_timeout,
         )
         if proc.returncode != 0:
-            return []
+            return None
 
         matches: list[tuple[str, str, Path]] = []
         pattern = re.compile(
@@ -338,6 +519,17 @@ class PuppeteerProvider(BinProvider):
             )
         return matches
 
+    @staticmethod
+    def _newest_installed_browser(
+        installs: list[tuple[SemVer | None, str, Path]],
+    ) -> Path | None:
+        """Path of the newest parseable install, or of the only install."""
+        if installs and installs[0][0] is not None:
+            return installs[0][2]
+        if len(installs) == 1:
+            return installs[0][2]
+        return None
+
     def _parse_installed_browser_path(
         self,
         output: str,
@@ -347,24 +539,19 @@ class PuppeteerProvider(BinProvider):
             r"^(?P<browser>[^@\s]+)@(?P<version>\S+)(?:\s+\([^)]+\))?\s+(?P<path>.+)$",
             re.MULTILINE,
         )
-        matches = [
+        installs = [
             (
+                SemVer.parse(match.group("version")),
                 match.group("version"),
                 Path(match.group("path")),
             )
             for match in pattern.finditer(output or "")
             if match.group("browser") == browser_name
         ]
-        parsed_matches = [
-            (parsed_version, path)
-            for version, path in matches
-            if (parsed_version := SemVer.parse(version)) is not None
-        ]
-        if parsed_matches:
-            return max(parsed_matches, key=lambda item: item[0])[1]
-        if len(matches) == 1:
-            return matches[0][1]
-        return None
+        installs.sort(
+            key=lambda item: (item[0] is not None, item[0] or ()), reverse=True
+        )
+        return self._newest_installed_browser(installs)
 
     def _resolve_installed_browser_path(
         self,
@@ -373,23 +560,8 @@ class PuppeteerProvider(BinProvider):
         no_cache: bool = False,
     ) -> Path | None:
         browser_name = self._browser_name(bin_name, install_args or [bin_name])
-        candidates = [
-            (version, path)
-            for candidate_browser, version, path in self._list_installed_browsers(
-                no_cache=no_cache,
-            )
-            if candidate_browser == browser_name
-        ]
-        parsed_candidates = [
-            (parsed_version, path)
-            for version, path in candidates
-            if (parsed_version := SemVer.parse(version)) is not None
-        ]
-        if parsed_candidates:
-            return max(parsed_candidates, key=lambda item: item[0])[1]
-        if len(candidates) == 1:
-            return candidates[0][1]
-        return None
+        index = self._installed_browser_index(no_cache=no_cache)
+        return self._newest_installed_browser(index.get(browser_name, []))
 
     def _refresh_symlink(self, bin_name: str, target: Path) -> Path:
         bin_dir = self.bin_dir
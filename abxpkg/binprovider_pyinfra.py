@@ -263,13 +263,13 @@ class PyinfraProvider(BinProvider):
             python_loaded
             and python_loaded.loaded_abspath
             and python_loaded.loaded_version
-            and python_loaded.loaded_sha256
+            and python_loaded.known_sha256
         ):
             self.write_cached_binary(
                 "python",
                 python_loaded.loaded_abspath,
                 python_loaded.loaded_version,
-                python_loaded.loaded_sha256,
+                python_loaded.known_sha256,
                 resolved_provider_name=(
                     python_loaded.loaded_binprovider.name
                     if python_loaded.loaded_binprovider is not None
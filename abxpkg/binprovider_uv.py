@@ -17,6 +17,7 @@ from .base_types import (
     abxpkg_install_root_default,
 )
 from .binprovider import BinProvider, env_flag_is_true, log_method_call, remap_kwargs
+from .binprovider_pip import load_venv_index
 from .logging import format_command, format_subprocess_output, get_logger
 from .semver import SemVer
 
@@ -93,6 +94,10 @@ class UvProvider(BinProvider):
     def supports_postinstall_disable(self, action, no_cache: bool = False) -> bool:
         return action in ("install", "update")
 
+    def supports_batch_install(self) -> bool:
+        # ``uv pip install`` takes many packages, ``uv tool install`` only one
+        return self.install_root is not None
+
     @computed_field
     @property
     def is_valid(self) -> bool:
@@ -263,8 +268,26 @@ class UvProvider(BinProvider):
         package_name = package_name.split("[", 1)[0].strip()
         return package_name or None
 
+    def _bin_index_watch_paths(self) -> list[Path]:
+        if self.install_root is None:
+            return super()._bin_index_watch_paths()
+        venv = self.install_root / "venv"
+        return [venv / "bin", *sorted(venv.glob("lib/python*/site-packages"))]
+
+    def scan_bin_index(self) -> dict[str, BinProvider.BinIndexEntry]:
+        entries = super().scan_bin_index()
+        venv_index = (
+            load_venv_index(self.install_root / "venv") if self.install_root else None
+        )
+        if venv_index is not None:
+            entries.update(venv_index.bin_entries())
+        return entries
+
     def _package_name_for_bin(self, bin_name: BinName, **context) -> str:
         """Pick the owning Python package name used for uv metadata lookups."""
+        indexed = self.lookup_bin_index(bin_name)
+        if indexed and indexed["package"]:
+            return indexed["package"]
         install_args = self.get_install_args(str(bin_name), **context) or [
             str(bin_name),
         ]
@@ -284,18 +307,14 @@ class UvProvider(BinProvider):
             return cache_info
 
         package_name = self._package_name_for_bin(str(bin_name))
-        normalized_name = package_name.lower().replace("-", "_")
-        metadata_files = sorted(
-            ((self.install_root / "venv") / "lib").glob(
-                f"python*/site-packages/{normalized_name}*.dist-info/METADATA",
-            ),
-        ) or sorted(
-            ((self.install_root / "venv") / "lib").glob(
-                f"python*/site-packages/{normalized_name}*.dist-info/PKG-INFO",
-            ),
+        venv_index = load_venv_index(self.install_root / "venv")
+        installed_package = (
+            venv_index.package_for(str(bin_name), package_name) if venv_index else None
         )
-        if metadata_files:
-            cache_info["fingerprint_paths"].append(metadata_files[0])
+        if venv_index is not None and installed_package:
+            cache_info["fingerprint_paths"].append(
+                venv_index.metadata_paths[installed_package],
+            )
         return cache_info
 
     def _version_from_uv_metadata(
@@ -304,7 +323,18 @@ class UvProvider(BinProvider):
         timeout: int | None = None,
         no_cache: bool = False,
     ) -> SemVer | None:
-        """Read a package version from ``uv pip show`` or ``uv tool list`` metadata."""
+        """Read a package version from the venv's dist-info, falling back to
+        ``uv pip show`` or ``uv tool list`` metadata."""
+        venv = (
+            self.install_root / "venv"
+            if self.install_root
+            else self.tool_dir / package_name
+        )
+        venv_index = load_venv_index(venv)
+        if venv_index is not None:
+            version = venv_index.version_for(package_name, package_name)
+            if version:
+                return version
         try:
             uv_abspath = self.INSTALLER_BINARY(no_cache=no_cache).loaded_abspath
             assert uv_abspath
@@ -578,9 +608,18 @@ class UvProvider(BinProvider):
             installer_binary = self.INSTALLER_BINARY(no_cache=no_cache)
         except Exception:
             return None
-        # Fallback: ``uv pip show`` for venv mode.
+        # Fallback: the venv's dist-info, then ``uv pip show`` for venv mode.
         if self.install_root:
             tool_name = self._package_name_for_bin(str(bin_name), **context)
+            venv_index = load_venv_index(self.install_root / "venv")
+            if venv_index is not None and venv_index.package_for(
+                str(bin_name),
+                tool_name,
+            ):
+                candidate = venv_index.bin_dir / str(bin_name)
+                if candidate.exists():
+                    return TypeAdapter(HostBinPath).validate_python(candidate)
+                return None
             assert installer_binary.loaded_abspath
             proc = self.exec(
                 bin_name=installer_binary.loaded_abspath,
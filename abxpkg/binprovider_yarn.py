@@ -27,6 +27,12 @@ from .binprovider import (
     log_method_call,
     remap_kwargs,
 )
+from .binprovider_npm import (
+    node_modules_bin_entries,
+    node_package_bin_names,
+    node_package_name,
+    node_package_version,
+)
 from .logging import format_subprocess_output
 from .semver import SemVer
 
@@ -99,6 +105,25 @@ class YarnProvider(BinProvider):
         # platform cache dir; there is no separate provider field to override.
         return Path(USER_CACHE_PATH)
 
+    def _bin_index_watch_paths(self) -> list[Path]:
+        if self.install_root is None:
+            return super()._bin_index_watch_paths()
+        return [
+            *super()._bin_index_watch_paths(),
+            self.install_root / "node_modules",
+        ]
+
+    def scan_bin_index(self) -> dict[str, BinProvider.BinIndexEntry]:
+        entries = super().scan_bin_index()
+        if self.install_root is not None and self.bin_dir is not None:
+            entries.update(
+                node_modules_bin_entries(
+                    self.install_root / "node_modules",
+                    self.bin_dir,
+                ),
+            )
+        return entries
+
     def get_cache_info(
         self,
         bin_name: BinName,
@@ -111,12 +136,7 @@ class YarnProvider(BinProvider):
         install_args = self.get_install_args(str(bin_name), quiet=True) or [
             str(bin_name),
         ]
-        main_package = install_args[0]
-        package = (
-            "@" + main_package[1:].split("@", 1)[0]
-            if main_package.startswith("@")
-            else main_package.split("@", 1)[0]
-        )
+        package = node_package_name(install_args[0])
         package_json = self.install_root / "node_modules" / package / "package.json"
         if package_json.exists():
             cache_info["fingerprint_paths"].append(package_json)
@@ -217,12 +237,12 @@ class YarnProvider(BinProvider):
                 binproviders=installer_providers,
             ).load(no_cache=no_cache)
             if loaded and loaded.loaded_abspath:
-                if loaded.loaded_version and loaded.loaded_sha256:
+                if loaded.loaded_version and loaded.known_sha256:
                     self.write_cached_binary(
                         self.INSTALLER_BIN,
                         loaded.loaded_abspath,
                         loaded.loaded_version,
-                        loaded.loaded_sha256,
+                        loaded.known_sha256,
                         resolved_provider_name=(
                             loaded.loaded_binprovider.name
                             if loaded.loaded_binprovider is not None
@@ -259,13 +279,13 @@ class YarnProvider(BinProvider):
             node_loaded
             and node_loaded.loaded_abspath
             and node_loaded.loaded_version
-            and node_loaded.loaded_sha256
+            and node_loaded.known_sha256
         ):
             self.write_cached_binary(
                 "node",
                 node_loaded.loaded_abspath,
                 node_loaded.loaded_version,
-                node_loaded.loaded_sha256,
+                node_loaded.known_sha256,
                 resolved_provider_name=(
                     node_loaded.loaded_binprovider.name
                     if node_loaded.loaded_binprovider is not None
@@ -593,9 +613,26 @@ class YarnProvider(BinProvider):
             return None
 
         if self.install_root:
-            candidate = self.install_root / "node_modules" / ".bin" / str(bin_name)
+            bin_dir = self.install_root / "node_modules" / ".bin"
+            candidate = bin_dir / str(bin_name)
             if candidate.exists():
                 return TypeAdapter(HostBinPath).validate_python(candidate)
+
+            # the package may expose the binary under another name, read its
+            # installed package.json bin entries to find the right .bin link
+            install_args = self.get_install_args(str(bin_name), quiet=True) or [
+                str(bin_name),
+            ]
+            for alt_bin_name in (
+                node_package_bin_names(
+                    self.install_root / "node_modules",
+                    node_package_name(install_args[0]),
+                )
+                or []
+            ):
+                candidate = bin_dir / alt_bin_name
+                if candidate.exists():
+                    return TypeAdapter(HostBinPath).validate_python(candidate)
         return None
 
     def default_version_handler(
@@ -627,20 +664,9 @@ class YarnProvider(BinProvider):
         install_args = self.get_install_args(str(bin_name), **context) or [
             str(bin_name),
         ]
-        main_package = install_args[0]
-        package = (
-            "@" + main_package[1:].split("@", 1)[0]
-            if main_package.startswith("@")
-            else main_package.split("@", 1)[0]
-        )
+        package = node_package_name(install_args[0])
         assert self.install_root is not None  # guarded by early return above
-        package_json = self.install_root / "node_modules" / package / "package.json"
-        if package_json.exists():
-            try:
-                return json.loads(package_json.read_text())["version"]
-            except Exception:
-                return None
-        return None
+        return node_package_version(self.install_root / "node_modules", package)
 
 
 if __name__ == "__main__":
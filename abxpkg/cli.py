@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import json
 import logging as py_logging
 import os
@@ -22,16 +23,27 @@ from rich.theme import Theme
 
 from . import ALL_PROVIDER_NAMES, DEFAULT_PROVIDER_NAMES, PROVIDER_CLASS_BY_NAME, Binary
 from .base_types import DEFAULT_LIB_DIR
+from .binary import (
+    install_many,
+    load_many,
+    probe_deadline,
+    probe_max_workers,
+    run_concurrently,
+)
 from .binprovider import DEFAULT_ENV_PATH, BinProvider, HandlerDict, env_flag_is_true
 from .config import load_derived_cache
 from .exceptions import ABXPkgError
 from .logging import (
     RICH_INSTALLED,
+    ActionTiming,
+    add_timing_callback,
     configure_logging,
     format_command,
     format_exception_with_output,
     format_loaded_binary_line,
+    format_timings,
     get_logger,
+    remove_timing_callback,
     summarize_value,
 )
 
@@ -62,6 +74,9 @@ class CliOptions:
     euid: int | None = None
     install_timeout: int | None = None
     version_timeout: int | None = None
+    skip_sha256: bool | None = None
+    # CLI-only: print a per-action timing table to stderr on exit.
+    timings: bool = False
 
 
 _NONE_STRINGS = frozenset({"", "none", "null"})
@@ -307,6 +322,12 @@ def resolve_no_cache(flag_value: bool | None) -> bool:
     return env_flag_is_true("ABXPKG_NO_CACHE")
 
 
+def resolve_timings(flag_value: bool | None) -> bool:
+    if flag_value is not None:
+        return flag_value
+    return env_flag_is_true("ABXPKG_TIMINGS")
+
+
 def build_providers(
     provider_names: list[str],
     *,
@@ -316,6 +337,7 @@ def build_providers(
     euid: int | None = None,
     install_timeout: int | None = None,
     version_timeout: int | None = None,
+    skip_sha256: bool | None = None,
 ) -> list[BinProvider]:
     providers: list[BinProvider] = []
     for provider_name in provider_names:
@@ -327,6 +349,8 @@ def build_providers(
             provider_kwargs["install_timeout"] = install_timeout
         if version_timeout is not None:
             provider_kwargs["version_timeout"] = version_timeout
+        if skip_sha256 is not None:
+            provider_kwargs["skip_sha256"] = skip_sha256
         # User-supplied --install-root overrides the provider's default.
         # Otherwise each provider resolves its own install_root from
         # ABXPKG_LIB_DIR (set by resolve_lib_dir) via default_factory.
@@ -338,7 +362,13 @@ def build_providers(
     return providers
 
 
-def build_binary(binary_name: str, options: CliOptions, *, dry_run: bool) -> Binary:
+def build_binary(
+    binary_name: str,
+    options: CliOptions,
+    *,
+    dry_run: bool,
+    providers: list[BinProvider] | None = None,
+) -> Binary:
     merged_overrides = options.overrides
     if options.handler_overrides:
         merged_overrides = {
@@ -372,7 +402,10 @@ def build_binary(binary_name: str, options: CliOptions, *, dry_run: bool) -> Bin
 
     binary_kwargs: dict[str, Any] = {
         "name": binary_name,
-        "binproviders": build_providers(
+        # several binaries built from one shared provider list also share
+        # each provider's PATH setup and INSTALLER_BINARY resolution
+        "binproviders": providers
+        or build_providers(
             options.provider_names,
             dry_run=dry_run,
             install_root=options.install_root,
@@ -380,6 +413,7 @@ def build_binary(binary_name: str, options: CliOptions, *, dry_run: bool) -> Bin
             euid=options.euid,
             install_timeout=options.install_timeout,
             version_timeout=options.version_timeout,
+            skip_sha256=options.skip_sha256,
         ),
     }
     # Binary's field validators coerce str → SemVer, dict → BinaryOverrides,
@@ -421,6 +455,8 @@ def build_cli_options(
     euid: int | None,
     install_timeout: int | None,
     version_timeout: int | None,
+    skip_sha256: bool | None = None,
+    timings: bool | None = None,
 ) -> CliOptions:
     """Single entry-point used by the group callback and every subcommand.
 
@@ -483,6 +519,8 @@ def build_cli_options(
             euid=euid,
             install_timeout=install_timeout,
             version_timeout=version_timeout,
+            skip_sha256=skip_sha256,
+            timings=resolve_timings(timings),
         )
     provider_names = (
         group.provider_names
@@ -517,6 +555,8 @@ def build_cli_options(
         euid=_override(euid, group.euid),
         install_timeout=_override(install_timeout, group.install_timeout),
         version_timeout=_override(version_timeout, group.version_timeout),
+        skip_sha256=_override(skip_sha256, group.skip_sha256),
+        timings=_override(timings, group.timings),
     )
 
 
@@ -707,6 +747,29 @@ def configure_cli_logging(*, debug: bool) -> None:
     )
 
 
+def configure_cli_timings(*, timings: bool) -> None:
+    """Record every timed provider/Binary action for the rest of this CLI
+    invocation and print them as a table to stderr when it exits."""
+    ctx = click.get_current_context(silent=True)
+    if not timings or ctx is None:
+        return
+    root = ctx.find_root()
+    if root.meta.get("abxpkg.timings") is not None:
+        return
+    recorded: list[ActionTiming] = []
+    root.meta["abxpkg.timings"] = recorded
+    callback = recorded.append
+    add_timing_callback(callback)
+
+    def print_timings() -> None:
+        remove_timing_callback(callback)
+        if recorded:
+            for line in format_timings(recorded):
+                click.echo(line, err=True)
+
+    root.call_on_close(print_timings)
+
+
 def format_error(err: Exception) -> str:
     return format_exception_with_output(err)
 
@@ -729,6 +792,7 @@ def cached_binaries(
             euid=options.euid,
             install_timeout=options.install_timeout,
             version_timeout=options.version_timeout,
+            skip_sha256=options.skip_sha256,
         ),
     )
     for provider in provider_instances:
@@ -816,6 +880,7 @@ def list_cached_binaries(
             euid=options.euid,
             install_timeout=options.install_timeout,
             version_timeout=options.version_timeout,
+            skip_sha256=options.skip_sha256,
         ),
     )
     installer_lines: list[str] = []
@@ -865,9 +930,11 @@ def version_report(options: CliOptions):
         euid=options.euid,
         install_timeout=options.install_timeout,
         version_timeout=options.version_timeout,
+        skip_sha256=options.skip_sha256,
     )
     install_timeout = all_providers[0].install_timeout if all_providers else 120
     version_timeout = all_providers[0].version_timeout if all_providers else 10
+    skip_sha256 = all_providers[0].skip_sha256 if all_providers else False
 
     def render_env_value(value: Any) -> str:
         if isinstance(value, Path):
@@ -912,12 +979,14 @@ def version_report(options: CliOptions):
     append_env_var("ABXPKG_NO_CACHE", options.no_cache)
     append_env_var("ABXPKG_INSTALL_TIMEOUT", install_timeout)
     append_env_var("ABXPKG_VERSION_TIMEOUT", version_timeout)
+    append_env_var("ABXPKG_PROBE_DEADLINE", probe_deadline())
+    append_env_var("ABXPKG_SKIP_SHA256", skip_sha256)
     append_env_var("ABXPKG_POSTINSTALL_SCRIPTS", options.postinstall_scripts)
     append_env_var("ABXPKG_MIN_RELEASE_AGE", options.min_release_age)
     append_env_var("ABXPKG_BINPROVIDERS", ",".join(options.provider_names))
     append_env_var("ABXPKG_LIB_DIR", options.lib_dir)
     yield summary_line
-    for provider in build_providers(
+    providers = build_providers(
         options.provider_names,
         dry_run=False,
         install_root=options.install_root,
@@ -925,19 +994,30 @@ def version_report(options: CliOptions):
         euid=options.euid,
         install_timeout=options.install_timeout,
         version_timeout=options.version_timeout,
-    ):
+        skip_sha256=options.skip_sha256,
+    )
+
+    def probe_provider(provider: BinProvider):
         try:
             provider.setup_PATH(no_cache=options.no_cache)
         except Exception:
             pass
+        return provider.INSTALLER_BINARY(no_cache=options.no_cache)
+
+    # each provider's installer probe is independent: run them side by side,
+    # bounded by ABXPKG_PROBE_DEADLINE so a hung binary can't stall the report
+    installer_binaries = run_concurrently(
+        (functools.partial(probe_provider, provider) for provider in providers),
+        max_workers=probe_max_workers(),
+        timeout=probe_deadline(),
+        thread_name_prefix="abxpkg-version",
+    )
+    for provider, installer_binary in zip(providers, installer_binaries):
         emoji = (
             type(provider).__private_attributes__["_log_emoji"].default
             or BinProvider.__private_attributes__["_log_emoji"].default
         )
-        installer_binary = None
-        try:
-            installer_binary = provider.INSTALLER_BINARY(no_cache=options.no_cache)
-        except Exception:
+        if isinstance(installer_binary, Exception):
             installer_binary = None
 
         status = "✅" if provider.is_valid else "❌"
@@ -1058,6 +1138,20 @@ def shared_options(command):
     # string through a parser so the command receives a typed value
     # (bool / int / float / Path / dict) instead of a string.
     for decorator in (
+        click.option(
+            "--timings",
+            metavar="BOOL",
+            default=None,
+            callback=_click_parse(_parse_cli_bool),
+            help="Print wall-time, subprocess count, and cache hit/miss for every provider action to stderr on exit ('True'/'False'/'None' or bare `--timings` for implicit True). Defaults to ABXPKG_TIMINGS or False.",
+        ),
+        click.option(
+            "--skip-sha256",
+            metavar="BOOL",
+            default=None,
+            callback=_click_parse(_parse_cli_bool),
+            help="Never hash loaded binaries, report sha256 as 'unknown' ('True'/'False'/'None' or bare `--skip-sha256` for implicit True). Defaults to ABXPKG_SKIP_SHA256 or False.",
+        ),
         click.option(
             "--version-timeout",
             metavar="SECONDS",
@@ -1230,6 +1324,8 @@ _SHARED_OPTION_NAMES: tuple[str, ...] = (
     "euid",
     "install_timeout",
     "version_timeout",
+    "skip_sha256",
+    "timings",
 )
 
 
@@ -1249,20 +1345,26 @@ def run_binary_command(
     binary = build_binary(binary_name, options, dry_run=options.dry_run)
     method = getattr(binary, action)
     configure_cli_logging(debug=options.debug)
+    configure_cli_timings(timings=options.timings)
 
     try:
-        if action == "load":
-            result = method(no_cache=options.no_cache)
-        else:
-            result = method(dry_run=options.dry_run, no_cache=options.no_cache)
+        with binary.cache_batch():
+            if action == "load":
+                result = method(no_cache=options.no_cache)
+            else:
+                result = method(dry_run=options.dry_run, no_cache=options.no_cache)
     except ABXPkgError as err:
         raise click.ClickException(format_error(err)) from err
 
+    echo_binary_result(result, action=action, options=options)
+
+
+def echo_binary_result(result: Binary, *, action: str, options: CliOptions) -> None:
     if options.dry_run and action != "load":
         return
 
     if action == "uninstall":
-        _echo(binary_name)
+        _echo(result.name)
         return
 
     provider = result.loaded_binprovider
@@ -1277,6 +1379,93 @@ def run_binary_command(
     )
 
 
+def run_binary_commands(
+    binary_names: Iterable[str],
+    *,
+    action: str,
+    options: CliOptions,
+) -> None:
+    """run_binary_command() for several names at once.
+
+    Every binary shares one provider set, so PATH setup and installer
+    resolution happen once per provider instead of once per name. Loads run
+    concurrently, installs are batched per provider (see install_many()),
+    and each result is printed as soon as it is ready. Updates and
+    uninstalls run one at a time. Failures are reported together at the end.
+    """
+    binary_names = list(dict.fromkeys(binary_names))
+    if len(binary_names) == 1:
+        run_binary_command(binary_names[0], action=action, options=options)
+        return
+
+    providers = build_providers(
+        options.provider_names,
+        dry_run=options.dry_run,
+        install_root=options.install_root,
+        bin_dir=options.bin_dir,
+        euid=options.euid,
+        install_timeout=options.install_timeout,
+        version_timeout=options.version_timeout,
+        skip_sha256=options.skip_sha256,
+    )
+    binaries = [
+        build_binary(
+            binary_name,
+            options,
+            dry_run=options.dry_run,
+            providers=providers,
+        )
+        for binary_name in binary_names
+    ]
+    configure_cli_logging(debug=options.debug)
+    configure_cli_timings(timings=options.timings)
+
+    errors: dict[str, str] = {}
+
+    def on_done(idx: int, outcome: Binary | Exception) -> None:
+        if isinstance(outcome, ABXPkgError):
+            errors[binary_names[idx]] = format_error(outcome)
+        elif isinstance(outcome, Exception):
+            raise outcome
+        else:
+            echo_binary_result(outcome, action=action, options=options)
+
+    # all binaries share the providers, so one binary's batch covers them all
+    with binaries[0].cache_batch():
+        if action == "load":
+            load_many(
+                binaries,
+                quiet=True,
+                timeout=probe_deadline(),
+                on_done=on_done,
+                no_cache=options.no_cache,
+            )
+        elif action == "install":
+            install_many(
+                binaries,
+                quiet=True,
+                on_done=on_done,
+                dry_run=options.dry_run,
+                no_cache=options.no_cache,
+            )
+        else:
+            for idx, binary in enumerate(binaries):
+                try:
+                    result = getattr(binary, action)(
+                        dry_run=options.dry_run,
+                        no_cache=options.no_cache,
+                    )
+                except Exception as err:
+                    on_done(idx, err)
+                else:
+                    on_done(idx, result)
+
+    if errors:
+        raise click.ClickException(
+            "\n\n".join(errors[name] for name in binary_names if name in errors),
+        )
+
+
 def clear_lib_dir(lib_dir: Path) -> None:
     if lib_dir.is_symlink() or lib_dir.is_file():
         lib_dir.unlink(missing_ok=True)
@@ -1338,20 +1527,20 @@ def cli(
 
 
 @cli.command("version")
-@click.argument("binary_name", required=False)
+@click.argument("binary_names", nargs=-1)
 @click.pass_context
 @shared_options
 def version_command(
     ctx: click.Context,
-    binary_name: str | None,
+    binary_names: tuple[str, ...],
     **shared_kwargs: Any,
 ) -> None:
-    """Show the package version report, or load a named binary."""
+    """Show the package version report, or load the named binaries."""
 
     options = get_command_options(ctx, **shared_kwargs)
-    if binary_name is not None:
+    if binary_names:
         options = replace(options, dry_run=False)
-        run_binary_command(binary_name, action="load", options=options)
+        run_binary_commands(binary_names, action="load", options=options)
         return
     for line in version_report(options):
         _echo(line)
@@ -1375,32 +1564,32 @@ def list_command(
 
 
 @cli.command("install")
-@click.argument("binary_name")
+@click.argument("binary_names", nargs=-1, required=True)
 @click.pass_context
 @binary_override_options
 @shared_options
 def install_command(
     ctx: click.Context,
-    binary_name: str,
+    binary_names: tuple[str, ...],
     **shared_kwargs: Any,
 ) -> None:
-    """Install a binary via the selected providers in order."""
+    """Install binaries via the selected providers in order."""
 
     options = get_command_options(ctx, **shared_kwargs)
-    run_binary_command(binary_name, action="install", options=options)
+    run_binary_commands(binary_names, action="install", options=options)
 
 
 @cli.command("add", hidden=True)
-@click.argument("binary_name")
+@click.argument("binary_names", nargs=-1, required=True)
 @click.pass_context
 @shared_options
 def add_command(
     ctx: click.Context,
-    binary_name: str,
+    binary_names: tuple[str, ...],
     **shared_kwargs: Any,
 ) -> None:
     options = get_command_options(ctx, **shared_kwargs)
-    run_binary_command(binary_name, action="install", options=options)
+    run_binary_commands(binary_names, action="install", options=options)
 
 
 @cli.command("help", hidden=True)
@@ -1422,82 +1611,82 @@ def clear_command(ctx: click.Context, **shared_kwargs: Any) -> None:
 
 
 @cli.command("update")
-@click.argument("binary_name")
+@click.argument("binary_names", nargs=-1, required=True)
 @click.pass_context
 @binary_override_options
 @shared_options
 def update_command(
     ctx: click.Context,
-    binary_name: str,
+    binary_names: tuple[str, ...],
     **shared_kwargs: Any,
 ) -> None:
-    """Update a binary via the selected providers in order."""
+    """Update binaries via the selected providers in order."""
 
     options = get_command_options(ctx, **shared_kwargs)
-    run_binary_command(binary_name, action="update", options=options)
+    run_binary_commands(binary_names, action="update", options=options)
 
 
 @cli.command("upgrade", hidden=True)
-@click.argument("binary_name")
+@click.argument("binary_names", nargs=-1, required=True)
 @click.pass_context
 @binary_override_options
 @shared_options
 def upgrade_command(
     ctx: click.Context,
-    binary_name: str,
+    binary_names: tuple[str, ...],
     **shared_kwargs: Any,
 ) -> None:
     options = get_command_options(ctx, **shared_kwargs)
-    run_binary_command(binary_name, action="update", options=options)
+    run_binary_commands(binary_names, action="update", options=options)
 
 
 @cli.command("uninstall")
-@click.argument("binary_name")
+@click.argument("binary_names", nargs=-1, required=True)
 @click.pass_context
 @binary_override_options
 @shared_options
 def uninstall_command(
     ctx: click.Context,
-    binary_name: str,
+    binary_names: tuple[str, ...],
     **shared_kwargs: Any,
 ) -> None:
-    """Uninstall a binary via the selected providers in order."""
+    """Uninstall binaries via the selected providers in order."""
 
     options = get_command_options(ctx, **shared_kwargs)
-    run_binary_command(binary_name, action="uninstall", options=options)
+    run_binary_commands(binary_names, action="uninstall", options=options)
 
 
 @cli.command("remove", hidden=True)
-@click.argument("binary_name")
+@click.argument("binary_names", nargs=-1, required=True)
 @click.pass_context
 @shared_options
 def remove_command(
     ctx: click.Context,
-    binary_name: str,
+    binary_names: tuple[str, ...],
     **shared_kwargs: Any,
 ) -> None:
     options = get_command_options(ctx, **shared_kwargs)
-    run_binary_command(binary_name, action="uninstall", options=options)
+    run_binary_commands(binary_names, action="uninstall", options=options)
 
 
 @cli.command("load")
-@click.argument("binary_name")
+@click.argument("binary_names", nargs=-1, required=True)
 @click.pass_context
 @binary_override_options
 @shared_options
 def load_command(
     ctx: click.Context,
-    binary_name: str,
+    binary_names: tuple[str, ...],
     **shared_kwargs: Any,
 ) -> None:
-    """Load an already-installed binary via the selected providers in order."""
+    """Load already-installed binaries via the selected providers in order."""
 
     options = get_command_options(ctx, **shared_kwargs)
     # Load never installs, so force dry_run off regardless of what the
     # user passed; the other option fields are preserved so min_version
     # etc. still apply.
     options = replace(options, dry_run=False)
-    run_binary_command(binary_name, action="load", options=options)
+    run_binary_commands(binary_names, action="load", options=options)
 
 
 @cli.command(
@@ -1561,6 +1750,7 @@ def run_command(
     )
 
     configure_cli_logging(debug=run_options.debug)
+    configure_cli_timings(timings=run_options.timings)
 
     runtime_binproviders: list[BinProvider] = []
     binary_options = run_options
@@ -1810,7 +2000,14 @@ def run_command(
 # both the bare and the value form. Callers pass ``--dry-run=False`` or
 # ``--dry-run=None`` to override the auto-True semantics.
 _BARE_TRUE_BOOL_FLAGS = frozenset(
-    {"--dry-run", "--debug", "--postinstall-scripts", "--no-cache"},
+    {
+        "--dry-run",
+        "--debug",
+        "--postinstall-scripts",
+        "--no-cache",
+        "--skip-sha256",
+        "--timings",
+    },
 )
 
 
@@ -1979,5 +2176,6 @@ __all__ = [
     "resolve_dry_run",
     "resolve_no_cache",
     "resolve_lib_dir",
+    "resolve_timings",
     "version_report",
 ]
@@ -1,15 +1,44 @@
 from __future__ import annotations
 
 import ast
+import fcntl
+import hashlib
 import json
 import os
 import shlex
-from collections.abc import Iterable, Mapping, MutableMapping
+import threading
+import uuid
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
 from typing import Protocol, runtime_checkable
 
+from .base_types import PATHEntries
+
 
 DERIVED_CACHE_KEY = "ABXPKG_DERIVED_CACHE"
+DERIVED_CACHE_RECORD_PREFIX = f"{DERIVED_CACHE_KEY}_"
+DERIVED_CACHE_HEADER_PREFIX = f"# {DERIVED_CACHE_KEY} journal "
+
+# Serializes in-process appends/rewrites of derived.env files (e.g. from
+# concurrent Binary.load() calls via load_many()) and guards the parsed-index
+# memo below.
+_DERIVED_CACHE_LOCK = threading.RLock()
+
+# Parsed derived.env indexes, keyed by path and validated against the file's
+# (st_ino, st_size, st_mtime_ns) so repeated lookups within a run cost one stat().
+_DERIVED_CACHE_INDEXES: dict[str, tuple[tuple[int, int, int], DerivedCacheIndex]] = {}
+
+
+class _DerivedCacheBatch:
+    """Nesting depth + buffered changes of the open derived_cache_batch() for one path."""
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.pending: dict[str, Mapping[str, object] | None] = {}
+
+
+_DERIVED_CACHE_BATCHES: dict[str, _DerivedCacheBatch] = {}
 
 
 @runtime_checkable
@@ -22,10 +51,6 @@ class SupportsExecEnv(Protocol):
     def ENV(self) -> dict[str, str]: ...
 
 
-def _split_path(path_value: str | None) -> list[str]:
-    return [entry for entry in str(path_value or "").split(":") if entry]
-
-
 def apply_exec_env(
     exec_env: Mapping[str, str],
     env: MutableMapping[str, str],
@@ -59,17 +84,7 @@ def merge_exec_path(
     Duplicate entries are removed while preserving first occurrence.
     """
 
-    merged: list[str] = []
-    seen: set[str] = set()
-
-    for layer in (*path_layers, base_path):
-        for entry in _split_path(layer):
-            if entry in seen:
-                continue
-            seen.add(entry)
-            merged.append(entry)
-
-    return ":".join(merged)
+    return str(PATHEntries(*path_layers, base_path))
 
 
 def build_exec_env(
@@ -117,12 +132,23 @@ def build_exec_env(
     return env
 
 
-def load_dotenv_values(dotenv_path: Path) -> dict[str, str]:
-    if not dotenv_path.exists():
-        return {}
+def _parse_dotenv_value(value: str) -> str:
+    if len(value) >= 2 and value[:1] in {"'", '"'} and value[-1:] == value[:1]:
+        # fast path for the single-quoted values written by shlex.quote()
+        if value[0] == "'" and "'" not in value[1:-1]:
+            return value[1:-1]
+        try:
+            return shlex.split(value)[0]
+        except Exception:
+            try:
+                return str(ast.literal_eval(value))
+            except Exception:
+                pass
+    return value
 
-    values: dict[str, str] = {}
-    for raw_line in dotenv_path.read_text(encoding="utf-8").splitlines():
+
+def _iter_dotenv_lines(text: str) -> Iterable[tuple[str, str]]:
+    for raw_line in text.splitlines():
         line = raw_line.strip()
         if not line or line.startswith("#") or "=" not in line:
             continue
@@ -130,23 +156,19 @@ def load_dotenv_values(dotenv_path: Path) -> dict[str, str]:
             line = line[len("export ") :]
         key, raw_value = line.split("=", 1)
         key = key.strip()
-        value = raw_value.strip()
         if not key:
             continue
-        if value[:1] in {"'", '"'} and value[-1:] == value[:1]:
-            try:
-                values[key] = shlex.split(value)[0]
-                continue
-            except Exception:
-                try:
-                    parsed = ast.literal_eval(value)
-                    values[key] = str(parsed)
-                    continue
-                except Exception:
-                    pass
-        values[key] = value
+        yield key, raw_value.strip()
 
-    return values
+
+def load_dotenv_values(dotenv_path: Path) -> dict[str, str]:
+    if not dotenv_path.exists():
+        return {}
+
+    return {
+        key: _parse_dotenv_value(value)
+        for key, value in _iter_dotenv_lines(dotenv_path.read_text(encoding="utf-8"))
+    }
 
 
 def write_dotenv_values(
@@ -167,10 +189,47 @@ def write_dotenv_values(
     )
 
 
-def load_derived_cache(dotenv_path: Path) -> dict[str, dict[str, object]]:
-    raw_value = load_dotenv_values(dotenv_path).get(DERIVED_CACHE_KEY, "").strip()
-    if not raw_value:
-        return {}
+@contextmanager
+def exclusive_file_lock(lock_path: Path) -> Iterator[None]:
+    """Hold an advisory ``flock()`` on ``lock_path`` for the duration of the block.
+
+    This only serializes against other processes (and other open handles of
+    the same file), so callers still need a threading lock for in-process
+    exclusion and must not re-enter it from the same thread. If the lock file
+    cannot be created (e.g. read-only lib dir) the block runs unlocked.
+    """
+    try:
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        lock_file = lock_path.open("a")
+    except OSError:
+        yield
+        return
+    with lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _derived_cache_lock_path(dotenv_path: Path) -> Path:
+    return dotenv_path.with_name(f".{dotenv_path.name.lstrip('.')}.lock")
+
+
+def _derived_cache_record_env_key(cache_key: str) -> str:
+    digest = hashlib.sha256(cache_key.encode("utf-8")).hexdigest()[:16]
+    return f"{DERIVED_CACHE_RECORD_PREFIX}{digest.upper()}"
+
+
+def _derived_cache_bin_key(cache_key: str) -> tuple[str, str] | None:
+    try:
+        provider_name, bin_name, _abspath = json.loads(cache_key)
+    except (TypeError, ValueError):
+        return None
+    return str(provider_name), str(bin_name)
+
+
+def _parse_legacy_derived_cache(raw_value: str) -> dict[str, dict[str, object]]:
     try:
         parsed = json.loads(raw_value)
     except json.JSONDecodeError:
@@ -180,20 +239,400 @@ def load_derived_cache(dotenv_path: Path) -> dict[str, dict[str, object]]:
             parsed = json.loads(parsed)
         except json.JSONDecodeError:
             return {}
-    return parsed if isinstance(parsed, dict) else {}
+    if not isinstance(parsed, dict):
+        return {}
+    return {
+        str(cache_key): record
+        for cache_key, record in parsed.items()
+        if isinstance(record, dict)
+    }
+
+
+class DerivedCacheIndex:
+    """In-memory view of one derived.env cache file.
+
+    derived.env is an append-only journal: each cache record lives on its own
+    ``ABXPKG_DERIVED_CACHE_<hash>='[cache_key, record]'`` line and later lines
+    win (normal dotenv semantics), with an empty value acting as a tombstone.
+    Records are indexed both by their full ``[provider, bin_name, abspath]``
+    cache key and by ``(provider, bin_name)``.
+    """
+
+    def __init__(self) -> None:
+        self.records: dict[str, dict[str, object]] = {}
+        self.keys_by_bin: dict[tuple[str, str], set[str]] = {}
+        self.env_keys: dict[str, str] = {}
+        self.other_values: dict[str, str] = {}
+        self.has_legacy_blob = False
+        self.journal_lines = 0
+        # unique first line of the journal file, used to tell a genuine append
+        # apart from a different file that happens to reuse the same inode
+        self.header = b""
+
+    def set(self, cache_key: str, record: dict[str, object]) -> None:
+        self.records[cache_key] = record
+        self.env_keys[_derived_cache_record_env_key(cache_key)] = cache_key
+        bin_key = _derived_cache_bin_key(cache_key)
+        if bin_key is not None:
+            self.keys_by_bin.setdefault(bin_key, set()).add(cache_key)
+
+    def apply(self, changes: Mapping[str, Mapping[str, object] | None]) -> None:
+        for cache_key, record in changes.items():
+            if record is None:
+                self.discard(cache_key)
+            else:
+                self.set(cache_key, dict(record))
+
+    def discard(self, cache_key: str) -> None:
+        self.env_keys.pop(_derived_cache_record_env_key(cache_key), None)
+        if self.records.pop(cache_key, None) is None:
+            return
+        bin_key = _derived_cache_bin_key(cache_key)
+        if bin_key is not None:
+            keys = self.keys_by_bin.get(bin_key)
+            if keys is not None:
+                keys.discard(cache_key)
+                if not keys:
+                    self.keys_by_bin.pop(bin_key, None)
+
+    def records_for(
+        self,
+        provider_name: str,
+        bin_name: str,
+    ) -> dict[str, dict[str, object]]:
+        return {
+            cache_key: self.records[cache_key]
+            for cache_key in sorted(
+                self.keys_by_bin.get((provider_name, bin_name), ()),
+            )
+        }
+
+    @classmethod
+    def parse(cls, text: str) -> DerivedCacheIndex:
+        index = cls()
+        index.feed(text)
+        return index
+
+    def feed(self, text: str) -> None:
+        """Apply dotenv lines (a whole file or an appended tail) to the index."""
+        index = self
+        for key, raw_value in _iter_dotenv_lines(text):
+            if key == DERIVED_CACHE_KEY:
+                # legacy format: the whole cache as a single JSON blob
+                index.has_legacy_blob = True
+                value = _parse_dotenv_value(raw_value).strip()
+                for cache_key, record in _parse_legacy_derived_cache(value).items():
+                    index.set(cache_key, record)
+                continue
+            if not key.startswith(DERIVED_CACHE_RECORD_PREFIX):
+                index.other_values[key] = _parse_dotenv_value(raw_value)
+                continue
+
+            index.journal_lines += 1
+            value = _parse_dotenv_value(raw_value).strip()
+            if not value:
+                cache_key = index.env_keys.get(key)
+                if cache_key is not None:
+                    index.discard(cache_key)
+                continue
+            try:
+                cache_key, record = json.loads(value)
+            except (TypeError, ValueError):
+                continue
+            if not isinstance(cache_key, str) or not isinstance(record, dict):
+                continue
+            index.set(cache_key, record)
+
+    def needs_compaction(self) -> bool:
+        return self.has_legacy_blob or (
+            self.journal_lines > 64 and self.journal_lines > 2 * len(self.records)
+        )
+
+
+def _new_derived_cache_header() -> str:
+    return f"{DERIVED_CACHE_HEADER_PREFIX}{uuid.uuid4().hex}\n"
+
+
+def _format_derived_cache_line(
+    cache_key: str,
+    record: Mapping[str, object] | None,
+) -> str:
+    env_key = _derived_cache_record_env_key(cache_key)
+    if record is None:
+        return f"{env_key}=\n"
+    value = json.dumps(
+        [cache_key, record],
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return f"{env_key}={shlex.quote(value)}\n"
+
+
+def _stat_key(dotenv_path: Path) -> tuple[int, int, int] | None:
+    try:
+        stat_result = dotenv_path.stat()
+    except OSError:
+        return None
+    return stat_result.st_ino, stat_result.st_size, stat_result.st_mtime_ns
+
+
+def load_derived_cache_index(dotenv_path: Path) -> DerivedCacheIndex:
+    """Return the parsed index for ``dotenv_path``, reusing the memoized parse
+    while the file is unchanged and only parsing the new tail after appends.
+
+    The returned index is shared; callers must hold ``_DERIVED_CACHE_LOCK``
+    if they mutate it (see ``_update_derived_cache``)."""
+    memo_key = str(dotenv_path)
+    with _DERIVED_CACHE_LOCK:
+        stat_key = _stat_key(dotenv_path)
+        if stat_key is None:
+            _DERIVED_CACHE_INDEXES.pop(memo_key, None)
+            return DerivedCacheIndex()
+
+        memoized = _DERIVED_CACHE_INDEXES.get(memo_key)
+        if memoized is not None and memoized[0] == stat_key:
+            return memoized[1]
+
+        try:
+            with dotenv_path.open("rb") as dotenv_file:
+                if (
+                    memoized is not None
+                    and memoized[0][0] == stat_key[0]
+                    and 0 < memoized[0][1] < stat_key[1]
+                    and memoized[1].header
+                    and dotenv_file.read(len(memoized[1].header)) == memoized[1].header
+                ):
+                    # same journal file and grown: if the old end is still a
+                    # line boundary, only parse the appended tail
+                    dotenv_file.seek(memoized[0][1] - 1)
+                    tail = dotenv_file.read()
+                    if tail[:1] == b"\n":
+                        # only consume complete lines, another process may
+                        # still be in the middle of appending the last one
+                        tail = tail[1 : tail.rfind(b"\n") + 1]
+                        index = memoized[1]
+                        index.feed(tail.decode("utf-8"))
+                        consumed = memoized[0][1] + len(tail)
+                        _DERIVED_CACHE_INDEXES[memo_key] = (
+                            (stat_key[0], consumed, stat_key[2]),
+                            index,
+                        )
+                        return index
+                    dotenv_file.seek(0)
+                data = dotenv_file.read()
+        except (FileNotFoundError, NotADirectoryError):
+            _DERIVED_CACHE_INDEXES.pop(memo_key, None)
+            return DerivedCacheIndex()
+        index = DerivedCacheIndex.parse(data.decode("utf-8"))
+        if data.startswith(DERIVED_CACHE_HEADER_PREFIX.encode("utf-8")):
+            index.header = data[: data.find(b"\n") + 1]
+        batch = _DERIVED_CACHE_BATCHES.get(memo_key)
+        if batch is not None:
+            # keep changes buffered by an open batch visible after a re-parse
+            index.apply(batch.pending)
+        _DERIVED_CACHE_INDEXES[memo_key] = (
+            (stat_key[0], data.rfind(b"\n") + 1, stat_key[2]),
+            index,
+        )
+        return index
+
+
+def _remember_derived_cache_index(
+    dotenv_path: Path,
+    index: DerivedCacheIndex,
+    expected_size: int | None = None,
+) -> None:
+    stat_key = _stat_key(dotenv_path)
+    if stat_key is None or (expected_size is not None and stat_key[1] != expected_size):
+        # someone else touched the file meanwhile, re-parse on next access
+        _DERIVED_CACHE_INDEXES.pop(str(dotenv_path), None)
+    else:
+        _DERIVED_CACHE_INDEXES[str(dotenv_path)] = (stat_key, index)
+
+
+def load_derived_cache(dotenv_path: Path) -> dict[str, dict[str, object]]:
+    with _DERIVED_CACHE_LOCK:
+        return dict(load_derived_cache_index(dotenv_path).records)
+
+
+def load_derived_cache_record(
+    dotenv_path: Path,
+    cache_key: str,
+) -> dict[str, object] | None:
+    with _DERIVED_CACHE_LOCK:
+        return load_derived_cache_index(dotenv_path).records.get(cache_key)
+
+
+def load_derived_cache_records(
+    dotenv_path: Path,
+    provider_name: str,
+    bin_name: str,
+) -> dict[str, dict[str, object]]:
+    with _DERIVED_CACHE_LOCK:
+        return load_derived_cache_index(dotenv_path).records_for(
+            provider_name,
+            bin_name,
+        )
+
+
+def _write_derived_cache_index(dotenv_path: Path, index: DerivedCacheIndex) -> None:
+    if not index.records and not index.other_values:
+        dotenv_path.unlink(missing_ok=True)
+        _DERIVED_CACHE_INDEXES.pop(str(dotenv_path), None)
+        return
+    dotenv_path.parent.mkdir(parents=True, exist_ok=True)
+    # write to a temp file and rename it into place so the rewritten file gets
+    # a new inode and memoized indexes never mistake it for an append
+    tmp_path = dotenv_path.with_name(f".{dotenv_path.name}.{os.getpid()}.tmp")
+    header = _new_derived_cache_header()
+    tmp_path.write_text(
+        "".join(
+            [
+                header,
+                *(
+                    f"{key}={shlex.quote(str(value))}\n"
+                    for key, value in sorted(index.other_values.items())
+                ),
+                *(
+                    _format_derived_cache_line(cache_key, record)
+                    for cache_key, record in sorted(index.records.items())
+                ),
+            ],
+        ),
+        encoding="utf-8",
+    )
+    os.replace(tmp_path, dotenv_path)
+    index.journal_lines = len(index.records)
+    index.has_legacy_blob = False
+    index.header = header.encode("utf-8")
+    _remember_derived_cache_index(dotenv_path, index)
+
+
+def _flush_derived_cache(
+    dotenv_path: Path,
+    index: DerivedCacheIndex,
+    changes: Mapping[str, Mapping[str, object] | None],
+) -> None:
+    """Write already-applied index changes to disk, either as one appended
+    block of journal lines or as a compacted rewrite when the file is mostly
+    stale (or still in the legacy single-blob format)."""
+    index.journal_lines += len(changes)
+    try:
+        if index.needs_compaction() or not index.records:
+            _write_derived_cache_index(dotenv_path, index)
+            return
+        dotenv_path.parent.mkdir(parents=True, exist_ok=True)
+        with dotenv_path.open("ab") as journal:
+            journal_lines = "".join(
+                _format_derived_cache_line(cache_key, record)
+                for cache_key, record in changes.items()
+            )
+            if journal.tell() == 0:
+                header = _new_derived_cache_header()
+                journal_lines = f"{header}{journal_lines}"
+                index.header = header.encode("utf-8")
+            journal.write(journal_lines.encode("utf-8"))
+            journal_size = journal.tell()
+        _remember_derived_cache_index(dotenv_path, index, journal_size)
+    except BaseException:
+        _DERIVED_CACHE_INDEXES.pop(str(dotenv_path), None)
+        raise
+
+
+def _update_derived_cache(
+    dotenv_path: Path,
+    changes: Mapping[str, Mapping[str, object] | None],
+) -> None:
+    """Apply upserts (record) / deletes (None) to the cache, buffering them
+    instead of writing if a derived_cache_batch() is open for this path."""
+    if not changes:
+        return
+    with _DERIVED_CACHE_LOCK:
+        batch = _DERIVED_CACHE_BATCHES.get(str(dotenv_path))
+        # writes that hit the disk now re-read the file under the cross-process
+        # lock first, so records appended by other processes are never dropped
+        with (
+            nullcontext()
+            if batch is not None
+            else exclusive_file_lock(_derived_cache_lock_path(dotenv_path))
+        ):
+            index = load_derived_cache_index(dotenv_path)
+            changes = {
+                cache_key: record
+                for cache_key, record in changes.items()
+                if (record is None and cache_key in index.records)
+                or (record is not None and index.records.get(cache_key) != record)
+            }
+            if not changes:
+                return
+            # the index is the shared memoized parse, so apply the changes to it
+            # directly; readers see them immediately even while a batch is open
+            index.apply(changes)
+
+            if batch is None:
+                _flush_derived_cache(dotenv_path, index, changes)
+                return
+            batch.pending.update(changes)
+            if not dotenv_path.exists():
+                # create the (empty) file up front so the buffered records stay
+                # visible through the memoized index until the batch flushes
+                dotenv_path.parent.mkdir(parents=True, exist_ok=True)
+                dotenv_path.touch()
+                _remember_derived_cache_index(dotenv_path, index)
+
+
+@contextmanager
+def derived_cache_batch(dotenv_path: Path) -> Iterator[None]:
+    """Buffer all derived-cache mutations for ``dotenv_path`` (from any thread)
+    and write them out in a single flush when the outermost batch exits."""
+    batch_key = str(dotenv_path)
+    with _DERIVED_CACHE_LOCK:
+        batch = _DERIVED_CACHE_BATCHES.setdefault(batch_key, _DerivedCacheBatch())
+        batch.depth += 1
+    try:
+        yield
+    finally:
+        with _DERIVED_CACHE_LOCK:
+            batch.depth -= 1
+            if batch.depth == 0 and not batch.pending:
+                _DERIVED_CACHE_BATCHES.pop(batch_key, None)
+            elif batch.depth == 0:
+                with exclusive_file_lock(_derived_cache_lock_path(dotenv_path)):
+                    index = load_derived_cache_index(dotenv_path)
+                    _DERIVED_CACHE_BATCHES.pop(batch_key, None)
+                    _flush_derived_cache(dotenv_path, index, batch.pending)
+
+
+def upsert_derived_cache_record(
+    dotenv_path: Path,
+    cache_key: str,
+    record: Mapping[str, object],
+) -> None:
+    _update_derived_cache(dotenv_path, {cache_key: record})
+
+
+def delete_derived_cache_records(
+    dotenv_path: Path,
+    cache_keys: Iterable[str],
+) -> None:
+    _update_derived_cache(dotenv_path, dict.fromkeys(cache_keys))
 
 
 def save_derived_cache(
     dotenv_path: Path,
     cache: Mapping[str, object],
 ) -> None:
-    values = load_dotenv_values(dotenv_path)
-    if cache:
-        values[DERIVED_CACHE_KEY] = json.dumps(
-            cache,
-            sort_keys=True,
-            separators=(",", ":"),
-        )
-    else:
-        values.pop(DERIVED_CACHE_KEY, None)
-    write_dotenv_values(dotenv_path, values)
+    """Replace the whole cache, rewriting derived.env in compacted form."""
+    with (
+        _DERIVED_CACHE_LOCK,
+        exclusive_file_lock(
+            _derived_cache_lock_path(dotenv_path),
+        ),
+    ):
+        index = load_derived_cache_index(dotenv_path)
+        compacted = DerivedCacheIndex()
+        compacted.other_values = index.other_values
+        for cache_key, record in cache.items():
+            if isinstance(record, dict):
+                compacted.set(str(cache_key), record)
+        _write_derived_cache_index(dotenv_path, compacted)
@@ -7,10 +7,14 @@ import logging as py_logging
 import os
 import shlex
 import subprocess
+import threading
+import time
+from contextlib import contextmanager, nullcontext
 from contextvars import ContextVar
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 
 from typing_extensions import ParamSpec, TypeVar
 
@@ -241,7 +245,12 @@ def _truncate_middle(text: str, keep_start: int = 8, keep_end: int = 8) -> str:
 def format_named_value(value: Any) -> str:
     name = getattr(value, "name", None)
     if hasattr(value, "loaded_abspath") and hasattr(value, "loaded_version"):
-        loaded_sha256 = getattr(value, "loaded_sha256", None)
+        if getattr(value, "sha256_deferred", False):
+            # don't hash the binary just to log it
+            sha256 = "<deferred>"
+        else:
+            loaded_sha256 = getattr(value, "loaded_sha256", None)
+            sha256 = _truncate_middle(str(loaded_sha256)) if loaded_sha256 else None
         loaded_mtime = getattr(value, "loaded_mtime", None)
         loaded_euid = getattr(value, "loaded_euid", None)
         return _shorten_paths(
@@ -249,7 +258,7 @@ def format_named_value(value: Any) -> str:
             f"{summarize_value(name, 80)}, "
             f"abspath={summarize_value(getattr(value, 'loaded_abspath', None), 120)}, "
             f"version={summarize_value(getattr(value, 'loaded_version', None), 80)}, "
-            f"sha256={_truncate_middle(str(loaded_sha256)) if loaded_sha256 else None!r}, "
+            f"sha256={sha256!r}, "
             f"mtime={loaded_mtime!r}, "
             f"euid={loaded_euid!r}"
             f")",
@@ -660,6 +669,197 @@ def _bound_method_args(
     return args
 
 
+################## TIMINGS ############################################
+
+# actions that emit an ActionTiming to the registered timing callbacks
+TIMED_ACTIONS = frozenset(
+    {"load", "install", "update", "uninstall", "get_version", "get_abspath", "exec"},
+)
+
+
+@dataclass(slots=True)
+class ActionTiming:
+    """Wall-time and subprocess/cache counters for one finished provider or
+    Binary action, passed to every callback registered via add_timing_callback()."""
+
+    action: str  # one of TIMED_ACTIONS
+    owner: str  # provider name (e.g. "pip"), or "Binary" for Binary-level calls
+    bin_name: str | None
+    depth: int = 0  # number of timed actions this one is nested inside
+    started: float = 0.0  # time.perf_counter() when the action began
+    duration: float = 0.0  # seconds
+    subprocess_count: int = 0  # includes subprocesses run by nested actions
+    cache_hit: bool | None = None  # None when the action has no cache to consult
+    error: str | None = None
+
+
+TIMING_CALLBACKS: tuple[Callable[[ActionTiming], None], ...] = ()
+_TIMING_CALLBACKS_LOCK = threading.Lock()
+ACTIVE_TIMINGS: ContextVar[tuple[ActionTiming, ...]] = ContextVar(
+    "abxpkg_active_timings",
+    default=(),
+)
+PENDING_CACHE_MISS: ContextVar[bool] = ContextVar(
+    "abxpkg_pending_cache_miss",
+    default=False,
+)
+
+
+def add_timing_callback(callback: Callable[[ActionTiming], None]) -> None:
+    global TIMING_CALLBACKS
+    with _TIMING_CALLBACKS_LOCK:
+        TIMING_CALLBACKS = (*TIMING_CALLBACKS, callback)
+
+
+def remove_timing_callback(callback: Callable[[ActionTiming], None]) -> None:
+    global TIMING_CALLBACKS
+    with _TIMING_CALLBACKS_LOCK:
+        TIMING_CALLBACKS = tuple(cb for cb in TIMING_CALLBACKS if cb is not callback)
+
+
+@contextmanager
+def record_timings() -> Iterator[list[ActionTiming]]:
+    """Collect every ActionTiming finished (in any thread) while the block runs."""
+    timings: list[ActionTiming] = []
+    callback = timings.append
+    add_timing_callback(callback)
+    try:
+        yield timings
+    finally:
+        remove_timing_callback(callback)
+
+
+def _emit_timing(timing: ActionTiming) -> None:
+    for callback in TIMING_CALLBACKS:
+        try:
+            callback(timing)
+        except Exception as err:
+            logger.debug("Timing callback %r failed: %s", callback, err)
+
+
+@contextmanager
+def timed_action(
+    action: str,
+    owner: str,
+    bin_name: str | None,
+) -> Iterator[ActionTiming | None]:
+    """Time the enclosed block as one ActionTiming (no-op without callbacks)."""
+    if not TIMING_CALLBACKS:
+        yield None
+        return
+    active = ACTIVE_TIMINGS.get()
+    timing = ActionTiming(
+        action=action,
+        owner=owner,
+        bin_name=bin_name,
+        depth=len(active),
+        started=time.perf_counter(),
+        cache_hit=False if PENDING_CACHE_MISS.get() else None,
+    )
+    active_token = ACTIVE_TIMINGS.set((*active, timing))
+    miss_token = PENDING_CACHE_MISS.set(False)
+    try:
+        yield timing
+    except BaseException as err:
+        timing.error = f"{type(err).__name__}: {err}"
+        raise
+    finally:
+        timing.duration = time.perf_counter() - timing.started
+        PENDING_CACHE_MISS.reset(miss_token)
+        ACTIVE_TIMINGS.reset(active_token)
+        _emit_timing(timing)
+
+
+@contextmanager
+def pending_cache_miss() -> Iterator[None]:
+    """Mark the next timed action started inside the block as a cache miss."""
+    token = PENDING_CACHE_MISS.set(True)
+    try:
+        yield
+    finally:
+        PENDING_CACHE_MISS.reset(token)
+
+
+def emit_cache_hit(action: str, owner: str, bin_name: str | None) -> None:
+    """Emit a zero-duration ActionTiming for a call answered from a cache."""
+    if TIMING_CALLBACKS:
+        _emit_timing(
+            ActionTiming(
+                action=action,
+                owner=owner,
+                bin_name=bin_name,
+                depth=len(ACTIVE_TIMINGS.get()),
+                started=time.perf_counter(),
+                cache_hit=True,
+            ),
+        )
+
+
+def mark_cache_hit(hit: bool) -> None:
+    """Record whether the innermost running timed action was served from cache."""
+    active = ACTIVE_TIMINGS.get()
+    if active:
+        active[-1].cache_hit = hit
+
+
+def count_subprocess() -> None:
+    for timing in ACTIVE_TIMINGS.get():
+        timing.subprocess_count += 1
+
+
+def _timing_target(
+    func_name: str,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> tuple[str, str, str | None]:
+    owner = args[0] if args else None
+    if type(owner).__name__ == "Binary":
+        return func_name, "Binary", getattr(owner, "name", None)
+    bin_name = kwargs.get("bin_name", args[1] if len(args) > 1 else None)
+    return (
+        func_name,
+        str(getattr(owner, "name", type(owner).__name__)),
+        None if bin_name is None else str(bin_name),
+    )
+
+
+def timed_method(func: Callable[P, R]) -> Callable[P, R]:
+    """Time a method that is not already wrapped by @log_method_call."""
+
+    func_name = getattr(func, "__name__", type(func).__name__)
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        if not TIMING_CALLBACKS:
+            return func(*args, **kwargs)
+        with timed_action(*_timing_target(func_name, args, kwargs)):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def format_timings(timings: list[ActionTiming]) -> list[str]:
+    """Render recorded timings as an aligned table, in the order they started."""
+    rows = [("ACTION", "PROVIDER", "BINARY", "SECONDS", "SUBPROCS", "CACHE")]
+    for timing in sorted(timings, key=lambda timing: timing.started):
+        cache = {True: "hit", False: "miss", None: "-"}[timing.cache_hit]
+        rows.append(
+            (
+                TRACE_INDENT * timing.depth + timing.action,
+                timing.owner,
+                timing.bin_name or "-",
+                f"{timing.duration:.3f}",
+                str(timing.subprocess_count),
+                cache if timing.error is None else f"{cache} (error)",
+            ),
+        )
+    widths = [max(len(row[idx]) for row in rows) for idx in range(len(rows[0]))]
+    return [
+        "  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+        for row in rows
+    ]
+
+
 def log_method_call(
     level: int = py_logging.DEBUG,
     include_result: bool = False,
@@ -694,8 +894,14 @@ def log_method_call(
                     qualname,
                     rendered_call,
                 )
+            timing_context = (
+                timed_action(*_timing_target(func_name, args, kwargs))
+                if TIMING_CALLBACKS and func_name in TIMED_ACTIONS
+                else nullcontext()
+            )
             try:
-                result = func(*args, **kwargs)
+                with timing_context:
+                    result = func(*args, **kwargs)
             except Exception as err:
                 if should_log_error:
                     log_with_trace_depth(
@@ -734,6 +940,37 @@ def log_method_call(
     return decorator
 
 
+ExecOutputCallback = Callable[[str, str], None]
+EXEC_OUTPUT_CALLBACKS: tuple[ExecOutputCallback, ...] = ()
+_EXEC_OUTPUT_CALLBACKS_LOCK = threading.Lock()
+
+
+def add_exec_output_callback(callback: ExecOutputCallback) -> None:
+    """Call ``callback(stream, line)`` for every stdout/stderr line streamed by
+    an install/update/uninstall subprocess while it runs."""
+    global EXEC_OUTPUT_CALLBACKS
+    with _EXEC_OUTPUT_CALLBACKS_LOCK:
+        EXEC_OUTPUT_CALLBACKS = (*EXEC_OUTPUT_CALLBACKS, callback)
+
+
+def remove_exec_output_callback(callback: ExecOutputCallback) -> None:
+    global EXEC_OUTPUT_CALLBACKS
+    with _EXEC_OUTPUT_CALLBACKS_LOCK:
+        EXEC_OUTPUT_CALLBACKS = tuple(
+            cb for cb in EXEC_OUTPUT_CALLBACKS if cb is not callback
+        )
+
+
+def emit_exec_output_line(stream: str, line: str, trace_depth: int = 0) -> None:
+    """Forward one streamed subprocess line to the debug log and callbacks."""
+    log_with_trace_depth(logger, py_logging.DEBUG, trace_depth, "  │ %s", line)
+    for callback in EXEC_OUTPUT_CALLBACKS:
+        try:
+            callback(stream, line)
+        except Exception as err:
+            logger.debug("Exec output callback %r failed: %s", callback, err)
+
+
 def log_subprocess_output(
     command_logger: py_logging.Logger,
     action: str,
@@ -0,0 +1,216 @@
+__package__ = "abxpkg"
+
+import atexit
+import json
+import os
+import select
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from .logging import get_logger
+
+if TYPE_CHECKING:
+    from .binprovider import BinProvider
+
+logger = get_logger(__name__)
+
+
+# Answers one JSON request per stdin line with one JSON response per stdout line:
+#   {"id": 1, "op": "executablePaths", "module": "/x/node_modules/playwright", "names": ["chromium"]}
+#   {"id": 1, "result": {"chromium": "/x/chromium-1155/chrome-linux/chrome"}, "error": null}
+NODE_HELPER_SCRIPT = r"""
+const readline = require('readline');
+const ops = {
+  async executablePaths(mod, req) {
+    const paths = {};
+    for (const name of req.names) {
+      try { paths[name] = mod[name] ? mod[name].executablePath() : null; }
+      catch (err) { paths[name] = null; }
+    }
+    return paths;
+  },
+  async installedBrowsers(mod, req) {
+    const browsers = await mod.getInstalledBrowsers({cacheDir: req.cacheDir});
+    return browsers.map((b) => ({
+      browser: b.browser,
+      buildId: b.buildId,
+      platform: b.platform,
+      executablePath: b.executablePath,
+    }));
+  },
+};
+readline.createInterface({input: process.stdin}).on('line', async (line) => {
+  let req = {};
+  let result = null;
+  let error = null;
+  try {
+    req = JSON.parse(line);
+    if (!ops[req.op]) throw new Error(`unknown op ${req.op}`);
+    result = await ops[req.op](require(req.module), req);
+  } catch (err) {
+    error = String((err && err.message) || err);
+  }
+  process.stdout.write(JSON.stringify({id: req.id, result, error}) + '\n');
+});
+"""
+
+_NODE_ABSPATH: Path | None = None
+_NODE_ABSPATH_LOCK = threading.Lock()
+
+
+def load_node_abspath(no_cache: bool = False) -> Path | None:
+    """Resolve ``node`` from the ambient environment, memoized for the
+    process (re-resolved when ``no_cache`` is set or the binary disappears)."""
+    global _NODE_ABSPATH
+    from .binary import Binary
+    from .binprovider import EnvProvider
+    from .exceptions import ABXPkgError
+
+    with _NODE_ABSPATH_LOCK:
+        if not no_cache and _NODE_ABSPATH is not None and _NODE_ABSPATH.exists():
+            return _NODE_ABSPATH
+        try:
+            node_binary = Binary(
+                name="node",
+                binproviders=[
+                    EnvProvider(
+                        postinstall_scripts=True,
+                        min_release_age=0,
+                    ),
+                ],
+                postinstall_scripts=True,
+                min_release_age=0,
+            ).load(no_cache=no_cache)
+        except (ABXPkgError, ValueError) as err:
+            logger.debug("Unable to resolve node for the node helper: %s", err)
+            node_binary = None
+        _NODE_ABSPATH = node_binary.loaded_abspath if node_binary else None
+        return _NODE_ABSPATH
+
+
+class NodeHelper:
+    """A long-lived ``node`` process that answers module queries (e.g. the
+    ``executablePath()`` of every Playwright browser) over stdin/stdout JSON,
+    so resolving several browsers costs one node cold start per process
+    instead of one per lookup.
+
+    The helper is started through the provider's ``popen()``, so it runs as
+    the same user and with the same HOME/PATH/ENV as the provider's one-shot
+    ``exec()`` calls. Helpers are shared per (node binary, provider identity)
+    via ``NodeHelper.get()``, and a helper that dies, times out or answers
+    garbage is killed and respawned on the next request. Callers fall back to
+    their one-shot CLI path on None.
+    """
+
+    _helpers: ClassVar[dict[tuple[object, ...], "NodeHelper"]] = {}
+    _helpers_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, provider: "BinProvider", node_abspath: Path) -> None:
+        self.provider = provider
+        self.node_abspath = node_abspath
+        self.proc: subprocess.Popen[bytes] | None = None
+        self.lock = threading.Lock()
+        self.next_id = 0
+        self.buffer = b""
+
+    @classmethod
+    def get(cls, provider: "BinProvider", node_abspath: Path) -> "NodeHelper":
+        """Return the shared helper for ``node_abspath`` running as
+        ``provider`` would exec() it (same EUID, PATH and ENV)."""
+        key = (
+            str(node_abspath),
+            provider.EUID,
+            provider.PATH,
+            tuple(sorted(provider.ENV.items())),
+        )
+        with cls._helpers_lock:
+            helper = cls._helpers.get(key)
+            if helper is None:
+                helper = cls._helpers[key] = cls(provider, node_abspath)
+            return helper
+
+    @classmethod
+    def close_all(cls) -> None:
+        with cls._helpers_lock:
+            helpers = list(cls._helpers.values())
+            cls._helpers.clear()
+        for helper in helpers:
+            helper.close()
+
+    def _start(self) -> subprocess.Popen[bytes]:
+        self.buffer = b""
+        return self.provider.popen(
+            self.node_abspath,
+            ["-e", NODE_HELPER_SCRIPT],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def _readline(self, deadline: float) -> bytes:
+        """Read one response line from the raw stdout pipe, giving up once
+        ``deadline`` (a time.monotonic() value) passes even mid-line."""
+        assert self.proc is not None and self.proc.stdout is not None
+        stdout_fd = self.proc.stdout.fileno()
+        while b"\n" not in self.buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError("node helper did not answer in time")
+            ready, _, _ = select.select([stdout_fd], [], [], remaining)
+            if ready:
+                chunk = os.read(stdout_fd, 65536)
+                if not chunk:
+                    raise EOFError("node helper exited")
+                self.buffer += chunk
+        line, _, self.buffer = self.buffer.partition(b"\n")
+        return line
+
+    def request(self, op: str, timeout: float, **params: Any) -> Any | None:
+        """Send one ``op`` request and return its result, or None if the
+        helper failed to answer it within ``timeout`` seconds."""
+        deadline = time.monotonic() + timeout
+        with self.lock:
+            try:
+                if self.proc is None or self.proc.poll() is not None:
+                    self.proc = self._start()
+                assert self.proc.stdin is not None
+                self.next_id += 1
+                self.proc.stdin.write(
+                    json.dumps({"id": self.next_id, "op": op, **params}).encode()
+                    + b"\n",
+                )
+                self.proc.stdin.flush()
+                response = json.loads(self._readline(deadline))
+                if response["id"] != self.next_id:
+                    raise ValueError(f"out of order response {response!r}")
+            except (OSError, EOFError, KeyError, TypeError, ValueError) as err:
+                logger.debug("node helper %s request failed: %s", op, err)
+                self._kill()
+                return None
+        if response.get("error"):
+            logger.debug("node helper %s request failed: %s", op, response["error"])
+            return None
+        return response.get("result")
+
+    def _kill(self) -> None:
+        if self.proc is not None:
+            # EOF on stdin ends node even when the kill only reaches a sudo wrapper
+            if self.proc.stdin is not None:
+                try:
+                    self.proc.stdin.close()
+                except OSError:
+                    pass
+            self.proc.kill()
+            self.proc.wait()
+            self.proc = None
+        self.buffer = b""
+
+    def close(self) -> None:
+        with self.lock:
+            self._kill()
+
+
+atexit.register(NodeHelper.close_all)
@@ -1,4 +1,8 @@
+import asyncio
+import subprocess
+import sys
 import tempfile
+import time
 from pathlib import Path
 
 import pytest
@@ -11,7 +15,11 @@ from abxpkg import (
     PipProvider,
     SemVer,
     UvProvider,
+    install_many,
+    load_many,
+    record_timings,
 )
+from abxpkg.binary import probe_deadline, probe_max_workers
 from abxpkg.exceptions import (
     BinaryLoadError,
     BinaryInstallError,
@@ -412,6 +420,48 @@ class TestBinary:
             assert removed.loaded_abspath is None
             assert npm_provider.load("zx", no_cache=True) is None
 
+    def test_binary_load_and_install_start_with_the_cached_provider(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_path = Path(tmpdir)
+            bin_dir = tmp_path / "bin"
+            bin_dir.mkdir()
+            tool_path = bin_dir / "cached-tool"
+            tool_path.write_text("#!/bin/sh\necho 'cached-tool 3.1.4'\n")
+            tool_path.chmod(0o755)
+
+            def build_binary() -> Binary:
+                return Binary(
+                    name="cached-tool",
+                    binproviders=[
+                        PipProvider(
+                            install_root=tmp_path / "lib" / "pip",
+                            postinstall_scripts=True,
+                            min_release_age=0,
+                        ),
+                        EnvProvider(
+                            install_root=tmp_path / "lib" / "env",
+                            PATH=str(bin_dir),
+                            postinstall_scripts=True,
+                            min_release_age=0,
+                        ),
+                    ],
+                    postinstall_scripts=True,
+                    min_release_age=0,
+                )
+
+            assert build_binary().binproviders[1].load("cached-tool") is not None
+
+            # fresh providers (e.g. a new process) go to env's cached record
+            # first instead of probing pip, and load it without any subprocess
+            for action in ("load", "install"):
+                with record_timings() as timings:
+                    loaded = getattr(build_binary(), action)()
+                assert loaded.loaded_version == SemVer("3.1.4")
+                assert loaded.loaded_binprovider is not None
+                assert loaded.loaded_binprovider.name == "env"
+                assert all(timing.subprocess_count == 0 for timing in timings)
+                assert all(timing.owner != "pip" for timing in timings)
+
     def test_binary_action_args_override_binary_and_provider_defaults(
         self,
         test_machine,
@@ -437,3 +487,282 @@ class TestBinary:
             )
 
             test_machine.assert_shallow_binary_loaded(installed)
+
+    def test_load_many_returns_binaries_in_input_order(self):
+        provider = EnvProvider(postinstall_scripts=True, min_release_age=0)
+        binaries = [
+            Binary(name=name, binproviders=[provider])
+            for name in ("python", "git", "node")
+        ]
+
+        loaded = load_many(binaries, max_workers=3, no_cache=True)
+
+        assert [binary.name for binary in loaded] == ["python", "git", "node"]
+        for binary in loaded:
+            assert binary.is_valid
+            assert binary.loaded_abspath is not None
+            assert binary.loaded_binprovider is not None
+            assert binary.loaded_binprovider.name == "env"
+
+    def test_load_many_raises_first_failure_unless_quiet(self):
+        provider = EnvProvider(postinstall_scripts=True, min_release_age=0)
+        binaries = [
+            Binary(name="python", binproviders=[provider]),
+            Binary(name="abxpkg-missing-load-many-binary", binproviders=[provider]),
+        ]
+
+        with pytest.raises(BinaryLoadError):
+            load_many(binaries, no_cache=True)
+
+        loaded = load_many(binaries, quiet=True, no_cache=True)
+        assert loaded[0].is_valid
+        assert loaded[1] is binaries[1]
+        assert loaded[1].loaded_abspath is None
+
+    def test_load_many_timeout_bounds_the_whole_batch(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            bin_dir = Path(tmpdir)
+            for name in ("hung-tool-a", "hung-tool-b"):
+                tool_path = bin_dir / name
+                tool_path.write_text("#!/bin/sh\nexec sleep 30\n")
+                tool_path.chmod(0o755)
+            provider = EnvProvider(
+                PATH=f"{bin_dir}:{Path(sys.executable).parent}",
+                version_timeout=20,
+                postinstall_scripts=True,
+                min_release_age=0,
+            )
+            binaries = [
+                Binary(name=name, binproviders=[provider])
+                for name in ("hung-tool-a", "python", "hung-tool-b")
+            ]
+
+            started_at = time.monotonic()
+            loaded = load_many(binaries, quiet=True, timeout=3, no_cache=True)
+            # both hung probes are killed at the shared deadline, instead of
+            # each one running out its own 20s version_timeout
+            assert time.monotonic() - started_at < 10
+
+            assert loaded[1].is_valid
+            assert loaded[0] is binaries[0]
+            assert loaded[2] is binaries[2]
+
+    def test_probe_settings_are_read_at_call_time(self, monkeypatch):
+        monkeypatch.setenv("ABXPKG_PROBE_WORKERS", "3")
+        monkeypatch.setenv("ABXPKG_PROBE_DEADLINE", "2.5")
+        assert probe_max_workers() == 3
+        assert probe_deadline() == 2.5
+
+        # malformed values fall back to the defaults instead of raising
+        monkeypatch.setenv("ABXPKG_PROBE_WORKERS", "many")
+        monkeypatch.setenv("ABXPKG_PROBE_DEADLINE", "soon")
+        assert probe_max_workers() == 8
+        assert probe_deadline() is None
+
+    def test_wildcard_override_views_do_not_share_the_parent_cache(self):
+        provider = EnvProvider(postinstall_scripts=True, min_release_age=0)
+        real_version = provider.get_version("python3")
+        assert real_version is not None
+
+        view = provider.get_provider_with_overrides(
+            overrides={"*": {"version": lambda: "1.0.0"}},
+        )
+        assert view.get_version("python3") == SemVer("1.0.0")
+        assert provider.get_version("python3") == real_version
+        assert view.INSTALLER_BINARY() is not provider.INSTALLER_BINARY()
+
+    def test_install_many_batches_binaries_that_share_providers(self, monkeypatch):
+        provider = EnvProvider(postinstall_scripts=True, min_release_age=0)
+        batches = []
+        single_installs = []
+        real_install_many = EnvProvider.install_many
+        real_install = EnvProvider.install
+
+        def recording_install_many(self, bin_names, **kwargs):
+            batches.append((self.name, list(bin_names)))
+            return real_install_many(self, bin_names, **kwargs)
+
+        def recording_install(self, bin_name, **kwargs):
+            single_installs.append(str(bin_name))
+            return real_install(self, bin_name, **kwargs)
+
+        monkeypatch.setattr(EnvProvider, "install_many", recording_install_many)
+        monkeypatch.setattr(EnvProvider, "install", recording_install)
+        binaries = [
+            Binary(name=name, binproviders=[provider]) for name in ("python3", "ls")
+        ]
+
+        # env can't merge installs, so it never gets a batch
+        installed = install_many(binaries, no_cache=True)
+        assert batches == []
+        assert [binary.name for binary in installed] == ["python3", "ls"]
+        assert all(binary.is_valid for binary in installed)
+
+        def failing_install_many(self, bin_names, **kwargs):
+            results = recording_install_many(self, bin_names, **kwargs)
+            return [
+                RuntimeError("batch install failed") if result is None else result
+                for result in results
+            ]
+
+        monkeypatch.setattr(EnvProvider, "install_many", failing_install_many)
+        monkeypatch.setattr(EnvProvider, "supports_batch_install", lambda self: True)
+        batches.clear()
+        single_installs.clear()
+        finished = []
+        binaries = [
+            Binary(name=name, binproviders=[provider])
+            for name in ("python3", "ls", "abxpkg-missing-batch-binary")
+        ]
+
+        installed = install_many(
+            binaries,
+            no_cache=True,
+            quiet=True,
+            on_done=lambda idx, outcome: finished.append((idx, outcome)),
+        )
+
+        assert batches == [
+            ("env", ["python3", "ls", "abxpkg-missing-batch-binary"]),
+        ]
+        # the batch already tried env for the missing one, so it isn't
+        # installed again one by one, just reported with the batch's error
+        assert single_installs.count("abxpkg-missing-batch-binary") == 1
+        assert [binary.is_valid for binary in installed] == [True, True, False]
+        assert sorted(idx for idx, _ in finished) == [0, 1, 2]
+        failure = dict(finished)[2]
+        assert isinstance(failure, BinaryInstallError)
+        assert list(failure.errors) == ["env"]
+        assert "batch install failed" in failure.errors["env"]
+
+    def test_install_many_keeps_binary_overrides_on_loaded_binprovider(self):
+        provider = EnvProvider(postinstall_scripts=True, min_release_age=0)
+
+        def make_binaries():
+            return [
+                Binary(
+                    name="python3",
+                    binproviders=[provider],
+                    overrides={"env": {"version": "1.2.3"}},
+                ),
+                Binary(name="ls", binproviders=[provider]),
+            ]
+
+        # warm the provider's cache so install_many() takes the cached path
+        for binary in make_binaries():
+            binary.install()
+
+        installed = install_many(make_binaries())
+
+        assert [binary.name for binary in installed] == ["python3", "ls"]
+        assert installed[0].loaded_binprovider is not provider
+        assert installed[0].loaded_binprovider.overrides["python3"] == {
+            "version": "1.2.3",
+        }
+        assert installed[0].loaded_binprovider.get_version("python3") == SemVer(
+            "1.2.3",
+        )
+
+    def test_async_lifecycle_methods_match_sync_results(self):
+        provider = EnvProvider(postinstall_scripts=True, min_release_age=0)
+        binary = Binary(name="python", binproviders=[provider])
+
+        loaded = binary.load(no_cache=True)
+        aloaded = asyncio.run(binary.aload(no_cache=True))
+        assert aloaded.is_valid
+        assert aloaded.loaded_abspath == loaded.loaded_abspath
+        assert aloaded.loaded_version == loaded.loaded_version
+
+        with pytest.raises(BinaryLoadError):
+            asyncio.run(
+                Binary(
+                    name="abxpkg-missing-aload-binary",
+                    binproviders=[provider],
+                ).aload(no_cache=True),
+            )
+
+    def test_provider_copies_share_one_install_lock(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            provider = PipProvider(install_root=Path(tmpdir) / "venv")
+            copied = provider.get_provider_with_overrides(
+                overrides={"black": {"install_args": ["black"]}},
+            )
+            other_root = PipProvider(install_root=Path(tmpdir) / "other")
+
+            assert copied is not provider
+            assert copied._install_lock() is provider._install_lock()
+            assert other_root._install_lock() is not provider._install_lock()
+
+    def test_override_views_are_memoized_and_share_the_parent_cache(self):
+        provider = EnvProvider(postinstall_scripts=True, min_release_age=0)
+        python_abspath = provider.get_abspath("python3")
+        assert python_abspath is not None
+
+        view = provider.get_provider_with_overrides(
+            overrides={"sh": {"install_args": ["sh"]}},
+        )
+        assert view is not provider
+        assert view is provider.get_provider_with_overrides(
+            overrides={"sh": {"install_args": ["sh"]}},
+        )
+        assert view.get_install_args("sh") == ("sh",)
+        assert provider.get_install_args("sh") == ("sh",)
+        assert provider.overrides.get("sh") is None
+
+        # binaries the view does not override come from the parent's cache
+        with record_timings() as timings:
+            assert view.get_abspath("python3") == python_abspath
+        assert [timing.cache_hit for timing in timings] == [True]
+
+        # mutating a handed-out view (or the parent) yields a fresh view
+        view.install_timeout = 1
+        fresh_view = provider.get_provider_with_overrides(
+            overrides={"sh": {"install_args": ["sh"]}},
+        )
+        assert fresh_view is not view
+        assert fresh_view.install_timeout == provider.install_timeout
+        provider.version_timeout = provider.version_timeout + 1
+        assert (
+            provider.get_provider_with_overrides(
+                overrides={"sh": {"install_args": ["sh"]}},
+            )
+            is not fresh_view
+        )
+
+        field_view = provider.get_provider_with_overrides(
+            overrides={"python3": {"dry_run": True}},
+        )
+        assert field_view.dry_run is True
+        assert field_view._cache_owner("python3") is field_view
+
+    def test_install_lock_serializes_providers_across_processes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            install_root = Path(tmpdir) / "venv"
+            provider = PipProvider(install_root=install_root)
+            holder = subprocess.Popen(
+                [
+                    sys.executable,
+                    "-c",
+                    (
+                        "import sys, time\n"
+                        "from abxpkg import PipProvider\n"
+                        f"provider = PipProvider(install_root={str(install_root)!r})\n"
+                        "with provider._install_lock():\n"
+                        "    print('locked', flush=True)\n"
+                        "    time.sleep(1)\n"
+                    ),
+                ],
+                stdout=subprocess.PIPE,
+                text=True,
+            )
+            try:
+                assert holder.stdout is not None
+                assert holder.stdout.readline().strip() == "locked"
+                started = time.monotonic()
+                with provider._install_lock():
+                    waited = time.monotonic() - started
+            finally:
+                holder.wait(timeout=30)
+
+            assert waited > 0.5
+            assert holder.returncode == 0
@@ -124,6 +124,30 @@ class TestCargoProvider:
             assert provider.uninstall("choose")
             assert provider.load("choose", quiet=True, no_cache=True) is None
 
+    def test_uninstall_package_specs_come_from_the_bin_index(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            install_root = Path(temp_dir) / "cargo-root"
+            bin_dir = install_root / "bin"
+            bin_dir.mkdir(parents=True)
+            (bin_dir / "rg").write_text("#!/bin/sh\n")
+            (bin_dir / "rg").chmod(0o755)
+            (install_root / ".crates2.json").write_text(
+                '{"installs": {"ripgrep 14.1.0 (registry+https://github.com/'
+                'rust-lang/crates.io-index)": {"bins": ["rg"]}}}',
+            )
+            provider = CargoProvider(install_root=install_root)
+
+            assert provider.lookup_bin_index("rg") == {
+                "package": "ripgrep",
+                "version": "14.1.0",
+                "abspath": str(bin_dir / "rg"),
+            }
+            assert provider._cargo_package_specs("rg") == ["ripgrep"]
+            assert provider._cargo_package_specs(
+                "rg",
+                install_args=["ripgrep", "--locked"],
+            ) == ["ripgrep"]
+
     def test_cargo_root_bin_dir_takes_precedence_over_existing_PATH_entries(
         self,
         test_machine,
@@ -1570,6 +1570,55 @@ def test_remove_command_dispatches_to_uninstall(monkeypatch):
     assert captured["action"] == "uninstall"
 
 
+def test_load_command_shares_one_provider_set_across_names(monkeypatch, tmp_path):
+    build_providers_calls = []
+    real_build_providers = cli_module.build_providers
+
+    def counting_build_providers(*args, **kwargs):
+        build_providers_calls.append(args)
+        return real_build_providers(*args, **kwargs)
+
+    monkeypatch.setattr(cli_module, "build_providers", counting_build_providers)
+
+    result = CliRunner().invoke(
+        cli_module.cli,
+        [
+            f"--lib={tmp_path}",
+            "--binproviders=env",
+            "load",
+            "python3",
+            "python",
+            "abxpkg-missing-multi-load-binary",
+            "python3",
+        ],
+    )
+
+    assert result.exit_code == 1
+    assert len(build_providers_calls) == 1
+    loaded_lines = [line for line in result.stdout.splitlines() if line.strip()]
+    assert len(loaded_lines) == 2
+    assert sorted(line.split()[-1] for line in loaded_lines) == ["python", "python3"]
+    assert "abxpkg-missing-multi-load-binary" in result.output
+
+
+def test_install_command_dispatches_single_name_unchanged(monkeypatch):
+    captured = {}
+
+    def fake_run_binary_command(binary_name, *, action, options):
+        captured["binary_name"] = binary_name
+        captured["action"] = action
+
+    monkeypatch.setattr(cli_module, "run_binary_command", fake_run_binary_command)
+
+    result = CliRunner().invoke(
+        cli_module.cli,
+        ["install", "--binproviders=env", "python", "python"],
+    )
+
+    assert result.exit_code == 0
+    assert captured == {"binary_name": "python", "action": "install"}
+
+
 def test_help_command_matches_root_help_output():
     help_result = CliRunner().invoke(cli_module.cli, ["--help"])
     alias_result = CliRunner().invoke(cli_module.cli, ["help"])
@@ -1779,6 +1828,10 @@ def test_expand_bare_bool_flags_rewrites_bare_forms_in_place(argv, expected):
         ("--no-cache=True",),
         ("--no-cache=False",),
         ("--no-cache=None",),
+        ("--skip-sha256=True",),
+        ("--skip-sha256=None",),
+        ("--timings=True",),
+        ("--timings=None",),
     ],
 )
 def test_install_command_accepts_every_supported_flag_form(extra_flag, tmp_path):
@@ -1798,6 +1851,33 @@ def test_install_command_accepts_every_supported_flag_form(extra_flag, tmp_path)
     )
 
 
+def test_timings_flag_prints_per_action_table_to_stderr(tmp_path):
+    proc = _run_abxpkg_cli(
+        f"--lib={tmp_path}",
+        "--binproviders=env",
+        "--timings",
+        "load",
+        "python3",
+    )
+
+    assert proc.returncode == 0, proc.stderr
+    assert "python3" in proc.stdout
+    assert "SUBPROCS" not in proc.stdout
+    table = proc.stderr[proc.stderr.index("ACTION") :].splitlines()
+    assert table[0].split() == [
+        "ACTION",
+        "PROVIDER",
+        "BINARY",
+        "SECONDS",
+        "SUBPROCS",
+        "CACHE",
+    ]
+    rows = [line.split() for line in table[1:]]
+    assert ["get_version", "env", "python3"] in [row[:3] for row in rows]
+    load_rows = [row for row in rows if row[:2] == ["load", "Binary"]]
+    assert load_rows and int(load_rows[0][4]) >= 1
+
+
 @pytest.mark.parametrize(
     "subcommand",
     ["install", "load"],
@@ -1,11 +1,35 @@
+import asyncio
+import hashlib
+import json
+import os
+import subprocess
 import sys
 import tempfile
+import time
 from pathlib import Path
 
 import pytest
 
-from abxpkg import Binary, EnvProvider, PipProvider, SemVer
-from abxpkg.config import load_derived_cache
+import abxpkg.base_types as base_types_module
+import abxpkg.binprovider as binprovider_module
+from abxpkg import (
+    Binary,
+    EnvProvider,
+    PATHEntries,
+    PipProvider,
+    SemVer,
+    add_exec_output_callback,
+    record_timings,
+    remove_exec_output_callback,
+)
+from abxpkg.base_types import UNKNOWN_SHA256, bin_abspath, bin_abspaths
+from abxpkg.config import (
+    DERIVED_CACHE_KEY,
+    load_derived_cache,
+    load_derived_cache_index,
+    load_dotenv_values,
+    write_dotenv_values,
+)
 from abxpkg.exceptions import BinaryUninstallError
 
 
@@ -158,6 +182,337 @@ class TestEnvProvider:
             assert load_derived_cache(derived_env_path) == {}
             assert provider.load("python3", no_cache=True) is not None
 
+    def test_derived_cache_appends_records_and_migrates_legacy_blob(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            install_root = Path(tmpdir) / "env"
+            provider = EnvProvider(
+                install_root=install_root,
+                postinstall_scripts=True,
+                min_release_age=0,
+            )
+            loaded = provider.load("python3")
+            assert loaded is not None
+            assert loaded.loaded_abspath is not None
+
+            derived_env_path = install_root / "derived.env"
+            cache = load_derived_cache(derived_env_path)
+            assert len(cache) == 1
+            assert DERIVED_CACHE_KEY not in load_dotenv_values(derived_env_path)
+
+            # rewrite the cache in the old single-JSON-blob format
+            write_dotenv_values(
+                derived_env_path,
+                {DERIVED_CACHE_KEY: json.dumps(cache)},
+            )
+            assert load_derived_cache(derived_env_path) == cache
+            assert provider.has_cached_binary("python3") is True
+
+            reloaded = provider.load("python3")
+            assert reloaded is not None
+            assert reloaded.loaded_abspath == loaded.loaded_abspath
+
+            # a cache write migrates the legacy blob to per-record lines
+            provider.invalidate_cache("python3")
+            assert load_derived_cache(derived_env_path) == {}
+            assert provider.load("python3") is not None
+            assert load_derived_cache(derived_env_path).keys() == cache.keys()
+            assert DERIVED_CACHE_KEY not in load_dotenv_values(derived_env_path)
+
+            # upserts append instead of rewriting the whole file
+            derived_env_text = derived_env_path.read_text()
+            assert provider.load("git") is not None
+            assert derived_env_path.read_text().startswith(derived_env_text)
+            assert len(load_derived_cache(derived_env_path)) == 2
+
+    def test_derived_cache_parse_is_memoized_until_the_file_changes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            install_root = Path(tmpdir) / "env"
+            provider = EnvProvider(
+                install_root=install_root,
+                postinstall_scripts=True,
+                min_release_age=0,
+            )
+            assert provider.load("python3") is not None
+            derived_env_path = install_root / "derived.env"
+
+            index = load_derived_cache_index(derived_env_path)
+            assert load_derived_cache_index(derived_env_path) is index
+
+            # appends (from this or another process) only parse the new tail
+            assert provider.load("git") is not None
+            assert load_derived_cache_index(derived_env_path) is index
+            assert len(index.records) == 2
+
+            # a rewrite replaces the file, which forces a fresh parse
+            write_dotenv_values(derived_env_path, load_dotenv_values(derived_env_path))
+            reparsed = load_derived_cache_index(derived_env_path)
+            assert reparsed is not index
+            assert reparsed.records == index.records
+
+    def test_cache_batch_buffers_derived_cache_writes_until_exit(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            install_root = Path(tmpdir) / "env"
+            provider = EnvProvider(
+                install_root=install_root,
+                postinstall_scripts=True,
+                min_release_age=0,
+            )
+            derived_env_path = install_root / "derived.env"
+
+            with provider.cache_batch():
+                assert provider.load("python3") is not None
+                with provider.cache_batch():
+                    assert provider.load("git") is not None
+                assert derived_env_path.read_text() == ""
+                # buffered records are still visible to readers in this process
+                assert len(load_derived_cache(derived_env_path)) == 2
+                assert provider.has_cached_binary("git") is True
+
+            assert derived_env_path.is_file()
+            assert len(derived_env_path.read_text().splitlines()) == 3
+            assert len(load_derived_cache(derived_env_path)) == 2
+
+    def test_derived_cache_writes_from_concurrent_processes_are_all_kept(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            derived_env_path = Path(tmpdir) / "derived.env"
+            # each writer rewrites its 10 keys repeatedly, so the journal is
+            # appended to and compacted by several processes at once
+            writer_script = (
+                "import json, sys\n"
+                "from pathlib import Path\n"
+                "from abxpkg.config import upsert_derived_cache_record\n"
+                "for i in range(100):\n"
+                "    cache_key = json.dumps(['env', f'{sys.argv[2]}-{i % 10}', '/bin/true'])\n"
+                "    upsert_derived_cache_record(Path(sys.argv[1]), cache_key, {'i': i})\n"
+            )
+            writers = [
+                subprocess.Popen(
+                    [
+                        sys.executable,
+                        "-c",
+                        writer_script,
+                        str(derived_env_path),
+                        f"writer{n}",
+                    ],
+                )
+                for n in range(4)
+            ]
+            for writer in writers:
+                assert writer.wait(timeout=60) == 0
+
+            cache = load_derived_cache(derived_env_path)
+            assert len(cache) == 4 * 10
+            assert {record["i"] for record in cache.values()} == set(range(90, 100))
+
+    def test_probe_cache_skips_version_probe_for_unchanged_binaries(
+        self,
+        monkeypatch,
+    ):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            probe_cache_path = tmpdir_path / "cache" / "probes.env"
+            monkeypatch.setattr(
+                binprovider_module, "PROBE_CACHE_PATH", probe_cache_path
+            )
+            bin_dir = tmpdir_path / "bin"
+            bin_dir.mkdir()
+            probe_log = tmpdir_path / "probes.log"
+            tool_path = bin_dir / "probe-tool"
+
+            def write_tool(version: str) -> None:
+                tool_path.write_text(
+                    f"#!/bin/sh\necho probe >> {probe_log}\necho 'probe-tool {version}'\n",
+                )
+                tool_path.chmod(0o755)
+
+            def load_tool():
+                provider = EnvProvider(
+                    install_root=None,
+                    PATH=str(bin_dir),
+                    probe_cache=True,
+                    postinstall_scripts=True,
+                    min_release_age=0,
+                )
+                return provider.load("probe-tool")
+
+            write_tool("1.2.3")
+            loaded = load_tool()
+            assert loaded is not None
+            assert loaded.loaded_version == SemVer("1.2.3")
+            assert probe_log.read_text().count("probe") == 1
+
+            # a fresh provider (e.g. a new process) reuses the persisted probe
+            reloaded = load_tool()
+            assert reloaded is not None
+            assert reloaded.loaded_version == SemVer("1.2.3")
+            assert reloaded.loaded_sha256 == loaded.loaded_sha256
+            assert probe_log.read_text().count("probe") == 1
+
+            # changing the binary invalidates the cached version and sha256
+            write_tool("1.2.40")
+            updated = load_tool()
+            assert updated is not None
+            assert updated.loaded_version == SemVer("1.2.40")
+            assert updated.loaded_sha256 != loaded.loaded_sha256
+            assert probe_log.read_text().count("probe") == 2
+
+    def test_version_probe_reuses_the_flag_that_worked_last_time(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            probe_log = tmpdir_path / "probes.log"
+            tool_path = tmpdir_path / "dash-tool"
+
+            def write_tool(version: str) -> None:
+                # like java/ffmpeg-style tools: only -version, printed to stderr
+                tool_path.write_text(
+                    "#!/bin/sh\n"
+                    f'echo "$1" >> {probe_log}\n'
+                    '[ "$1" = "-version" ] || exit 1\n'
+                    f"echo 'dash-tool version {version}' >&2\n",
+                )
+                tool_path.chmod(0o755)
+
+            def probe_version():
+                provider = EnvProvider(
+                    install_root=tmpdir_path / "env",
+                    PATH=str(tmpdir_path),
+                    postinstall_scripts=True,
+                    min_release_age=0,
+                )
+                return provider.get_version(
+                    "dash-tool",
+                    abspath=tool_path,
+                    no_cache=True,
+                )
+
+            (tmpdir_path / "env").mkdir()
+            write_tool("2.0.1")
+            assert probe_version() == SemVer("2.0.1")
+            assert probe_log.read_text().split() == ["--version", "-version"]
+
+            # a new process only has the flag persisted in derived.env
+            binprovider_module._VERSION_FLAGS.clear()
+            probe_log.write_text("")
+            with record_timings() as timings:
+                assert probe_version() == SemVer("2.0.1")
+            assert probe_log.read_text().split() == ["-version"]
+            assert timings[-1].subprocess_count == 1
+
+            # a replaced binary is probed from scratch again
+            write_tool("2.0.10")
+            probe_log.write_text("")
+            assert probe_version() == SemVer("2.0.10")
+            assert probe_log.read_text().split() == ["--version", "-version"]
+
+    def test_loaded_sha256_is_deferred_until_first_access(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            bin_dir = Path(tmpdir)
+            tool_path = bin_dir / "lazy-tool"
+            tool_path.write_text("#!/bin/sh\necho 'lazy-tool 1.0.0'\n")
+            tool_path.chmod(0o755)
+            expected_sha256 = hashlib.sha256(tool_path.read_bytes()).hexdigest()
+
+            provider = EnvProvider(
+                install_root=None,
+                PATH=str(bin_dir),
+                postinstall_scripts=True,
+                min_release_age=0,
+            )
+            loaded = Binary(name="lazy-tool", binproviders=[provider]).load()
+            assert loaded.sha256_deferred
+            assert "<deferred>" in repr(loaded)
+            deferred_copy = loaded.model_copy()
+            assert loaded.model_dump()["loaded_sha256"] == expected_sha256
+            assert not loaded.sha256_deferred
+            assert deferred_copy.sha256_deferred
+            assert deferred_copy == loaded
+            assert deferred_copy.model_dump() == loaded.model_dump()
+            assert loaded.sha256 == expected_sha256
+
+            # a binary that changed after load() is not hashed as if it were
+            # the version that was loaded
+            stale = provider.load("lazy-tool", no_cache=True)
+            assert stale is not None and stale.sha256_deferred
+            stat_result = tool_path.stat()
+            os.utime(
+                tool_path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1)
+            )
+            assert stale.loaded_sha256 == UNKNOWN_SHA256
+
+            skipped = EnvProvider(
+                install_root=None,
+                PATH=str(bin_dir),
+                skip_sha256=True,
+                postinstall_scripts=True,
+                min_release_age=0,
+            ).load("lazy-tool")
+            assert skipped is not None and not skipped.sha256_deferred
+            assert skipped.loaded_sha256 == UNKNOWN_SHA256
+
+    def test_record_timings_reports_subprocesses_and_cache_hits(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            bin_dir = Path(tmpdir)
+            tool_path = bin_dir / "timed-tool"
+            tool_path.write_text("#!/bin/sh\necho 'timed-tool 1.0.0'\n")
+            tool_path.chmod(0o755)
+
+            provider = EnvProvider(
+                install_root=bin_dir / "env",
+                PATH=str(bin_dir),
+                postinstall_scripts=True,
+                min_release_age=0,
+            )
+            with record_timings() as timings:
+                loaded = provider.load("timed-tool")
+            assert loaded is not None
+
+            by_action = {timing.action: timing for timing in timings}
+            assert set(by_action) == {"load", "get_abspath", "get_version", "exec"}
+            assert all(timing.owner == "env" for timing in timings)
+            assert by_action["load"].depth == 0
+            assert by_action["exec"].depth == 2
+            assert by_action["load"].subprocess_count == 1
+            assert by_action["load"].cache_hit is False
+            assert by_action["get_abspath"].cache_hit is False
+            assert by_action["load"].duration >= by_action["exec"].duration > 0
+
+            with record_timings() as timings:
+                provider.load("timed-tool")
+            assert [(timing.action, timing.cache_hit) for timing in timings] == [
+                ("get_abspath", True),
+                ("load", True),
+            ]
+            assert all(timing.subprocess_count == 0 for timing in timings)
+
+            with record_timings() as timings:
+                pass
+            provider.load("timed-tool", no_cache=True)
+            assert timings == []
+
+    def test_aload_timeout_kills_the_running_version_probe(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            bin_dir = Path(tmpdir)
+            pid_path = bin_dir / "probe.pid"
+            tool_path = bin_dir / "slow-tool"
+            tool_path.write_text(f"#!/bin/sh\necho $$ > {pid_path}\nexec sleep 30\n")
+            tool_path.chmod(0o755)
+            provider = EnvProvider(
+                install_root=None,
+                PATH=str(bin_dir),
+                version_timeout=60,
+                postinstall_scripts=True,
+                min_release_age=0,
+            )
+
+            started = time.monotonic()
+            with pytest.raises(TimeoutError):
+                asyncio.run(provider.aload("slow-tool", timeout=1))
+            assert time.monotonic() - started < 10
+
+            # the probe subprocess was killed, not left running in a thread
+            with pytest.raises(ProcessLookupError):
+                os.kill(int(pid_path.read_text()), 0)
+
     def test_provider_does_not_cache_binaries_managed_by_other_providers(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             lib_dir = Path(tmpdir)
@@ -188,3 +543,160 @@ class TestEnvProvider:
             assert env_provider.has_cached_binary("black") is False
 
             assert pip_provider.uninstall("black") is True
+
+    def test_PATH_lookups_reuse_one_dir_listing_until_the_dir_changes(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            bin_dir = Path(temp_dir) / "bin"
+            other_dir = Path(temp_dir) / "other"
+            bin_dir.mkdir()
+            other_dir.mkdir()
+            (other_dir / "tool").write_text("#!/bin/sh\n")
+            (other_dir / "tool").chmod(0o755)
+            (bin_dir / "script.py").write_text("print('hi')\n")
+            stale = time.time() - 60
+            os.utime(bin_dir, (stale, stale))
+            os.utime(other_dir, (stale, stale))
+            PATH = f"{bin_dir}:{other_dir}"
+
+            assert bin_abspath("tool", PATH=PATH) == other_dir / "tool"
+            assert bin_abspath("script.py", PATH=PATH) == bin_dir / "script.py"
+            assert bin_abspaths("missing", PATH=PATH) == []
+            assert base_types_module._PATH_DIR_ENTRIES[str(bin_dir)][1] == {
+                "script.py",
+            }
+
+            # adding a file bumps the dir mtime, so the next lookup rescans it
+            (bin_dir / "tool").write_text("#!/bin/sh\n")
+            (bin_dir / "tool").chmod(0o755)
+            assert bin_abspath("tool", PATH=PATH) == bin_dir / "tool"
+            assert bin_abspaths("tool", PATH=PATH) == [
+                bin_dir / "tool",
+                other_dir / "tool",
+            ]
+
+    def test_PATH_entries_match_whole_components_only(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            bin_dir = Path(temp_dir) / "bin"
+            bin2_dir = Path(temp_dir) / "bin2"
+            bin2_dir.mkdir()
+            (bin2_dir / "tool").write_text("#!/bin/sh\n")
+            (bin2_dir / "tool").chmod(0o755)
+
+            path_entries = PATHEntries(f"{bin2_dir}::/usr/bin")
+            assert str(bin_dir) not in path_entries
+            assert bin2_dir in path_entries
+            assert str(path_entries.prepend(bin_dir, "/usr/bin")) == (
+                f"{bin_dir}:/usr/bin:{bin2_dir}"
+            )
+            assert str(path_entries.append(bin2_dir, "/bin")) == (
+                f"{bin_dir}:/usr/bin:{bin2_dir}:/bin"
+            )
+
+            provider = EnvProvider(PATH=f"{bin2_dir}:{bin2_dir}")
+            assert provider.PATH == str(bin2_dir)
+            assert provider._merge_PATH(bin_dir, PATH=provider.PATH, prepend=True) == (
+                f"{bin_dir}:{bin2_dir}"
+            )
+            assert bin_abspath("tool", PATH=str(bin_dir)) is None
+
+    def test_exec_env_is_reused_until_os_environ_changes(self, monkeypatch):
+        provider = EnvProvider(postinstall_scripts=True, min_release_age=0)
+        build_calls = []
+        original_build_exec_env = binprovider_module.BinProvider.build_exec_env
+
+        def counting_build_exec_env(*args, **kwargs):
+            build_calls.append(kwargs.get("base_env"))
+            return original_build_exec_env(*args, **kwargs)
+
+        monkeypatch.setattr(
+            binprovider_module.BinProvider,
+            "build_exec_env",
+            staticmethod(counting_build_exec_env),
+        )
+        monkeypatch.setenv("ABXPKG_TEST_EXEC_ENV", "first")
+
+        echo_cmd = ["-c", "echo $ABXPKG_TEST_EXEC_ENV"]
+        assert provider.exec("sh", cmd=echo_cmd).stdout.strip() == "first"
+        assert provider.exec("sh", cmd=echo_cmd).stdout.strip() == "first"
+        assert len(build_calls) == 1
+
+        monkeypatch.setenv("ABXPKG_TEST_EXEC_ENV", "second")
+        assert provider.exec("sh", cmd=echo_cmd).stdout.strip() == "second"
+        assert len(build_calls) == 2
+
+        explicit_env = {**os.environ, "ABXPKG_TEST_EXEC_ENV": "explicit"}
+        proc = provider.exec("sh", cmd=echo_cmd, env=explicit_env)
+        assert proc.stdout.strip() == "explicit"
+        assert len(build_calls) == 3
+
+    def test_sudo_capability_is_probed_once_per_process(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            calls_file = Path(temp_dir) / "calls"
+            fake_sudo = Path(temp_dir) / "sudo"
+            fake_sudo.write_text(
+                "#!/bin/sh\n"
+                f"printf '%s\\n' \"$*\" >> {calls_file}\n"
+                "echo 'sudo: a password is required' >&2\n"
+                "exit 1\n",
+            )
+            fake_sudo.chmod(0o755)
+
+            for _ in range(2):
+                works, failure_output = binprovider_module.sudo_capability(
+                    str(fake_sudo),
+                    "nobody",
+                    dict(os.environ),
+                )
+                assert works is False
+                assert failure_output is not None
+                assert "a password is required" in failure_output
+
+            assert calls_file.read_text().splitlines() == ["-n -u nobody -- true"]
+
+    def test_lifecycle_exec_streams_output_and_keeps_only_the_tail(self):
+        provider = EnvProvider(postinstall_scripts=True, min_release_age=0)
+        streamed: list[tuple[str, str]] = []
+
+        def on_output(stream: str, line: str) -> None:
+            streamed.append((stream, line))
+
+        add_exec_output_callback(on_output)
+        token = binprovider_module.ACTIVE_EXEC_LOG_PREFIX.set("⛟  Installing test")
+        try:
+            proc = provider.exec(
+                "sh",
+                cmd=["-c", "seq 1 5; echo oops >&2"],
+                should_log_command=False,
+            )
+        finally:
+            binprovider_module.ACTIVE_EXEC_LOG_PREFIX.reset(token)
+            remove_exec_output_callback(on_output)
+
+        assert proc.returncode == 0
+        assert proc.stdout == "1\n2\n3\n4\n5\n"
+        assert proc.stderr == "oops\n"
+        assert [line for stream, line in streamed if stream == "stdout"] == [
+            "1",
+            "2",
+            "3",
+            "4",
+            "5",
+        ]
+        assert ("stderr", "oops") in streamed
+
+        proc = binprovider_module.run_subprocess_streaming(
+            ["sh", "-c", "seq 1 10"],
+            on_line=lambda stream, line: None,
+            max_lines=3,
+        )
+        assert proc.stdout == "[... 7 earlier lines omitted ...]\n8\n9\n10\n"
+
+        started_at = time.monotonic()
+        with pytest.raises(subprocess.TimeoutExpired) as exc_info:
+            binprovider_module.run_subprocess_streaming(
+                ["sh", "-c", "echo started; sleep 30"],
+                on_line=lambda stream, line: None,
+                stall_timeout=1,
+            )
+        assert time.monotonic() - started_at < 10
+        assert exc_info.value.output == "started\n"
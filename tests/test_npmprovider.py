@@ -3,7 +3,14 @@ from pathlib import Path
 
 import pytest
 
-from abxpkg import Binary, BrewProvider, EnvProvider, NpmProvider, SemVer
+from abxpkg import (
+    Binary,
+    BrewProvider,
+    EnvProvider,
+    NpmProvider,
+    SemVer,
+    record_timings,
+)
 
 
 class TestNpmProvider:
@@ -49,6 +56,40 @@ class TestNpmProvider:
             proc = installed.exec(cmd=("--version",), quiet=True)
             assert proc.returncode != 0
 
+    def test_version_and_abspath_read_installed_package_json_without_npm(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            Path(temp_dir).chmod(0o755)
+            install_root = Path(temp_dir) / "npm"
+            package_dir = install_root / "node_modules" / "@abx" / "fakepkg"
+            package_dir.mkdir(parents=True)
+            (package_dir / "package.json").write_text(
+                '{"name": "@abx/fakepkg", "version": "4.5.6",'
+                ' "bin": {"abxfake-cli": "cli.js"}}',
+            )
+            cli_js = package_dir / "cli.js"
+            cli_js.write_text("#!/bin/sh\necho 'no version here'\n")
+            cli_js.chmod(0o755)
+            bin_dir = install_root / "node_modules" / ".bin"
+            bin_dir.mkdir()
+            (bin_dir / "abxfake-cli").symlink_to(cli_js)
+
+            provider = NpmProvider(
+                install_root=install_root
+            ).get_provider_with_overrides(
+                overrides={"abxfake": {"install_args": ["@abx/fakepkg@^4"]}},
+            )
+            provider.INSTALLER_BINARY()
+            with record_timings() as timings:
+                abspath = provider.get_abspath("abxfake", no_cache=True)
+                assert abspath == bin_dir / "abxfake"
+                version = provider.get_version("abxfake", abspath=abspath)
+            assert version == SemVer("4.5.6")
+            # neither `npm show` (registry call) nor `npm list` is spawned
+            exec_bin_names = [
+                str(timing.bin_name) for timing in timings if timing.action == "exec"
+            ]
+            assert not any(name.endswith("/npm") for name in exec_bin_names)
+
     def test_install_root_alias_installs_into_the_requested_prefix(self, test_machine):
         with tempfile.TemporaryDirectory() as temp_dir:
             install_root = Path(temp_dir) / "npm-root"
@@ -1,16 +1,48 @@
+import logging
 import os
 import subprocess
 import tempfile
+import zipfile
 from pathlib import Path
 from typing import cast
 
 import pytest
 
-from abxpkg import Binary, PipProvider, SemVer
+from abxpkg import Binary, PipProvider, SemVer, record_timings
+from abxpkg.binprovider_pip import load_venv_index
 from abxpkg.config import load_derived_cache
 from abxpkg.exceptions import BinaryInstallError
 
 
+def build_console_script_wheel(
+    dist_dir: Path,
+    name: str,
+    version: str,
+    script_output: str | None = None,
+) -> Path:
+    """Build a minimal pure-python wheel exposing a ``name`` console script."""
+    dist_info = f"{name}-{version}.dist-info"
+    script_output = script_output or f"{name} {version}"
+    files = {
+        f"{name}/__init__.py": f"def main():\n    print('{script_output}')\n",
+        f"{dist_info}/METADATA": (
+            f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n"
+        ),
+        f"{dist_info}/WHEEL": (
+            "Wheel-Version: 1.0\nRoot-Is-Purelib: true\nTag: py3-none-any\n"
+        ),
+        f"{dist_info}/entry_points.txt": (f"[console_scripts]\n{name} = {name}:main\n"),
+    }
+    files[f"{dist_info}/RECORD"] = "".join(
+        f"{path},,\n" for path in [*files, f"{dist_info}/RECORD"]
+    )
+    wheel_path = dist_dir / f"{name}-{version}-py3-none-any.whl"
+    with zipfile.ZipFile(wheel_path, "w") as wheel:
+        for path, content in files.items():
+            wheel.writestr(path, content)
+    return wheel_path
+
+
 class TestPipProvider:
     def test_managed_venv_load_refreshes_provider_local_derived_cache(self):
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -86,6 +118,75 @@ class TestPipProvider:
                 installed.loaded_version,
             )
 
+    def test_install_many_merges_installs_into_one_pip_call(self, caplog):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dist_dir = Path(tmpdir) / "dist"
+            dist_dir.mkdir()
+            provider = PipProvider(
+                install_root=Path(tmpdir) / "venv",
+                postinstall_scripts=True,
+                min_release_age=0,
+            ).get_provider_with_overrides(
+                overrides={
+                    name: {
+                        "install_args": [
+                            str(build_console_script_wheel(dist_dir, name, "1.2.3")),
+                        ],
+                    }
+                    for name in ("abxbatcha", "abxbatchb")
+                },
+            )
+
+            with caplog.at_level(logging.INFO, logger="abxpkg.binprovider"):
+                installed = provider.install_many(["abxbatcha", "abxbatchb"])
+
+            assert [binary.name for binary in installed if binary] == [
+                "abxbatcha",
+                "abxbatchb",
+            ]
+            assert all(
+                binary and binary.loaded_version == SemVer("1.2.3")
+                for binary in installed
+            )
+            assert "Installing abxbatcha, abxbatchb via pip" in caplog.text
+            assert "Installing abxbatcha via pip" not in caplog.text
+
+    def test_install_many_falls_back_to_one_install_per_binary(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dist_dir = Path(tmpdir) / "dist"
+            dist_dir.mkdir()
+            provider = PipProvider(
+                install_root=Path(tmpdir) / "venv",
+                postinstall_scripts=True,
+                min_release_age=0,
+            ).get_provider_with_overrides(
+                overrides={
+                    "abxbatcha": {
+                        "install_args": [
+                            str(
+                                build_console_script_wheel(
+                                    dist_dir, "abxbatcha", "1.2.3"
+                                )
+                            ),
+                        ],
+                    },
+                    "abxbatchmissing": {
+                        "install_args": [
+                            str(dist_dir / "missing-0.0.1-py3-none-any.whl")
+                        ],
+                    },
+                },
+            )
+
+            # the merged call fails on the missing wheel, the good one still installs
+            installed = provider.install_many(
+                ["abxbatcha", "abxbatchmissing"],
+                quiet=True,
+            )
+            assert installed[0] is not None
+            assert installed[0].loaded_version == SemVer("1.2.3")
+            assert installed[1] is None
+
     def test_uninstall_removes_provider_local_derived_cache_entries(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             provider = PipProvider(
@@ -162,6 +263,128 @@ class TestPipProvider:
                 == metadata_version
             )
 
+    def test_version_and_abspath_read_venv_dist_info_without_pip_show(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dist_dir = Path(tmpdir) / "dist"
+            dist_dir.mkdir()
+            wheel = build_console_script_wheel(
+                dist_dir,
+                "abxnoversion",
+                "4.5.6",
+                script_output="no version here",
+            )
+            provider = PipProvider(
+                install_root=Path(tmpdir) / "venv",
+                postinstall_scripts=True,
+                min_release_age=0,
+            ).get_provider_with_overrides(
+                overrides={"abxnoversion": {"install_args": [str(wheel)]}},
+            )
+            installed = provider.install("abxnoversion")
+            assert installed is not None
+            assert installed.loaded_version == SemVer("4.5.6")
+
+            assert provider.install_root is not None
+            venv = provider.install_root / "venv"
+            venv_index = load_venv_index(venv)
+            assert venv_index is not None
+            assert load_venv_index(venv) is venv_index
+            assert venv_index.script_packages["abxnoversion"] == "abxnoversion"
+            assert venv_index.metadata_paths["abxnoversion"].name == "METADATA"
+
+            with record_timings() as timings:
+                version = provider.get_version("abxnoversion", no_cache=True)
+                abspath = provider.get_abspath("abxnoversion", no_cache=True)
+            assert version == SemVer("4.5.6")
+            assert abspath == installed.loaded_abspath
+            # only the `abxnoversion --version/-version/-v` probes run, no `pip show`
+            exec_bin_names = [
+                str(timing.bin_name) for timing in timings if timing.action == "exec"
+            ]
+            assert exec_bin_names
+            assert all(name.endswith("/abxnoversion") for name in exec_bin_names)
+
+            assert provider.uninstall("abxnoversion")
+            refreshed_index = load_venv_index(venv)
+            assert refreshed_index is not None and refreshed_index is not venv_index
+            assert "abxnoversion" not in refreshed_index.versions
+
+    def test_abspath_reads_venv_dist_info_by_install_arg_package_name(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dist_dir = Path(tmpdir) / "dist"
+            dist_dir.mkdir()
+            wheel = build_console_script_wheel(dist_dir, "abxdistpkg", "1.2.3")
+            provider = PipProvider(
+                install_root=Path(tmpdir) / "venv",
+                postinstall_scripts=True,
+                min_release_age=0,
+            )
+            installed = provider.get_provider_with_overrides(
+                overrides={"abxdistpkg": {"install_args": [str(wheel)]}},
+            ).install("abxdistpkg")
+            assert installed is not None
+
+            # a bin the distribution ships without listing it in its
+            # entry_points or RECORD, so only its install args tie it to the dist
+            assert provider.install_root is not None
+            alt_bin = provider.install_root / "venv" / "bin" / "abxaltbin"
+            alt_bin.write_text("#!/bin/sh\necho 'abxaltbin 1.2.3'\n")
+            alt_bin.chmod(0o755)
+
+            unresolved = PipProvider(
+                install_root=provider.install_root,
+                PATH="",
+                postinstall_scripts=True,
+                min_release_age=0,
+            )
+            assert unresolved.default_abspath_handler("abxaltbin") is None
+            by_package = unresolved.get_provider_with_overrides(
+                overrides={"abxaltbin": {"install_args": ["abxdistpkg"]}},
+            )
+            assert by_package.default_abspath_handler("abxaltbin") == alt_bin
+
+    def test_bin_index_tracks_installed_scripts_across_install_and_uninstall(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dist_dir = Path(tmpdir) / "dist"
+            dist_dir.mkdir()
+            wheel = build_console_script_wheel(dist_dir, "abxindexed", "7.8.9")
+            provider = PipProvider(
+                install_root=Path(tmpdir) / "venv",
+                postinstall_scripts=True,
+                min_release_age=0,
+            ).get_provider_with_overrides(
+                overrides={"abxindexed": {"install_args": [str(wheel)]}},
+            )
+            installed = provider.install("abxindexed")
+            assert installed is not None
+
+            entry = provider.lookup_bin_index("abxindexed")
+            assert entry == {
+                "package": "abxindexed",
+                "version": "7.8.9",
+                "abspath": str(provider.install_root / "venv" / "bin" / "abxindexed"),
+            }
+            assert provider._package_name_for_bin("abxindexed") == "abxindexed"
+            # persisted under install_root so other processes skip the rescan
+            assert provider.bin_index_path is not None
+            persisted = load_derived_cache(provider.bin_index_path)
+            assert entry in persisted.values()
+
+            # read-only lookups rescan a missing/stale index in memory only
+            provider.bin_index_path.unlink()
+            fresh_provider = PipProvider(
+                install_root=provider.install_root,
+                postinstall_scripts=True,
+                min_release_age=0,
+            )
+            assert fresh_provider.lookup_bin_index("abxindexed") == entry
+            assert fresh_provider.get_version("abxindexed") == SemVer("7.8.9")
+            assert not provider.bin_index_path.exists()
+
+            assert provider.uninstall("abxindexed")
+            assert provider.lookup_bin_index("abxindexed") is None
+            assert provider.bin_index_path.exists()
+
     def test_install_root_alias_installs_into_the_requested_venv(self, test_machine):
         with tempfile.TemporaryDirectory() as temp_dir:
             install_root = Path(temp_dir) / "pip-root"
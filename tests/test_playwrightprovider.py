@@ -1,11 +1,13 @@
 import os
 import shutil
 import tempfile
+import time
 from pathlib import Path
 
 import pytest
 
-from abxpkg import Binary, PlaywrightProvider
+from abxpkg import Binary, EnvProvider, PlaywrightProvider, record_timings
+from abxpkg.node_helper import NodeHelper
 
 
 @pytest.fixture(scope="module")
@@ -387,6 +389,73 @@ class TestPlaywrightProvider:
                 if child.is_dir()
             )
 
+    def test_browser_paths_are_resolved_for_all_browsers_in_one_node_round_trip(
+        self,
+        monkeypatch,
+    ):
+        monkeypatch.delenv("ABXPKG_LIB_DIR", raising=False)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            install_root = Path(temp_dir) / "playwright-root"
+            module_dir = install_root / "npm" / "node_modules" / "playwright"
+            module_dir.mkdir(parents=True)
+            (module_dir / "package.json").write_text(
+                '{"name": "playwright", "main": "index.js"}',
+            )
+            # stand-in for playwright's registry: executablePath() lives under
+            # PLAYWRIGHT_BROWSERS_PATH, which the provider points at install_root
+            (module_dir / "index.js").write_text(
+                "const path = require('path');\n"
+                "for (const name of ['chromium', 'firefox', 'webkit']) {\n"
+                "  exports[name] = {executablePath: () => path.join(\n"
+                "    process.env.PLAYWRIGHT_BROWSERS_PATH, `${name}-1234`, name)};\n"
+                "}\n",
+            )
+            for browser_name in ("chromium", "firefox"):
+                browser = install_root / f"{browser_name}-1234" / browser_name
+                browser.parent.mkdir()
+                browser.write_text("#!/bin/sh\n")
+                browser.chmod(0o755)
+
+            provider = PlaywrightProvider(install_root=install_root)
+            with record_timings() as timings:
+                chromium = provider.get_abspath("chromium")
+                firefox = provider.get_abspath("firefox")
+                webkit = provider.get_abspath("webkit")
+
+            assert chromium is not None and chromium.resolve() == (
+                install_root / "chromium-1234" / "chromium"
+            )
+            assert firefox is not None and firefox.resolve() == (
+                install_root / "firefox-1234" / "firefox"
+            )
+            assert webkit is None
+            subprocess_counts = {
+                timing.bin_name: timing.subprocess_count
+                for timing in timings
+                if timing.action == "get_abspath" and timing.depth == 0
+            }
+            assert subprocess_counts["chromium"] > 0
+            # answered from the same helper response, no node cold start
+            assert subprocess_counts["firefox"] == 0
+            assert subprocess_counts["webkit"] == 0
+
+    def test_node_helper_request_times_out_on_a_partial_response_line(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # a helper that starts answering, then hangs mid-line
+            fake_node = Path(temp_dir) / "node"
+            fake_node.write_text(
+                '#!/bin/sh\nread request\nprintf \'{"id": 1, "res\'\nsleep 30\n',
+            )
+            fake_node.chmod(0o755)
+            helper = NodeHelper.get(EnvProvider(), fake_node)
+            try:
+                started_at = time.monotonic()
+                assert helper.request("executablePaths", timeout=1) is None
+                assert time.monotonic() - started_at < 10
+                assert helper.proc is None
+            finally:
+                helper.close()
+
     def test_provider_dry_run_does_not_install_chromium(self, test_machine):
         test_machine.require_tool("node")
         test_machine.require_tool("npm")
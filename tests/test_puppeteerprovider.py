@@ -1,7 +1,7 @@
 import tempfile
 from pathlib import Path
 
-from abxpkg import Binary, PuppeteerProvider
+from abxpkg import Binary, PuppeteerProvider, record_timings
 
 
 PUPPETEER_CHROMEDRIVER_ARGS = ["chromedriver@stable"]
@@ -199,3 +199,47 @@ class TestPuppeteerProvider:
             )
 
             test_machine.exercise_binary_lifecycle(binary)
+
+    def test_installed_browsers_are_indexed_from_the_cache_dir_layout(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            Path(temp_dir).chmod(0o755)
+            puppeteer_root = Path(temp_dir) / "puppeteer-root"
+            provider = PuppeteerProvider(
+                install_root=puppeteer_root,
+                postinstall_scripts=True,
+                min_release_age=0,
+            )
+            assert provider.cache_dir is not None
+            for browser, build_id, relpath in (
+                ("chrome", "131.0.6778.85", "chrome-linux64/chrome"),
+                ("chrome", "120.0.6099.109", "chrome-linux64/chrome"),
+                (
+                    "chrome-headless-shell",
+                    "131.0.6778.85",
+                    "chrome-headless-shell-linux64/chrome-headless-shell",
+                ),
+            ):
+                executable = (
+                    provider.cache_dir / browser / f"linux-{build_id}" / relpath
+                )
+                executable.parent.mkdir(parents=True)
+                executable.write_text("#!/bin/sh\necho 131.0.6778.85\n")
+                executable.chmod(0o755)
+
+            with record_timings() as timings:
+                chrome = provider.get_abspath("chrome", no_cache=True)
+                headless_shell = provider.get_abspath(
+                    "chrome-headless-shell",
+                    no_cache=True,
+                )
+
+            assert chrome is not None and headless_shell is not None
+            assert chrome.resolve() == (
+                provider.cache_dir
+                / "chrome"
+                / "linux-131.0.6778.85"
+                / "chrome-linux64"
+                / "chrome"
+            )
+            assert headless_shell.resolve().name == "chrome-headless-shell"
+            assert sum(timing.subprocess_count for timing in timings) == 0